@@ -4,17 +4,25 @@ Uses DeepSeek AI to clean and validate all extracted data throughout the discove
 """
 
 import asyncio
+import hashlib
 import logging
 import os
-from typing import Dict, Any, List, Optional, Union
+import re
+import threading
+from urllib.parse import parse_qs, urlencode, urlsplit
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union
 from datetime import datetime
 
-from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIModel
-from pydantic_ai.providers.deepseek import DeepSeekProvider
 from pydantic import BaseModel, Field, validator
 
 from app.core.config import settings
+from app.core.dependencies import get_deepseek_provider
+from app.core.quota_manager import response_cache
+
+if TYPE_CHECKING:
+    # pydantic_ai is only imported once an agent is actually built
+    from pydantic_ai import Agent
+    from pydantic_ai.models.openai import OpenAIModel
 
 logger = logging.getLogger(__name__)
 
@@ -62,34 +70,7 @@ class CleanedPlatformData(BaseModel):
     data_quality_notes: str = Field(description="Notes on data quality and cleaning")
 
 
-class AIDataCleaner:
-    """DeepSeek-powered data cleaner for all extraction steps."""
-    
-    def __init__(self):
-        """Initialize the AI data cleaner with specialized agents."""
-        self.agents = {}
-        self._initialize_agents()
-    
-    def _initialize_agents(self):
-        """Initialize specialized cleaning agents for different data types."""
-        try:
-            if not settings.is_deepseek_configured():
-                logger.warning("⚠️ DeepSeek not configured - AI data cleaning unavailable")
-                return
-            
-            # Common model configuration
-            model = OpenAIModel(
-                'deepseek-chat',
-                provider=DeepSeekProvider(
-                    api_key=settings.DEEPSEEK_API_KEY
-                )
-            )
-            
-            # Artist name cleaning agent
-            self.agents['artist'] = Agent(
-                model=model,
-                result_type=CleanedArtistData,
-                system_prompt="""You are an expert at cleaning and validating artist names from YouTube video titles and metadata.
+_ARTIST_SYSTEM_PROMPT = """You are an expert at cleaning and validating artist names from YouTube video titles and metadata.
 
 Your tasks:
 1. Extract the PRIMARY artist name only (remove featured artists, collaborators)
@@ -107,13 +88,8 @@ Patterns to handle:
 - "Artist: Song [Official Video]" → "Artist"
 
 Be confident but honest about uncertainty."""
-            )
-            
-            # Social links cleaning agent
-            self.agents['social'] = Agent(
-                model=model,
-                result_type=CleanedSocialLinks,
-                system_prompt="""You are an expert at cleaning and validating social media links.
+
+_SOCIAL_SYSTEM_PROMPT = """You are an expert at cleaning and validating social media links.
 
 Your tasks:
 1. Validate URL formats and fix common issues
@@ -130,13 +106,8 @@ Red flags to watch for:
 - Links that don't match the claimed platform
 
 Only include high-confidence, valid links."""
-            )
-            
-            # Channel data cleaning agent  
-            self.agents['channel'] = Agent(
-                model=model,
-                result_type=CleanedChannelData,
-                system_prompt="""You are an expert at cleaning and validating YouTube channel data.
+
+_CHANNEL_SYSTEM_PROMPT = """You are an expert at cleaning and validating YouTube channel data.
 
 Your tasks:
 1. Clean channel names (remove extra formatting, fix capitalization)
@@ -152,13 +123,8 @@ Subscriber count validation:
 - Set 0 for unparseable counts
 
 Be conservative with validation - better to flag uncertain data."""
-            )
-            
-            # Platform data cleaning agent
-            self.agents['platform'] = Agent(
-                model=model,
-                result_type=CleanedPlatformData,
-                system_prompt="""You are an expert at cleaning data extracted from social media platforms.
+
+_PLATFORM_SYSTEM_PROMPT = """You are an expert at cleaning data extracted from social media platforms.
 
 Your tasks:
 1. Validate follower/subscriber counts and parse notation (K, M, B)
@@ -174,6 +140,306 @@ Data validation rules:
 - Verification indicators vary by platform
 
 Focus on data quality and realistic metrics."""
+
+_DEEPSEEK_MODEL = 'deepseek-chat'
+
+# Cleaned artist names are cached per (model, system prompt, title, raw name);
+# the same titles recur across scrapes and re-runs
+_ARTIST_PROMPT_HASH = hashlib.blake2b(_ARTIST_SYSTEM_PROMPT.encode(), digest_size=8).hexdigest()
+_ARTIST_CACHE_TTL = 24 * 3600
+
+
+def _artist_cache_params(title: str, raw_extracted_name: Optional[str]) -> Dict[str, str]:
+    """Response cache params for one artist cleaning input."""
+    digest = hashlib.blake2b(f"{title}\0{raw_extracted_name or ''}".encode(), digest_size=16).hexdigest()
+    return {'model': _DEEPSEEK_MODEL, 'system': _ARTIST_PROMPT_HASH, 'input': digest}
+
+# Regex fast path for the common "Artist [ft. X] - Song (Official ...)" title shape;
+# only confident matches skip the LLM
+_FAST_PATH_CONFIDENCE = 0.9
+_TITLE_SEPARATOR_RE = re.compile(r'\s+[-\u2013\u2014]\s+')
+_FEATURING_RE = re.compile(r'[(\[]?\s*\b(?:ft|feat|featuring)\b\.?\s+([^()\[\]]+)[)\]]?', re.IGNORECASE)
+_FEATURED_SPLIT_RE = re.compile(r'\s*(?:,|&|\band\b|\s+x\s+)\s*', re.IGNORECASE)
+_AMBIGUOUS_ARTIST_RE = re.compile(
+    r'[|:()\[\]"/]|\s(?:x|&|and|vs\.?|with)\s|,|\b(?:official|video|lyrics?|audio|remix|prod|cover|live|hd|4k)\b',
+    re.IGNORECASE
+)
+_HAS_LETTER_RE = re.compile(r'[^\W\d_]')
+
+# Common non-artist terms an extracted name must not be
+_INVALID_ARTIST_TERMS = frozenset([
+    'official', 'music', 'video', 'audio', 'lyric', 'lyrics',
+    'feat', 'featuring', 'ft', 'remix', 'cover', 'live',
+    'new', 'latest', 'best', 'top', 'album', 'single',
+    'song', 'track', 'ep', 'mixtape', 'full', 'hd', 'hq',
+    'youtube', 'vevo', 'records', 'entertainment'
+])
+
+
+def _extract_featured_artists(segment: str) -> tuple:
+    """Split a title segment into its text without the featuring clause and the featured names."""
+    match = _FEATURING_RE.search(segment)
+    if not match:
+        return segment.strip(), []
+    featured = [name.strip() for name in _FEATURED_SPLIT_RE.split(match.group(1)) if name.strip()]
+    return (segment[:match.start()] + segment[match.end():]).strip(), featured
+
+
+def _score_artist_name(name: str) -> float:
+    """Deterministic confidence that a regex-extracted name is a clean, single artist."""
+    if not name or not 1 < len(name) <= 50 or not _HAS_LETTER_RE.search(name):
+        return 0.0
+    if name.lower() in _INVALID_ARTIST_TERMS:
+        return 0.0
+    if _AMBIGUOUS_ARTIST_RE.search(name):
+        return 0.5
+    return 0.95
+
+
+def fast_clean_artist_name(title: str) -> Optional[CleanedArtistData]:
+    """
+    Clean an artist name without the LLM when the title has the common shape.
+    
+    Returns None for anything ambiguous (no or several separators, collaborations,
+    promotional text in the artist part) so the caller falls through to the LLM.
+    """
+    parts = _TITLE_SEPARATOR_RE.split(title.strip())
+    if len(parts) != 2:
+        return None
+    
+    artist_part, artist_featured = _extract_featured_artists(parts[0])
+    _, song_featured = _extract_featured_artists(parts[1])
+    confidence = _score_artist_name(artist_part)
+    if confidence <= _FAST_PATH_CONFIDENCE:
+        return None
+    
+    featured = artist_featured + song_featured
+    return CleanedArtistData.model_construct(
+        artist_name=artist_part,
+        confidence_score=confidence,
+        featured_artists=featured,
+        is_collaboration=bool(featured),
+        reasoning="Regex fast path: 'Artist - Song' title"
+    )
+
+# Channel/platform/social extractions are cached per (agent, prompt); the
+# crawled data behind a prompt changes faster than titles do
+_EXTRACTION_CACHE_TTL = 6 * 3600
+
+
+def _prompt_digest(prompt: str) -> str:
+    """Short stable digest of a prompt for response cache keys."""
+    return hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+# Longest field value sent in a channel/platform prompt; counts and handles sit
+# well inside this, and long bios/descriptions only add tokens
+_PROMPT_FIELD_MAX_CHARS = 500
+
+
+def _format_prompt_fields(raw_data: Dict[str, Any]) -> str:
+    """One compact 'key: value' line per non-empty field, long values truncated."""
+    return "\n".join(
+        f"{key}: {str(value)[:_PROMPT_FIELD_MAX_CHARS]}" for key, value in raw_data.items() if value
+    )
+
+# Batched artist cleaning: cap titles per request and keep the packed titles
+# well inside the context window (rough 4 chars/token estimate)
+_ARTIST_BATCH_MAX_TITLES = 20
+_ARTIST_BATCH_TOKEN_BUDGET = 2000
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheap token estimate for budgeting batch prompts."""
+    return len(text) // 4 + 1
+
+
+# Hosts each social platform's profile links must live on
+_SOCIAL_PLATFORM_DOMAINS = {
+    'instagram': ('instagram.com',),
+    'tiktok': ('tiktok.com',),
+    'spotify': ('spotify.com',),
+    'twitter': ('twitter.com', 'x.com'),
+    'facebook': ('facebook.com', 'fb.com'),
+    'youtube': ('youtube.com', 'youtu.be'),
+}
+_SOCIAL_LINK_FIELDS = (*_SOCIAL_PLATFORM_DOMAINS, 'website')
+
+# Registered domain -> platform, for an O(1) host lookup
+_PLATFORM_BY_DOMAIN = {
+    domain: platform
+    for platform, domains in _SOCIAL_PLATFORM_DOMAINS.items()
+    for domain in domains
+}
+
+# First path segments that point at platform pages rather than a profile
+_GENERIC_PROFILE_PATHS = {
+    'login', 'signup', 'home', 'explore', 'accounts', 'about', 'privacy',
+    'terms', 'help', 'search', 'share', 'intent', 'hashtag', 'discover'
+}
+
+# Path prefix a profile ID follows, per platform; the others keep their profile
+# in the first path segment (instagram.com/<username>)
+_PROFILE_PATH_PREFIXES = {
+    'spotify': ('artist/',),
+    'tiktok': ('@',),
+    'youtube': ('@', 'channel/', 'c/', 'user/'),
+}
+
+# First path segments of posts and other non-profile pages, per platform
+_NON_PROFILE_SEGMENTS = {
+    'instagram': {'p', 'reel', 'reels', 'stories', 'tv', 'direct'},
+    'twitter': {'i', 'status', 'messages', 'notifications', 'settings'},
+    'facebook': {'watch', 'groups', 'events', 'sharer', 'sharer.php', 'photo.php', 'story.php', 'permalink.php'},
+}
+
+# Profile pages identified by a query parameter rather than the path
+_PROFILE_ID_PARAMS = {
+    ('facebook', 'profile.php'): 'id',
+}
+
+
+def _platform_for_host(host: str) -> Optional[str]:
+    """Social platform a host belongs to (the domain itself or any subdomain of it)."""
+    # Walk parent domains, so a.b.instagram.com resolves like instagram.com
+    while True:
+        platform = _PLATFORM_BY_DOMAIN.get(host)
+        if platform is not None or '.' not in host:
+            return platform
+        host = host.split('.', 1)[1]
+
+
+def validate_social_url(platform: str, url: str) -> Optional[str]:
+    """
+    Deterministically validate and normalize a social link.
+    
+    Returns the cleaned profile URL (https, no fragment or trailing slash, no
+    query except a profile ID parameter such as facebook's profile.php?id=) or
+    None when the link is malformed, on the wrong host, or not a profile page.
+    """
+    if not url:
+        return None
+    
+    url = url.strip()
+    if not url.startswith(('http://', 'https://')):
+        url = f"https://{url}"
+    
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return None
+    
+    host = (parts.hostname or '').lower()
+    if '.' not in host:
+        return None
+    
+    host_platform = _platform_for_host(host)
+    if platform == 'website':
+        if host_platform is not None:
+            return None
+        return f"https://{parts.netloc}{parts.path}".rstrip('/')
+    
+    if host_platform != platform:
+        return None
+    
+    path = parts.path.strip('/')
+    id_param = _PROFILE_ID_PARAMS.get((platform, path.lower()))
+    if id_param:
+        profile_id = parse_qs(parts.query).get(id_param, [''])[0].strip()
+        if not profile_id:
+            return None
+        return f"https://{parts.netloc}/{path}?{urlencode({id_param: profile_id})}"
+    
+    # Keep only the profile part of the path, e.g. /@handle of /@handle/videos
+    lowered = path.lower()
+    prefixes = _PROFILE_PATH_PREFIXES.get(platform, ('',))
+    prefix = next((prefix for prefix in prefixes if lowered.startswith(prefix)), None)
+    if prefix is None:
+        return None
+    
+    profile_id = path[len(prefix):].split('/', 1)[0]
+    handle = profile_id.lstrip('@').lower()
+    if not handle or handle in _GENERIC_PROFILE_PATHS or handle in _NON_PROFILE_SEGMENTS.get(platform, ()):
+        return None
+    
+    return f"https://{parts.netloc}/{path[:len(prefix)]}{profile_id}"
+
+
+# Configured agents shared by every AIDataCleaner instance, keyed by
+# (model, result type, system prompt); building one generates the result schema
+_AGENT_CACHE: Dict[str, "Agent"] = {}
+_deepseek_model: Optional["OpenAIModel"] = None
+
+
+def _get_or_build_agent(result_type: Any, system_prompt: str) -> "Agent":
+    """Return the shared agent for this result type and system prompt, building it once."""
+    global _deepseek_model
+    key = hashlib.blake2b(
+        f"{_DEEPSEEK_MODEL}\0{result_type!r}\0{system_prompt}".encode(), digest_size=16
+    ).hexdigest()
+    
+    agent = _AGENT_CACHE.get(key)
+    if agent is None:
+        from pydantic_ai import Agent
+        from pydantic_ai.models.openai import OpenAIModel
+        
+        if _deepseek_model is None:
+            _deepseek_model = OpenAIModel(
+                _DEEPSEEK_MODEL,
+                provider=get_deepseek_provider()
+            )
+        agent = Agent(
+            model=_deepseek_model,
+            result_type=result_type,
+            system_prompt=system_prompt
+        )
+        _AGENT_CACHE[key] = agent
+    return agent
+
+
+class AIDataCleaner:
+    """DeepSeek-powered data cleaner for all extraction steps."""
+    
+    def __init__(self):
+        """Initialize the AI data cleaner with specialized agents."""
+        self.agents = {}
+        self._initialize_agents()
+    
+    def _initialize_agents(self):
+        """Initialize specialized cleaning agents for different data types."""
+        try:
+            if not settings.is_deepseek_configured():
+                logger.warning("⚠️ DeepSeek not configured - AI data cleaning unavailable")
+                return
+            
+            # Artist name cleaning agent
+            self.agents['artist'] = _get_or_build_agent(
+                result_type=CleanedArtistData,
+                system_prompt=_ARTIST_SYSTEM_PROMPT
+            )
+            
+            # Batched artist cleaning shares the exact system prompt so the
+            # provider's prompt-prefix cache is hit across both agents
+            self.agents['artist_batch'] = _get_or_build_agent(
+                result_type=List[CleanedArtistData],
+                system_prompt=_ARTIST_SYSTEM_PROMPT
+            )
+            
+            # Social links cleaning agent
+            self.agents['social'] = _get_or_build_agent(
+                result_type=CleanedSocialLinks,
+                system_prompt=_SOCIAL_SYSTEM_PROMPT
+            )
+            
+            # Channel data cleaning agent  
+            self.agents['channel'] = _get_or_build_agent(
+                result_type=CleanedChannelData,
+                system_prompt=_CHANNEL_SYSTEM_PROMPT
+            )
+            
+            # Platform data cleaning agent
+            self.agents['platform'] = _get_or_build_agent(
+                result_type=CleanedPlatformData,
+                system_prompt=_PLATFORM_SYSTEM_PROMPT
             )
             
             logger.info("✅ AI Data Cleaner initialized with all specialized agents")
@@ -193,8 +459,17 @@ Focus on data quality and realistic metrics."""
         Returns:
             Cleaned artist data or None if cleaning fails
         """
+        fast = fast_clean_artist_name(title)
+        if fast is not None:
+            return fast
+        
         if 'artist' not in self.agents:
             return None
+        
+        cache_params = _artist_cache_params(title, raw_extracted_name)
+        cached = await response_cache.get('deepseek', 'clean_artist_name', cache_params)
+        if cached is not None:
+            return cached
             
         try:
             prompt = f"""Clean the artist name from this YouTube video title:
@@ -213,6 +488,7 @@ Return the clean primary artist name with confidence score."""
                 self.agents['artist'].run(prompt),
                 timeout=10.0
             )
+            await response_cache.set('deepseek', 'clean_artist_name', cache_params, result.data, ttl=_ARTIST_CACHE_TTL)
             
             if result.data.confidence_score >= 0.7:
                 logger.info(f"🤖 AI cleaned artist: '{result.data.artist_name}' (confidence: {result.data.confidence_score:.2f})")
@@ -225,17 +501,145 @@ Return the clean primary artist name with confidence score."""
             logger.error(f"❌ Artist name cleaning failed: {e}")
             return None
     
-    async def clean_social_links(self, raw_links: Dict[str, str]) -> Optional[CleanedSocialLinks]:
+    async def clean_artist_names_batch(
+        self,
+        titles: List[str],
+        raw_extracted_names: Optional[List[Optional[str]]] = None
+    ) -> List[Optional[CleanedArtistData]]:
         """
-        Clean and validate social media links using AI.
+        Clean artist names for many video titles, packing several titles per request.
+        
+        Args:
+            titles: Original video titles
+            raw_extracted_names: Previously extracted names, aligned with titles
+            
+        Returns:
+            Cleaned artist data per title (None where cleaning failed), in input order
+        """
+        if not titles:
+            return []
+        
+        results: List[Optional[CleanedArtistData]] = [fast_clean_artist_name(title) for title in titles]
+        if 'artist_batch' not in self.agents:
+            return results
+        
+        raw_extracted_names = raw_extracted_names or [None] * len(titles)
+        
+        # Split uncached titles into chunks bounded by title count and estimated prompt tokens
+        chunks = []
+        current, current_tokens = [], 0
+        for index, (title, raw_name) in enumerate(zip(titles, raw_extracted_names)):
+            if results[index] is not None:
+                continue
+            cached = await response_cache.get('deepseek', 'clean_artist_name', _artist_cache_params(title, raw_name))
+            if cached is not None:
+                results[index] = cached
+                continue
+            
+            line = f'Title: "{title}"' + (f' | Previously extracted: "{raw_name}"' if raw_name else '')
+            line_tokens = _estimate_tokens(line)
+            if current and (len(current) >= _ARTIST_BATCH_MAX_TITLES or
+                            current_tokens + line_tokens > _ARTIST_BATCH_TOKEN_BUDGET):
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append((index, line))
+            current_tokens += line_tokens
+        if current:
+            chunks.append(current)
+        
+        chunk_results = await asyncio.gather(
+            *(self._clean_artist_chunk(chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+        
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            if isinstance(chunk_result, list) and len(chunk_result) == len(chunk):
+                for (index, _), cleaned in zip(chunk, chunk_result):
+                    results[index] = cleaned
+                    await response_cache.set(
+                        'deepseek', 'clean_artist_name',
+                        _artist_cache_params(titles[index], raw_extracted_names[index]),
+                        cleaned, ttl=_ARTIST_CACHE_TTL
+                    )
+                continue
+            
+            # Misaligned or failed batch: fall back to one request per title
+            logger.warning(f"⚠️ Batch artist cleaning failed for {len(chunk)} titles, retrying individually")
+            singles = await asyncio.gather(
+                *(self.clean_artist_name(titles[index], raw_extracted_names[index]) for index, _ in chunk)
+            )
+            for (index, _), cleaned in zip(chunk, singles):
+                results[index] = cleaned
+        
+        cleaned_count = sum(1 for r in results if r is not None)
+        logger.info(f"🤖 AI batch cleaned {cleaned_count}/{len(titles)} artists in {len(chunks)} requests")
+        return results
+    
+    async def _clean_artist_chunk(self, chunk: List[tuple]) -> List[CleanedArtistData]:
+        """Run one batched artist cleaning request for numbered title lines."""
+        numbered = "\n".join(f"{i}. {line}" for i, (_, line) in enumerate(chunk, 1))
+        prompt = f"""Clean the artist name from each of these YouTube video titles:
+
+{numbered}
+
+Return a JSON array with exactly one entry per title, in the same order, each with the clean primary artist name and confidence score."""
+        
+        result = await asyncio.wait_for(
+            self.agents['artist_batch'].run(prompt),
+            timeout=10.0 + len(chunk)
+        )
+        return result.data
+    
+    async def _run_agent_cached(self, agent_name: str, prompt: str, timeout: float = 10.0) -> Any:
+        """Run one agent, serving repeats of the exact same prompt from the response cache."""
+        cache_params = {'model': _DEEPSEEK_MODEL, 'agent': agent_name, 'input': _prompt_digest(prompt)}
+        cached = await response_cache.get('deepseek', 'extraction', cache_params)
+        if cached is not None:
+            return cached
+        
+        result = await asyncio.wait_for(self.agents[agent_name].run(prompt), timeout=timeout)
+        await response_cache.set('deepseek', 'extraction', cache_params, result.data, ttl=_EXTRACTION_CACHE_TTL)
+        return result.data
+    
+    async def clean_social_links(
+        self,
+        raw_links: Dict[str, str],
+        llm_reasoning: bool = False
+    ) -> Optional[CleanedSocialLinks]:
+        """
+        Clean and validate social media links.
+        
+        URL validation is deterministic, so by default links are checked locally
+        without a DeepSeek round-trip; pass llm_reasoning=True for the AI path.
         
         Args:
             raw_links: Dictionary of platform -> URL mappings
+            llm_reasoning: Ask the AI agent instead of validating locally
             
         Returns:
             Cleaned social links or None if cleaning fails
         """
-        if 'social' not in self.agents or not raw_links:
+        if not raw_links:
+            return None
+        
+        if not llm_reasoning:
+            cleaned = {
+                platform: validate_social_url(platform, url)
+                for platform, url in raw_links.items()
+                if platform in _SOCIAL_LINK_FIELDS
+            }
+            kept = {platform: url for platform, url in cleaned.items() if url}
+            dropped = sorted(platform for platform, url in cleaned.items() if not url)
+            
+            # Every field is already normalized above, so skip a validation round-trip
+            logger.info(f"🔗 Validated {len(kept)}/{len(raw_links)} social links locally")
+            return CleanedSocialLinks.model_construct(
+                **{platform: kept.get(platform) for platform in _SOCIAL_LINK_FIELDS},
+                confidence_score=0.9,
+                validation_notes=f"Validated locally; dropped: {', '.join(dropped)}" if dropped else "Validated locally"
+            )
+        
+        if 'social' not in self.agents:
             return None
             
         try:
@@ -248,13 +652,10 @@ Return the clean primary artist name with confidence score."""
 Validate URLs, fix formatting issues, and ensure they point to legitimate artist profiles.
 Remove any suspicious or invalid links."""
 
-            result = await asyncio.wait_for(
-                self.agents['social'].run(prompt),
-                timeout=10.0
-            )
+            cleaned = await self._run_agent_cached('social', prompt)
             
-            logger.info(f"🔗 AI cleaned {len([l for l in [result.data.instagram, result.data.tiktok, result.data.spotify, result.data.twitter, result.data.facebook] if l])} social links")
-            return result.data
+            logger.info(f"🔗 AI cleaned {len([l for l in [cleaned.instagram, cleaned.tiktok, cleaned.spotify, cleaned.twitter, cleaned.facebook] if l])} social links")
+            return cleaned
                 
         except Exception as e:
             logger.error(f"❌ Social links cleaning failed: {e}")
@@ -274,7 +675,7 @@ Remove any suspicious or invalid links."""
             return None
             
         try:
-            data_text = "\n".join([f"{key}: {value}" for key, value in raw_data.items() if value])
+            data_text = _format_prompt_fields(raw_data)
             
             prompt = f"""Clean and validate this YouTube channel data:
 
@@ -282,13 +683,10 @@ Remove any suspicious or invalid links."""
 
 Parse subscriber counts, clean channel names, validate descriptions, and identify verification status."""
 
-            result = await asyncio.wait_for(
-                self.agents['channel'].run(prompt),
-                timeout=10.0
-            )
+            cleaned = await self._run_agent_cached('channel', prompt)
             
-            logger.info(f"📺 AI cleaned channel data: {result.data.channel_name} ({result.data.subscriber_count:,} subscribers)")
-            return result.data
+            logger.info(f"📺 AI cleaned channel data: {cleaned.channel_name} ({cleaned.subscriber_count:,} subscribers)")
+            return cleaned
                 
         except Exception as e:
             logger.error(f"❌ Channel data cleaning failed: {e}")
@@ -309,7 +707,7 @@ Parse subscriber counts, clean channel names, validate descriptions, and identif
             return None
             
         try:
-            data_text = "\n".join([f"{key}: {value}" for key, value in raw_data.items() if value])
+            data_text = _format_prompt_fields(raw_data)
             
             prompt = f"""Clean and validate this {platform} data:
 
@@ -317,14 +715,11 @@ Parse subscriber counts, clean channel names, validate descriptions, and identif
 
 Parse follower counts, clean bio text, extract engagement metrics, and validate data quality."""
 
-            result = await asyncio.wait_for(
-                self.agents['platform'].run(prompt),
-                timeout=10.0
-            )
+            cleaned = await self._run_agent_cached('platform', prompt)
             
-            result.data.platform = platform
-            logger.info(f"📱 AI cleaned {platform} data: {result.data.follower_count or 'N/A'} followers")
-            return result.data
+            cleaned.platform = platform
+            logger.info(f"📱 AI cleaned {platform} data: {cleaned.follower_count or 'N/A'} followers")
+            return cleaned
                 
         except Exception as e:
             logger.error(f"❌ Platform data cleaning failed for {platform}: {e}")
@@ -342,6 +737,7 @@ Parse follower counts, clean bio text, extract engagement metrics, and validate
             "agents_loaded": list(self.agents.keys()),
             "capabilities": [
                 "Artist name extraction and cleaning",
+                "Batched artist cleaning (many titles per request)",
                 "Social media link validation", 
                 "YouTube channel data cleaning",
                 "Platform data validation and parsing",
@@ -352,11 +748,23 @@ Parse follower counts, clean bio text, extract engagement metrics, and validate
 
 # Global instance for reuse
 _ai_cleaner: Optional[AIDataCleaner] = None
+_ai_cleaner_lock = threading.Lock()
 
 
 def get_ai_cleaner() -> AIDataCleaner:
     """Get or create the global AI data cleaner instance."""
     global _ai_cleaner
     if _ai_cleaner is None:
-        _ai_cleaner = AIDataCleaner()
-    return _ai_cleaner
\ No newline at end of file
+        with _ai_cleaner_lock:
+            if _ai_cleaner is None:
+                _ai_cleaner = AIDataCleaner()
+    return _ai_cleaner
+
+
+def reset_ai_cleaner():
+    """Drop the global cleaner and the cached DeepSeek model and agents behind it."""
+    global _ai_cleaner, _deepseek_model
+    with _ai_cleaner_lock:
+        _ai_cleaner = None
+    _AGENT_CACHE.clear()
+    _deepseek_model = None
\ No newline at end of file
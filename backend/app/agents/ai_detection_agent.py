@@ -5,7 +5,6 @@ This agent analyzes artist data to detect and filter out AI-generated music cont
 """
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
-from pydantic_ai.providers.deepseek import DeepSeekProvider
 from pydantic import BaseModel, Field
 from typing import Dict, Any, List, Optional, Tuple
 import logging
@@ -13,7 +12,7 @@ import re
 from datetime import datetime
 
 from app.core.config import settings
-from app.core.dependencies import PipelineDependencies
+from app.core.dependencies import PipelineDependencies, get_deepseek_provider
 from app.models.artist import ArtistProfile
 
 logger = logging.getLogger(__name__)
@@ -74,7 +73,7 @@ class AIGeneratedMusicDetector:
         try:
             if settings.is_deepseek_configured():
                 self._agent = Agent(
-                    model=OpenAIModel('deepseek-chat', provider=DeepSeekProvider()),
+                    model=OpenAIModel('deepseek-chat', provider=get_deepseek_provider()),
                     system_prompt="""You are an expert at detecting AI-generated music content.
                     
                     Your task is to analyze artist descriptions, video titles, channel information,
@@ -12,18 +12,66 @@ import json
 import logging
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from itertools import islice
 import re
 from urllib.parse import urlparse, parse_qs, unquote
 
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
 from crawl4ai.extraction_strategy import JsonCssExtractionStrategy
 
+from app.core.config import settings
+from app.agents.crawl4ai_youtube_agent import HTML_ONLY_CONFIG
+
 logger = logging.getLogger(__name__)
 
+# Domain substring -> platform, matched in one pass by a single alternation
+_SOCIAL_LINK_DOMAINS = {
+    'instagram.com': 'instagram',
+    'tiktok.com': 'tiktok',
+    'spotify.com': 'spotify',
+    'twitter.com': 'twitter',
+    'x.com': 'twitter',
+    'facebook.com': 'facebook',
+}
+_SOCIAL_LINK_DOMAIN_RE = re.compile('|'.join(map(re.escape, _SOCIAL_LINK_DOMAINS)), re.IGNORECASE)
+_YOUTUBE_DOMAIN_RE = re.compile(r'youtube\.com|youtu\.be', re.IGNORECASE)
+
+# Contact details and profile handles on an artist's own website
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_WEBSITE_SOCIAL_PATTERNS = {
+    platform: re.compile(pattern, re.IGNORECASE) for platform, pattern in {
+        'instagram': r'instagram\.com/([A-Za-z0-9_.]+)',
+        'tiktok': r'tiktok\.com/@([A-Za-z0-9_.]+)',
+        'spotify': r'open\.spotify\.com/artist/([A-Za-z0-9]+)',
+        'twitter': r'(?:twitter\.com|x\.com)/([A-Za-z0-9_]+)',
+        'youtube': r'youtube\.com/(?:c/|channel/|@)([A-Za-z0-9_-]+)'
+    }.items()
+}
+_WEBSITE_BIO_RE = re.compile(r'(?:about|bio|biography)[\s\S]{0,100}?([A-Z][^.!?]{50,500}[.!?])', re.IGNORECASE)
+_MAX_WEBSITE_EMAILS = 3
+
+# Artist name normalization for social media searches
+_SEARCH_NAME_SUFFIX_RE = re.compile(r'\s*(Official|Music|VEVO|Channel|Artist).*$', re.IGNORECASE)
+_SEARCH_NAME_SPECIAL_CHARS_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+
+def _iter_unique_emails(text: str):
+    """Yield distinct email addresses in page order, scanning only as far as the caller reads."""
+    seen = set()
+    for match in _EMAIL_RE.finditer(text):
+        email = match.group(0)
+        if email not in seen:
+            seen.add(email)
+            yield email
+
 
 class Crawl4AIAgent:
     """Agent for web crawling using Crawl4AI"""
     
+    # Caps in-flight pages across all instances; callers may gather freely
+    # since every page load goes through _arun
+    _crawl_semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_CRAWLS)
+    
     def __init__(self):
         """Initialize the Crawl4AI agent"""
         self.browser_config = BrowserConfig(
@@ -37,8 +85,48 @@ class Crawl4AIAgent:
                 "--disable-blink-features=AutomationControlled"
             ]
         )
+        # Long-lived browser shared by every crawl; launched on first use
+        self._crawler: Optional[AsyncWebCrawler] = None
+        self._crawler_lock = asyncio.Lock()
         logger.info("✅ Crawl4AI Agent initialized")
     
+    async def _get_crawler(self) -> AsyncWebCrawler:
+        """Return the shared crawler, starting the browser on first use"""
+        if self._crawler is None:
+            async with self._crawler_lock:
+                if self._crawler is None:
+                    crawler = AsyncWebCrawler(config=self.browser_config)
+                    await crawler.__aenter__()
+                    self._crawler = crawler
+        return self._crawler
+    
+    async def _arun(self, url: str, config: CrawlerRunConfig):
+        """Crawl one page on the shared browser within the global concurrency limit"""
+        crawler = await self._get_crawler()
+        async with Crawl4AIAgent._crawl_semaphore:
+            return await crawler.arun(url=url, config=config)
+    
+    async def warmup(self):
+        """Start the shared browser and open one blank page so the first crawl skips the cold start"""
+        try:
+            config = CrawlerRunConfig(
+                cache_mode=CacheMode.BYPASS,
+                screenshot=False,
+                pdf=False,
+                wait_for_images=False
+            )
+            await self._arun("raw:<html><body></body></html>", config)
+            logger.info("🔥 Crawl4AI Agent browser warmed up")
+        except Exception as e:
+            logger.warning(f"⚠️ Crawl4AI browser warmup failed: {e}")
+    
+    async def aclose(self):
+        """Close the shared browser, if one was started"""
+        crawler, self._crawler = self._crawler, None
+        if crawler is not None:
+            await crawler.__aexit__(None, None, None)
+            logger.info("🔒 Crawl4AI Agent browser closed")
+    
     async def discover_artist_social_profiles(
         self,
         artist_name: str,
@@ -75,19 +163,18 @@ class Crawl4AIAgent:
         # Clean artist name for searches
         clean_name = self._clean_artist_name_for_search(artist_name)
         
-        # Step 1: Extract YouTube channel from video URL (mandatory)
-        logger.info(f"📺 Step 1: Extracting YouTube channel from video URL")
-        channel_url = await self.extract_channel_from_video(youtube_video_url)
+        # Steps 1-2: Extract YouTube channel (mandatory) and video description links
+        # (priority source); both come from the same video page, so load it once
+        logger.info(f"📺 Steps 1-2: Extracting YouTube channel and description links from video")
+        video_html = await self._fetch_video_page(youtube_video_url)
+        channel_url = self._channel_url_from_video_html(video_html) if video_html else None
+        video_links = self._description_links_from_video_html(video_html) if video_html else {}
         if channel_url:
             results["youtube_channel"] = channel_url
             logger.info(f"✅ Extracted channel: {channel_url}")
         else:
             logger.warning(f"⚠️ Failed to extract channel from video: {youtube_video_url}")
         
-        # Step 2: Extract links from video description (priority source)
-        logger.info(f"📺 Step 2: Extracting links from video description")
-        video_links = await self._extract_video_description_links(youtube_video_url)
-        
         # Step 3: Extract links from channel (if available)
         channel_links = {}
         if channel_url:
@@ -171,139 +258,162 @@ class Crawl4AIAgent:
         try:
             logger.info(f"🔍 Extracting channel from video: {video_url}")
             
-            async with AsyncWebCrawler(config=self.browser_config) as crawler:
-                result = await crawler.arun(
-                    url=video_url,
-                    config=CrawlerRunConfig(
-                        cache_mode=CacheMode.BYPASS,
-                        wait_until="domcontentloaded",
-                        page_timeout=15000,
-                        delay_before_return_html=2.0,
-                        js_code="""
-                        // Wait for page load
-                        await new Promise(resolve => setTimeout(resolve, 2000));
-                        console.log('Video page loaded for channel extraction');
-                        """
-                    )
+            result = await self._arun(
+                url=video_url,
+                config=CrawlerRunConfig(
+                    **HTML_ONLY_CONFIG,
+                    cache_mode=CacheMode.BYPASS,
+                    wait_until="domcontentloaded",
+                    page_timeout=15000,
+                    # channelId and the channel links are in the server-rendered
+                    # document, so there's nothing to wait for after DOMContentLoaded
+                    delay_before_return_html=0.5
                 )
+            )
                 
-                if result.success and result.html:
-                    # Method 1: Extract from channelId in HTML
-                    channel_id_match = re.search(r'"channelId":"([^"]+)"', result.html)
-                    if channel_id_match:
-                        channel_id = channel_id_match.group(1)
-                        channel_url = f"https://www.youtube.com/channel/{channel_id}"
-                        logger.info(f"✅ Extracted channel via channelId: {channel_url}")
-                        return channel_url
-                    
-                    # Method 2: Extract from channel link in page
-                    channel_link_patterns = [
-                        r'href="(/channel/[^"]+)"',
-                        r'href="(/c/[^"]+)"',
-                        r'href="(/@[^"]+)"'
-                    ]
-                    
-                    for pattern in channel_link_patterns:
-                        matches = re.findall(pattern, result.html)
-                        if matches:
-                            channel_path = matches[0]
-                            channel_url = f"https://www.youtube.com{channel_path}"
-                            logger.info(f"✅ Extracted channel via link pattern: {channel_url}")
-                            return channel_url
-                    
-                    # Method 3: Extract from meta tags
-                    meta_channel_match = re.search(r'<meta[^>]*property="og:url"[^>]*content="([^"]*(?:channel|c)/[^"]*)"', result.html)
-                    if meta_channel_match:
-                        channel_url = meta_channel_match.group(1)
-                        logger.info(f"✅ Extracted channel via meta tag: {channel_url}")
-                        return channel_url
+            if result.success and result.html:
+                return self._channel_url_from_video_html(result.html)
                 
         except Exception as e:
             logger.error(f"❌ Channel extraction error: {e}")
         
         return None
     
-    async def _extract_video_description_links(self, video_url: str) -> Dict[str, Dict[str, Any]]:
+    async def _fetch_video_page(self, video_url: str) -> Optional[str]:
         """
-        Extract social media links from YouTube video description
+        Load a YouTube video page with its description expanded
         
         Args:
             video_url: YouTube video URL
             
         Returns:
-            Dictionary of platform -> {url, score, source} mappings
+            Page HTML or None if the crawl fails
         """
-        links = {}
-        
         try:
-            logger.info(f"🔍 Extracting links from video description")
+            logger.info(f"🔍 Loading video page: {video_url}")
             
-            async with AsyncWebCrawler(config=self.browser_config) as crawler:
-                result = await crawler.arun(
-                    url=video_url,
-                    config=CrawlerRunConfig(
-                        cache_mode=CacheMode.BYPASS,
-                        wait_until="domcontentloaded",
-                        page_timeout=15000,
-                        delay_before_return_html=3.0,
-                        js_code="""
-                        // Expand description if collapsed
-                        await new Promise(resolve => setTimeout(resolve, 2000));
-                        
-                        const showMoreButton = document.querySelector('#expand');
-                        if (showMoreButton) {
-                            showMoreButton.click();
-                            await new Promise(resolve => setTimeout(resolve, 1000));
+            result = await self._arun(
+                url=video_url,
+                config=CrawlerRunConfig(
+                    **HTML_ONLY_CONFIG,
+                    cache_mode=CacheMode.BYPASS,
+                    wait_until="domcontentloaded",
+                    page_timeout=15000,
+                    delay_before_return_html=0.5,
+                    js_code="""
+                    // Expand description if collapsed, polling for the button
+                    // (up to 2s) instead of sleeping a fixed 2s first
+                    let showMoreButton = null;
+                    for (let i = 0; i < 20 && !showMoreButton; i++) {
+                        showMoreButton = document.querySelector('#expand');
+                        if (!showMoreButton) {
+                            await new Promise(resolve => setTimeout(resolve, 100));
                         }
+                    }
+                        
+                    if (showMoreButton) {
+                        showMoreButton.click();
+                        await new Promise(resolve => setTimeout(resolve, 1000));
+                    }
                         
-                        console.log('Video description expanded');
-                        """
-                    )
+                    console.log('Video description expanded');
+                    """
                 )
+            )
                 
-                if result.success and result.html:
-                    # Extract description text
-                    description_patterns = [
-                        r'<meta[^>]*name="description"[^>]*content="([^"]+)"',
-                        r'"shortDescription":"([^"]+)"',
-                        r'<div[^>]*id="description"[^>]*>([^<]+)</div>'
-                    ]
-                    
-                    description_text = ""
-                    for pattern in description_patterns:
-                        match = re.search(pattern, result.html, re.DOTALL)
-                        if match:
-                            description_text = match.group(1)
-                            break
-                    
-                    if description_text:
-                        logger.info(f"📝 Found description text ({len(description_text)} chars)")
-                        
-                        # Combined regex for direct and wrapped links
-                        link_pattern = r'(https://www\.youtube\.com/redirect\?[^\s]+|https?://(?:www\.)?(instagram|tiktok|spotify)\.com/[\w\-/@]+)'
-                        matches = re.findall(link_pattern, description_text, re.IGNORECASE)
-                        
-                        for match in matches:
-                            if isinstance(match, tuple):
-                                url = match[0]
-                                platform = match[1] if match[1] else self._identify_platform_from_url(url)
-                            else:
-                                url = match
-                                platform = self._identify_platform_from_url(url)
-                            
-                            if platform:
-                                # Unwrap redirect links
-                                final_url = self.unwrap_youtube_redirect(url)
-                                
-                                links[platform] = {
-                                    "url": final_url,
-                                    "score": 0.9,  # High confidence from video description
-                                    "source": "youtube_video_description"
-                                }
-                                logger.info(f"✅ Found {platform} link in description: {final_url}")
+            if result.success and result.html:
+                return result.html
         
         except Exception as e:
-            logger.error(f"❌ Video description extraction error: {e}")
+            logger.error(f"❌ Video page crawl error: {e}")
+        
+        return None
+    
+    def _channel_url_from_video_html(self, html: str) -> Optional[str]:
+        """Channel URL from a loaded YouTube video page, or None if it can't be found"""
+        # Method 1: Extract from channelId in HTML
+        channel_id_match = re.search(r'"channelId":"([^"]+)"', html)
+        if channel_id_match:
+            channel_id = channel_id_match.group(1)
+            channel_url = f"https://www.youtube.com/channel/{channel_id}"
+            logger.info(f"✅ Extracted channel via channelId: {channel_url}")
+            return channel_url
+            
+        # Method 2: Extract from channel link in page
+        channel_link_patterns = [
+            r'href="(/channel/[^"]+)"',
+            r'href="(/c/[^"]+)"',
+            r'href="(/@[^"]+)"'
+        ]
+            
+        for pattern in channel_link_patterns:
+            matches = re.findall(pattern, html)
+            if matches:
+                channel_path = matches[0]
+                channel_url = f"https://www.youtube.com{channel_path}"
+                logger.info(f"✅ Extracted channel via link pattern: {channel_url}")
+                return channel_url
+            
+        # Method 3: Extract from meta tags
+        meta_channel_match = re.search(r'<meta[^>]*property="og:url"[^>]*content="([^"]*(?:channel|c)/[^"]*)"', html)
+        if meta_channel_match:
+            channel_url = meta_channel_match.group(1)
+            logger.info(f"✅ Extracted channel via meta tag: {channel_url}")
+            return channel_url
+        
+        return None
+    
+    def _description_links_from_video_html(self, html: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract social media links from a loaded YouTube video page's description
+        
+        Args:
+            html: YouTube video page HTML
+            
+        Returns:
+            Dictionary of platform -> {url, score, source} mappings
+        """
+        links = {}
+        
+        # Extract description text
+        description_patterns = [
+            r'<meta[^>]*name="description"[^>]*content="([^"]+)"',
+            r'"shortDescription":"([^"]+)"',
+            r'<div[^>]*id="description"[^>]*>([^<]+)</div>'
+        ]
+            
+        description_text = ""
+        for pattern in description_patterns:
+            match = re.search(pattern, html, re.DOTALL)
+            if match:
+                description_text = match.group(1)
+                break
+            
+        if description_text:
+            logger.info(f"📝 Found description text ({len(description_text)} chars)")
+                
+            # Combined regex for direct and wrapped links
+            link_pattern = r'(https://www\.youtube\.com/redirect\?[^\s]+|https?://(?:www\.)?(instagram|tiktok|spotify)\.com/[\w\-/@]+)'
+            matches = re.findall(link_pattern, description_text, re.IGNORECASE)
+                
+            for match in matches:
+                if isinstance(match, tuple):
+                    url = match[0]
+                    platform = match[1] if match[1] else self._identify_platform_from_url(url)
+                else:
+                    url = match
+                    platform = self._identify_platform_from_url(url)
+                    
+                if platform:
+                    # Unwrap redirect links
+                    final_url = self.unwrap_youtube_redirect(url)
+                        
+                    links[platform] = {
+                        "url": final_url,
+                        "score": 0.9,  # High confidence from video description
+                        "source": "youtube_video_description"
+                    }
+                    logger.info(f"✅ Found {platform} link in description: {final_url}")
         
         return links
     
@@ -328,48 +438,47 @@ class Crawl4AIAgent:
                 channel_url
             ]
             
+            config = CrawlerRunConfig(
+                **HTML_ONLY_CONFIG,
+                cache_mode=CacheMode.BYPASS,
+                wait_until="domcontentloaded",
+                page_timeout=15000,
+                delay_before_return_html=3.0,
+                js_code="""
+                // Wait for page load and scroll to load links section
+                await new Promise(resolve => setTimeout(resolve, 2000));
+                window.scrollTo(0, 1000);
+                await new Promise(resolve => setTimeout(resolve, 1000));
+                console.log('Channel page processed');
+                """
+            )
+            
             for url in urls_to_try:
-                async with AsyncWebCrawler(config=self.browser_config) as crawler:
-                    result = await crawler.arun(
-                        url=url,
-                        config=CrawlerRunConfig(
-                            cache_mode=CacheMode.BYPASS,
-                            wait_until="domcontentloaded",
-                            page_timeout=15000,
-                            delay_before_return_html=3.0,
-                            js_code="""
-                            // Wait for page load and scroll to load links section
-                            await new Promise(resolve => setTimeout(resolve, 2000));
-                            window.scrollTo(0, 1000);
-                            await new Promise(resolve => setTimeout(resolve, 1000));
-                            console.log('Channel page processed');
-                            """
-                        )
-                    )
-                    
-                    if result.success and result.html:
-                        # Combined regex for both direct and wrapped links
-                        link_pattern = r'(https://www\.youtube\.com/redirect\?[^\s"]+|https?://(?:www\.)?(instagram|tiktok|spotify)\.com/[\w\-/@]+)'
-                        matches = re.findall(link_pattern, result.html, re.IGNORECASE)
+                result = await self._arun(url=url, config=config)
+                
+                if result.success and result.html:
+                    # Combined regex for both direct and wrapped links
+                    link_pattern = r'(https://www\.youtube\.com/redirect\?[^\s"]+|https?://(?:www\.)?(instagram|tiktok|spotify)\.com/[\w\-/@]+)'
+                    matches = re.findall(link_pattern, result.html, re.IGNORECASE)
                         
-                        for match in matches:
-                            if isinstance(match, tuple):
-                                url = match[0]
-                                platform = match[1] if match[1] else self._identify_platform_from_url(url)
-                            else:
-                                url = match
-                                platform = self._identify_platform_from_url(url)
+                    for match in matches:
+                        if isinstance(match, tuple):
+                            url = match[0]
+                            platform = match[1] if match[1] else self._identify_platform_from_url(url)
+                        else:
+                            url = match
+                            platform = self._identify_platform_from_url(url)
                             
-                            if platform and platform not in links:
-                                # Unwrap redirect links
-                                final_url = self.unwrap_youtube_redirect(url)
+                        if platform and platform not in links:
+                            # Unwrap redirect links
+                            final_url = self.unwrap_youtube_redirect(url)
                                 
-                                links[platform] = {
-                                    "url": final_url,
-                                    "score": 0.85,  # High confidence from channel
-                                    "source": "youtube_channel_links"
-                                }
-                                logger.info(f"✅ Found {platform} link in channel: {final_url}")
+                            links[platform] = {
+                                "url": final_url,
+                                "score": 0.85,  # High confidence from channel
+                                "source": "youtube_channel_links"
+                            }
+                            logger.info(f"✅ Found {platform} link in channel: {final_url}")
                 
                 # If we found links, no need to try other URLs
                 if links:
@@ -390,19 +499,10 @@ class Crawl4AIAgent:
         Returns:
             Platform name or None
         """
-        url_lower = url.lower()
-        
-        if 'instagram.com' in url_lower:
-            return 'instagram'
-        elif 'tiktok.com' in url_lower:
-            return 'tiktok'
-        elif 'spotify.com' in url_lower:
-            return 'spotify'
-        elif 'twitter.com' in url_lower or 'x.com' in url_lower:
-            return 'twitter'
-        elif 'facebook.com' in url_lower:
-            return 'facebook'
-        elif url_lower.startswith('http') and not any(domain in url_lower for domain in ['youtube.com', 'youtu.be']):
+        match = _SOCIAL_LINK_DOMAIN_RE.search(url)
+        if match:
+            return _SOCIAL_LINK_DOMAINS[match.group(0).lower()]
+        elif url[:4].lower() == 'http' and not _YOUTUBE_DOMAIN_RE.search(url):
             return 'website'
         
         return None
@@ -414,30 +514,30 @@ class Crawl4AIAgent:
             # We'll use a conservative approach
             search_url = f"https://www.instagram.com/{clean_name.replace(' ', '')}/"
             
-            async with AsyncWebCrawler(config=self.browser_config) as crawler:
-                result = await crawler.arun(
-                    url=search_url,
-                    config=CrawlerRunConfig(
-                        cache_mode=CacheMode.BYPASS,
-                        wait_for="css:h2",  # Wait for profile name
-                        js_code="window.scrollTo(0, 500);"  # Scroll to load content
-                    )
+            result = await self._arun(
+                url=search_url,
+                config=CrawlerRunConfig(
+                    **HTML_ONLY_CONFIG,
+                    cache_mode=CacheMode.BYPASS,
+                    wait_for="css:h2",  # Wait for profile name
+                    js_code="window.scrollTo(0, 500);"  # Scroll to load content
                 )
+            )
                 
-                if result.success and "Sorry, this page isn't available" not in result.html:
-                    # Extract profile info
-                    profile_name_match = re.search(r'<h2[^>]*>([^<]+)</h2>', result.html)
-                    if profile_name_match:
-                        profile_name = profile_name_match.group(1)
-                        score = self._calculate_name_match_score(original_name, profile_name)
+            if result.success and "Sorry, this page isn't available" not in result.html:
+                # Extract profile info
+                profile_name_match = re.search(r'<h2[^>]*>([^<]+)</h2>', result.html)
+                if profile_name_match:
+                    profile_name = profile_name_match.group(1)
+                    score = self._calculate_name_match_score(original_name, profile_name)
                         
-                        if score > 0.6:  # Reasonable match
-                            logger.info(f"✅ Found Instagram: @{clean_name.replace(' ', '')} (score: {score:.2f})")
-                            return {
-                                "url": search_url,
-                                "username": clean_name.replace(' ', ''),
-                                "score": score
-                            }
+                    if score > 0.6:  # Reasonable match
+                        logger.info(f"✅ Found Instagram: @{clean_name.replace(' ', '')} (score: {score:.2f})")
+                        return {
+                            "url": search_url,
+                            "username": clean_name.replace(' ', ''),
+                            "score": score
+                        }
                 
         except Exception as e:
             logger.error(f"Instagram search error: {e}")
@@ -451,30 +551,30 @@ class Crawl4AIAgent:
             username = clean_name.replace(' ', '').lower()
             search_url = f"https://www.tiktok.com/@{username}"
             
-            async with AsyncWebCrawler(config=self.browser_config) as crawler:
-                result = await crawler.arun(
-                    url=search_url,
-                    config=CrawlerRunConfig(
-                        cache_mode=CacheMode.BYPASS,
-                        wait_for="css:h1",  # Wait for profile name
-                        js_code="window.scrollTo(0, 300);"
-                    )
+            result = await self._arun(
+                url=search_url,
+                config=CrawlerRunConfig(
+                    **HTML_ONLY_CONFIG,
+                    cache_mode=CacheMode.BYPASS,
+                    wait_for="css:h1",  # Wait for profile name
+                    js_code="window.scrollTo(0, 300);"
                 )
+            )
                 
-                if result.success and "couldn't find this account" not in result.html.lower():
-                    # Extract profile name
-                    name_match = re.search(r'<h1[^>]*>([^<]+)</h1>', result.html)
-                    if name_match:
-                        profile_name = name_match.group(1)
-                        score = self._calculate_name_match_score(original_name, profile_name)
+            if result.success and "couldn't find this account" not in result.html.lower():
+                # Extract profile name
+                name_match = re.search(r'<h1[^>]*>([^<]+)</h1>', result.html)
+                if name_match:
+                    profile_name = name_match.group(1)
+                    score = self._calculate_name_match_score(original_name, profile_name)
                         
-                        if score > 0.6:
-                            logger.info(f"✅ Found TikTok: @{username} (score: {score:.2f})")
-                            return {
-                                "url": search_url,
-                                "username": username,
-                                "score": score
-                            }
+                    if score > 0.6:
+                        logger.info(f"✅ Found TikTok: @{username} (score: {score:.2f})")
+                        return {
+                            "url": search_url,
+                            "username": username,
+                            "score": score
+                        }
                 
         except Exception as e:
             logger.error(f"TikTok search error: {e}")
@@ -488,37 +588,37 @@ class Crawl4AIAgent:
             search_query = clean_name.replace(' ', '%20')
             search_url = f"https://open.spotify.com/search/{search_query}/artists"
             
-            async with AsyncWebCrawler(config=self.browser_config) as crawler:
-                result = await crawler.arun(
-                    url=search_url,
-                    config=CrawlerRunConfig(
-                        cache_mode=CacheMode.BYPASS,
-                        wait_for="css:a[href^='/artist/']",  # Wait for artist links
-                        js_code="window.scrollTo(0, 500);"
-                    )
+            result = await self._arun(
+                url=search_url,
+                config=CrawlerRunConfig(
+                    **HTML_ONLY_CONFIG,
+                    cache_mode=CacheMode.BYPASS,
+                    wait_for="css:a[href^='/artist/']",  # Wait for artist links
+                    js_code="window.scrollTo(0, 500);"
                 )
+            )
                 
-                if result.success:
-                    # Extract artist links and names
-                    artist_pattern = r'<a[^>]*href="(/artist/[^"]+)"[^>]*>.*?<span[^>]*>([^<]+)</span>'
-                    matches = re.findall(artist_pattern, result.html, re.DOTALL)
+            if result.success:
+                # Extract artist links and names
+                artist_pattern = r'<a[^>]*href="(/artist/[^"]+)"[^>]*>.*?<span[^>]*>([^<]+)</span>'
+                matches = re.findall(artist_pattern, result.html, re.DOTALL)
                     
-                    best_match = None
-                    best_score = 0
+                best_match = None
+                best_score = 0
                     
-                    for artist_url, artist_name in matches[:5]:  # Check top 5 results
-                        score = self._calculate_name_match_score(original_name, artist_name)
-                        if score > best_score:
-                            best_score = score
-                            best_match = {
-                                "url": f"https://open.spotify.com{artist_url}",
-                                "name": artist_name,
-                                "score": score
-                            }
+                for artist_url, artist_name in matches[:5]:  # Check top 5 results
+                    score = self._calculate_name_match_score(original_name, artist_name)
+                    if score > best_score:
+                        best_score = score
+                        best_match = {
+                            "url": f"https://open.spotify.com{artist_url}",
+                            "name": artist_name,
+                            "score": score
+                        }
                     
-                    if best_match and best_score > 0.7:
-                        logger.info(f"✅ Found Spotify artist: {best_match['name']} (score: {best_score:.2f})")
-                        return best_match
+                if best_match and best_score > 0.7:
+                    logger.info(f"✅ Found Spotify artist: {best_match['name']} (score: {best_score:.2f})")
+                    return best_match
                 
         except Exception as e:
             logger.error(f"Spotify search error: {e}")
@@ -531,41 +631,34 @@ class Crawl4AIAgent:
             # Convert channel URL to about page
             about_url = channel_url.rstrip('/') + '/about'
             
-            async with AsyncWebCrawler(config=self.browser_config) as crawler:
-                result = await crawler.arun(
-                    url=about_url,
-                    config=CrawlerRunConfig(
-                        cache_mode=CacheMode.BYPASS,
-                        wait_for="css:#links-container",  # Wait for social links
-                        js_code="window.scrollTo(0, 1000);"
-                    )
+            result = await self._arun(
+                url=about_url,
+                config=CrawlerRunConfig(
+                    **HTML_ONLY_CONFIG,
+                    cache_mode=CacheMode.BYPASS,
+                    wait_for="css:#links-container",  # Wait for social links
+                    js_code="window.scrollTo(0, 1000);"
                 )
+            )
                 
-                if result.success:
-                    social_links = {}
+            if result.success:
+                social_links = {}
                     
-                    # Extract social media links
-                    link_pattern = r'<a[^>]*href="([^"]+)"[^>]*>(?:.*?<span[^>]*>)?([^<]+)(?:</span>)?</a>'
-                    matches = re.findall(link_pattern, result.html)
+                # Walk anchors with lxml instead of regex-scanning the whole page
+                from lxml import html as lxml_html
+                tree = lxml_html.fromstring(result.html)
                     
-                    for url, text in matches:
-                        if 'instagram.com' in url:
-                            social_links['instagram'] = url
-                        elif 'tiktok.com' in url:
-                            social_links['tiktok'] = url
-                        elif 'spotify.com' in url:
-                            social_links['spotify'] = url
-                        elif 'twitter.com' in url or 'x.com' in url:
-                            social_links['twitter'] = url
-                        elif 'facebook.com' in url:
-                            social_links['facebook'] = url
-                        elif url.startswith('http') and not any(domain in url for domain in ['youtube.com', 'youtu.be']):
-                            # Potential artist website
-                            if not social_links.get('website'):
-                                social_links['website'] = url
+                for url in tree.xpath('//a/@href'):
+                    match = _SOCIAL_LINK_DOMAIN_RE.search(url)
+                    if match:
+                        social_links[_SOCIAL_LINK_DOMAINS[match.group(0).lower()]] = url
+                    elif url.startswith('http') and not any(domain in url for domain in ['youtube.com', 'youtu.be']):
+                        # Potential artist website
+                        if not social_links.get('website'):
+                            social_links['website'] = url
                     
-                    logger.info(f"✅ Extracted {len(social_links)} social links from YouTube")
-                    return {"social_links": social_links}
+                logger.info(f"✅ Extracted {len(social_links)} social links from YouTube")
+                return {"social_links": social_links}
                 
         except Exception as e:
             logger.error(f"YouTube channel extraction error: {e}")
@@ -577,57 +670,44 @@ class Crawl4AIAgent:
         logger.info(f"🌐 Extracting info from website: {website_url}")
         
         try:
-            async with AsyncWebCrawler(config=self.browser_config) as crawler:
-                result = await crawler.arun(
-                    url=website_url,
-                    config=CrawlerRunConfig(
-                        cache_mode=CacheMode.BYPASS,
-                        wait_for="css:body",
-                        js_code="window.scrollTo(0, document.body.scrollHeight);"
-                    )
+            result = await self._arun(
+                url=website_url,
+                config=CrawlerRunConfig(
+                    cache_mode=CacheMode.BYPASS,
+                    wait_for="css:body",
+                    js_code="window.scrollTo(0, document.body.scrollHeight);"
                 )
+            )
                 
-                if result.success:
-                    info = {
-                        "url": website_url,
-                        "title": result.title,
-                        "contact_info": {},
-                        "social_links": {},
-                        "tour_dates": [],
-                        "bio": None
-                    }
+            if result.success:
+                info = {
+                    "url": website_url,
+                    "title": result.title,
+                    "contact_info": {},
+                    "social_links": {},
+                    "tour_dates": [],
+                    "bio": None
+                }
                     
-                    # Extract email addresses
-                    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                    emails = re.findall(email_pattern, result.markdown)
-                    if emails:
-                        info["contact_info"]["emails"] = list(set(emails))[:3]  # Max 3 emails
+                # Extract email addresses (deduplicated in page order, so the
+                # first listed contact stays first); stop scanning once we have enough
+                emails = list(islice(_iter_unique_emails(result.markdown), _MAX_WEBSITE_EMAILS))
+                if emails:
+                    info["contact_info"]["emails"] = emails
                     
-                    # Extract social media links
-                    social_patterns = {
-                        'instagram': r'instagram\.com/([A-Za-z0-9_.]+)',
-                        'tiktok': r'tiktok\.com/@([A-Za-z0-9_.]+)',
-                        'spotify': r'open\.spotify\.com/artist/([A-Za-z0-9]+)',
-                        'twitter': r'(?:twitter\.com|x\.com)/([A-Za-z0-9_]+)',
-                        'youtube': r'youtube\.com/(?:c/|channel/|@)([A-Za-z0-9_-]+)'
-                    }
+                # Extract social media links
+                for platform, pattern in _WEBSITE_SOCIAL_PATTERNS.items():
+                    match = pattern.search(result.markdown)
+                    if match:
+                        info["social_links"][platform] = match.group(1)
                     
-                    for platform, pattern in social_patterns.items():
-                        matches = re.findall(pattern, result.markdown, re.IGNORECASE)
-                        if matches:
-                            info["social_links"][platform] = matches[0]
+                # Extract bio/about section
+                bio_match = _WEBSITE_BIO_RE.search(result.markdown)
+                if bio_match:
+                    info["bio"] = bio_match.group(1).strip()
                     
-                    # Extract bio/about section
-                    bio_match = re.search(
-                        r'(?:about|bio|biography)[\s\S]{0,100}?([A-Z][^.!?]{50,500}[.!?])',
-                        result.markdown,
-                        re.IGNORECASE
-                    )
-                    if bio_match:
-                        info["bio"] = bio_match.group(1).strip()
-                    
-                    logger.info(f"✅ Extracted website info successfully")
-                    return info
+                logger.info(f"✅ Extracted website info successfully")
+                return info
                 
         except Exception as e:
             logger.error(f"Website extraction error: {e}")
@@ -637,9 +717,9 @@ class Crawl4AIAgent:
     def _clean_artist_name_for_search(self, name: str) -> str:
         """Clean artist name for social media searches"""
         # Remove common suffixes
-        name = re.sub(r'\s*(Official|Music|VEVO|Channel|Artist).*$', '', name, flags=re.IGNORECASE)
+        name = _SEARCH_NAME_SUFFIX_RE.sub('', name)
         # Remove special characters except spaces
-        name = re.sub(r'[^a-zA-Z0-9\s]', '', name)
+        name = _SEARCH_NAME_SPECIAL_CHARS_RE.sub('', name)
         # Normalize spaces
         name = ' '.join(name.split())
         return name.lower()
@@ -693,4 +773,27 @@ class Crawl4AIAgent:
             weighted_sum += score * weight
             total_weight += weight
         
-        return weighted_sum / total_weight if total_weight > 0 else 0.0 
\ No newline at end of file
+        return weighted_sum / total_weight if total_weight > 0 else 0.0
+
+
+# Global instance so the launched browser is reused across discovery sessions
+_crawl4ai_agent: Optional[Crawl4AIAgent] = None
+
+
+def get_crawl4ai_agent() -> Crawl4AIAgent:
+    """Get or create the global Crawl4AI agent instance"""
+    global _crawl4ai_agent
+    if _crawl4ai_agent is None:
+        _crawl4ai_agent = Crawl4AIAgent()
+    return _crawl4ai_agent
+
+
+async def warmup_crawl4ai_agent():
+    """Start the global agent's browser ahead of the first request"""
+    await get_crawl4ai_agent().warmup()
+
+
+async def close_crawl4ai_agent():
+    """Close the global agent's browser on shutdown"""
+    if _crawl4ai_agent is not None:
+        await _crawl4ai_agent.aclose()
@@ -3,8 +3,11 @@ Crawl4AI YouTube Agent - Enhanced with Anti-Blocking Strategies
 Uses Crawl4AI's browser automation to scrape YouTube search results
 """
 import asyncio
+import functools
 import logging
+import os
 import random
+import re
 from typing import List, Dict, Any, Optional
 from urllib.parse import quote_plus
 import time
@@ -16,38 +19,212 @@ from ..models.youtube_models import YouTubeVideo, YouTubeSearchResult
 
 logger = logging.getLogger(__name__)
 
+# Only build a tree for result markup (renderers, divs, links); <head>, top-level
+# <script>/<style> blobs and other page chrome are skipped during parsing
+try:
+    from bs4 import SoupStrainer
+    RESULTS_STRAINER = SoupStrainer(re.compile(r'^(?:ytd-|ytm-)|^(?:div|a)$'))
+except ImportError:
+    RESULTS_STRAINER = None
+
+# Optional near-duplicate title detection for infinite scroll results
+try:
+    from datasketch import MinHash, MinHashLSH
+    MINHASH_AVAILABLE = True
+except ImportError:
+    MinHash = None
+    MinHashLSH = None
+    MINHASH_AVAILABLE = False
+
+# Video data is parsed straight from result.html, so the markdown pass crawl4ai
+# runs over the filtered DOM of every (multi-megabyte) results page is wasted
+try:
+    from crawl4ai import DefaultMarkdownGenerator
+    from crawl4ai.models import MarkdownGenerationResult
+    
+    class HtmlOnlyMarkdownGenerator(DefaultMarkdownGenerator):
+        """Skips markdown generation for crawls that only read result.html."""
+        
+        def generate_markdown(self, *args, **kwargs) -> MarkdownGenerationResult:
+            return MarkdownGenerationResult(
+                raw_markdown="",
+                markdown_with_citations="",
+                references_markdown="",
+                fit_markdown="",
+                fit_html=""
+            )
+    
+    HTML_ONLY_CONFIG = {"markdown_generator": HtmlOnlyMarkdownGenerator()}
+except ImportError:
+    HTML_ONLY_CONFIG = {}
+
+_TITLE_NON_WORD_RE = re.compile(r'\W+')
+_TITLE_SHINGLE_SIZE = 5
+_TITLE_MINHASH_PERM = 64
+
+# One pass over a channel href for /channel/<id>, /@<handle>, /c/<name> or /user/<name>
+_CHANNEL_HREF_RE = re.compile(r'/(channel/|@|c/|user/)([^/?&]+)')
+
+# Video ID locations in a YouTube URL, most specific first
+_VIDEO_ID_URL_PATTERNS = [re.compile(p) for p in [
+    r'watch\?v=([a-zA-Z0-9_-]{11})',  # Standard watch URLs
+    r'youtu\.be/([a-zA-Z0-9_-]{11})', # Short URLs
+    r'embed/([a-zA-Z0-9_-]{11})',     # Embed URLs
+    r'/watch/([a-zA-Z0-9_-]{11})',    # Alternative watch format
+    r'v=([a-zA-Z0-9_-]{11})',         # Simple v= parameter
+    r'([a-zA-Z0-9_-]{11})',           # Last resort - 11 char string
+]]
+
+@functools.lru_cache(maxsize=4096)
+def _parse_video_id(url: str) -> Optional[str]:
+    """Pull the 11-character video ID out of a YouTube URL (pure, so cached)."""
+    for pattern in _VIDEO_ID_URL_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def _parse_channel_id(href: str) -> Optional[str]:
+    """Channel ID or @handle from a channel href; channels repeat across results."""
+    match = _CHANNEL_HREF_RE.search(href)
+    if not match:
+        return None
+    kind, ident = match.group(1), match.group(2)
+    return f"@{ident}" if kind == '@' else ident
+
+def _title_minhash(title_lower: str):
+    """Build a MinHash over 5-char shingles of a normalized title, or None if too short."""
+    normalized = _TITLE_NON_WORD_RE.sub(' ', title_lower).strip()
+    if len(normalized) < _TITLE_SHINGLE_SIZE:
+        return None
+    minhash = MinHash(num_perm=_TITLE_MINHASH_PERM)
+    for i in range(len(normalized) - _TITLE_SHINGLE_SIZE + 1):
+        minhash.update(normalized[i:i + _TITLE_SHINGLE_SIZE].encode('utf-8'))
+    return minhash
+
+# Event-driven infinite scroll that stops as soon as results stop growing. The
+# script text is constant (the target comes from window.__scrollTarget) so it is
+# built once and Chromium can reuse its compiled form across navigations
+_INFINITE_SCROLL_JS = """
+(async function() {
+    const videoSelector = 'ytd-video-renderer, ytd-grid-video-renderer, ytd-compact-video-renderer';
+    const targetVideos = window.__scrollTarget || 100;
+    const maxScrolls = 30;
+    const maxStalls = 2;
+    let lastCount = 0;
+    let stalls = 0;
+    let scrolls = 0;
+    
+    // Resolve as soon as YouTube appends results, capped at timeoutMs
+    const waitForNewVideos = (before, timeoutMs) => new Promise(resolve => {
+        const observer = new MutationObserver(() => {
+            if (document.querySelectorAll(videoSelector).length > before) {
+                observer.disconnect();
+                resolve();
+            }
+        });
+        observer.observe(document.body, {childList: true, subtree: true});
+        setTimeout(() => { observer.disconnect(); resolve(); }, timeoutMs);
+    });
+    
+    console.log(`🚀 Starting infinite scroll for ${targetVideos} videos`);
+    
+    while (scrolls < maxScrolls) {
+        const before = document.querySelectorAll(videoSelector).length;
+        window.scrollTo(0, document.documentElement.scrollHeight);
+        await waitForNewVideos(before, 2000);
+        scrolls++;
+        
+        const count = document.querySelectorAll(videoSelector).length;
+        if (count >= targetVideos) {
+            console.log('🎯 Target reached!');
+            break;
+        }
+        
+        // Stop once YouTube stops appending results instead of waiting out a fixed budget
+        if (count === lastCount) {
+            stalls++;
+            if (stalls >= maxStalls) {
+                break;
+            }
+        } else {
+            stalls = 0;
+        }
+        lastCount = count;
+    }
+    
+    const finalVideoCount = document.querySelectorAll(videoSelector).length;
+    console.log(`✅ Infinite scroll complete: ${finalVideoCount} videos found after ${scrolls} scrolls`);
+    window.__video_count = finalVideoCount;
+    window.__scroll_complete = true;
+})();
+"""
+
+# Anti-bot identity pools, built once and shared by every agent instance
+_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0"
+)
+
+# Geolocation rotation for different regions
+_GEOLOCATIONS = (
+    GeolocationConfig(latitude=40.7128, longitude=-74.0060, accuracy=100),  # New York
+    GeolocationConfig(latitude=34.0522, longitude=-118.2437, accuracy=100),  # Los Angeles
+    GeolocationConfig(latitude=51.5074, longitude=-0.1278, accuracy=100),  # London
+    GeolocationConfig(latitude=48.8566, longitude=2.3522, accuracy=100),  # Paris
+    GeolocationConfig(latitude=35.6762, longitude=139.6503, accuracy=100),  # Tokyo
+)
+
+# Language/locale rotation
+_LOCALES = (
+    {"locale": "en-US", "timezone": "America/New_York"},
+    {"locale": "en-GB", "timezone": "Europe/London"},
+    {"locale": "fr-FR", "timezone": "Europe/Paris"},
+    {"locale": "de-DE", "timezone": "Europe/Berlin"},
+    {"locale": "ja-JP", "timezone": "Asia/Tokyo"}
+)
+
+# Random viewport sizes to mimic different devices
+_VIEWPORTS = ((1920, 1080), (1366, 768), (1440, 900), (1536, 864), (1280, 720))
+
+# Fixed browser configs for the strategies that don't randomize identity
+_BASIC_BROWSER_CONFIG = BrowserConfig(
+    browser_type="chromium",
+    headless=True,
+    viewport_width=1280,
+    viewport_height=720,
+    java_script_enabled=True,
+    ignore_https_errors=True
+)
+
+_MOBILE_USER_AGENT = "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"
+_MOBILE_BROWSER_CONFIG = BrowserConfig(
+    browser_type="chromium",
+    headless=True,
+    viewport_width=375,  # iPhone viewport
+    viewport_height=667,
+    user_agent=_MOBILE_USER_AGENT,
+    java_script_enabled=True,
+    ignore_https_errors=True,
+    extra_args=[
+        "--no-sandbox",
+        "--disable-blink-features=AutomationControlled",
+        f"--user-agent={_MOBILE_USER_AGENT}"
+    ]
+)
+
 class Crawl4AIYouTubeAgent:
     """Enhanced YouTube agent with comprehensive anti-blocking strategies."""
     
     def __init__(self):
         """Initialize the Crawl4AI YouTube agent with anti-blocking features."""
-        # Anti-bot user agents rotation
-        self.user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0"
-        ]
-        
-        # Geolocation rotation for different regions
-        self.geolocations = [
-            GeolocationConfig(latitude=40.7128, longitude=-74.0060, accuracy=100),  # New York
-            GeolocationConfig(latitude=34.0522, longitude=-118.2437, accuracy=100),  # Los Angeles
-            GeolocationConfig(latitude=51.5074, longitude=-0.1278, accuracy=100),  # London
-            GeolocationConfig(latitude=48.8566, longitude=2.3522, accuracy=100),  # Paris
-            GeolocationConfig(latitude=35.6762, longitude=139.6503, accuracy=100),  # Tokyo
-        ]
-        
-        # Language/locale rotation
-        self.locales = [
-            {"locale": "en-US", "timezone": "America/New_York"},
-            {"locale": "en-GB", "timezone": "Europe/London"},
-            {"locale": "fr-FR", "timezone": "Europe/Paris"},
-            {"locale": "de-DE", "timezone": "Europe/Berlin"},
-            {"locale": "ja-JP", "timezone": "Asia/Tokyo"}
-        ]
+        # Single PRNG for request jitter and identity rotation, seeded once per agent
+        self._rng = random.Random(os.urandom(8))
         
         # Enhanced selectors with multiple fallbacks
         self.selectors = {
@@ -130,7 +307,7 @@ class Crawl4AIYouTubeAgent:
                 headless=True,
                 viewport_width=1920,
                 viewport_height=1080,
-                user_agent=random.choice(self.user_agents),
+                user_agent=self._rng.choice(_USER_AGENTS),
                 java_script_enabled=True,
                 ignore_https_errors=True,
                 extra_args=[
@@ -183,27 +360,37 @@ class Crawl4AIYouTubeAgent:
             async with AsyncWebCrawler(config=browser_config) as crawler:
                 results = []
                 
+                # One config for the whole session; steps run sequentially, so
+                # only the per-step fields are swapped in before each run
+                config = CrawlerRunConfig(
+                    **HTML_ONLY_CONFIG,
+                    cache_mode=CacheMode.BYPASS,
+                    session_id=session_id,
+                    magic=True,
+                    simulate_user=True,
+                    verbose=logger.isEnabledFor(logging.DEBUG)
+                )
+                
+                loop = asyncio.get_running_loop()
+                last_start = loop.time()
+                
                 for i, interaction in enumerate(js_interactions):
                     logger.info(f"🔄 Session step {i+1}: {interaction['description']}")
                     
-                    # Create config for this interaction
-                    config = CrawlerRunConfig(
-                        cache_mode=CacheMode.BYPASS,
-                        js_code=interaction["js_code"],
-                        wait_for=interaction["wait_for"],
-                        session_id=session_id,
-                        page_timeout=45000 if i == len(js_interactions) - 1 else 20000,  # Longer timeout for scroll step
-                        delay_before_return_html=interaction["delay"],
-                        magic=True,
-                        simulate_user=True,
-                        verbose=True
-                    )
+                    config.js_code = interaction["js_code"]
+                    config.wait_for = interaction["wait_for"]
+                    config.page_timeout = 45000 if i == len(js_interactions) - 1 else 20000  # Longer timeout for scroll step
+                    config.delay_before_return_html = interaction["delay"]
                     
-                    # Add delay between interactions
+                    # Space interactions by their delay, counting the time the
+                    # previous step already spent crawling
                     if i > 0:
-                        await asyncio.sleep(interaction["delay"])
+                        wait = last_start + interaction["delay"] - loop.time()
+                        if wait > 0:
+                            await asyncio.sleep(wait)
                     
                     # Execute crawl step
+                    last_start = loop.time()
                     result = await crawler.arun(url=search_url, config=config)
                     
                     if not result.success:
@@ -247,15 +434,14 @@ class Crawl4AIYouTubeAgent:
                 error_message=f"Session search exception: {str(e)}"
             )
 
+    async def _jitter_sleep(self, lo: float = 0.3, hi: float = 0.8):
+        """Short randomized pause between requests."""
+        await asyncio.sleep(self._rng.uniform(lo, hi))
+
     async def get_browser_config(self) -> BrowserConfig:
         """Create randomized browser configuration with anti-detection features."""
-        user_agent = random.choice(self.user_agents)
-        
-        # Random viewport sizes to mimic different devices
-        viewports = [
-            (1920, 1080), (1366, 768), (1440, 900), (1536, 864), (1280, 720)
-        ]
-        viewport = random.choice(viewports)
+        user_agent = self._rng.choice(_USER_AGENTS)
+        viewport = self._rng.choice(_VIEWPORTS)
         
         return BrowserConfig(
             browser_type="chromium",
@@ -295,183 +481,21 @@ class Crawl4AIYouTubeAgent:
             ]
         )
 
-    def get_advanced_infinite_scroll_js(self, target_videos: int = 100) -> str:
-        """Generate advanced infinite scroll JavaScript with multiple strategies"""
-        return f"""
-        (async function() {{
-            let previousHeight = 0;
-            let currentHeight = document.body.scrollHeight;
-            let scrollAttempts = 0;
-            const maxAttempts = 30;
-            let noNewContentCount = 0;
-            const maxNoNewContent = 5;
-            
-            console.log('🚀 Starting advanced infinite scroll for {target_videos} videos');
-            
-            while (scrollAttempts < maxAttempts && noNewContentCount < maxNoNewContent) {{
-                // Count current videos using multiple selectors
-                const videoSelectors = [
-                    'ytd-video-renderer',
-                    'ytd-grid-video-renderer', 
-                    'ytd-compact-video-renderer',
-                    '[data-testid="video-renderer"]',
-                    'div[class*="video-renderer"]'
-                ];
-                
-                let videoCount = 0;
-                for (const selector of videoSelectors) {{
-                    const videos = document.querySelectorAll(selector);
-                    if (videos.length > videoCount) {{
-                        videoCount = videos.length;
-                    }}
-                }}
-                
-                console.log(`📊 Current videos found: ${{videoCount}}`);
-                
-                if (videoCount >= {target_videos}) {{
-                    console.log('🎯 Target reached!');
-                    break;
-                }}
-                
-                // Strategy 1: Progressive scrolling with varying speeds
-                const scrollStep = Math.floor(Math.random() * 500) + 300; // 300-800px
-                window.scrollBy(0, scrollStep);
-                await new Promise(resolve => setTimeout(resolve, 800 + Math.random() * 400));
-                
-                // Strategy 2: Scroll to bottom periodically
-                if (scrollAttempts % 3 === 0) {{
-                    window.scrollTo(0, document.body.scrollHeight);
-                    await new Promise(resolve => setTimeout(resolve, 1000));
-                }}
-                
-                // Strategy 3: Element-based scrolling
-                if (scrollAttempts % 5 === 0) {{
-                    const videos = document.querySelectorAll('ytd-video-renderer, ytd-grid-video-renderer');
-                    if (videos.length > 0) {{
-                        const lastVideo = videos[videos.length - 1];
-                        lastVideo.scrollIntoView({{behavior: 'smooth', block: 'center'}});
-                        await new Promise(resolve => setTimeout(resolve, 1000));
-                    }}
-                }}
-                
-                // Strategy 4: Trigger scroll events manually
-                if (scrollAttempts % 4 === 0) {{
-                    ['scroll', 'wheel', 'touchmove'].forEach(eventType => {{
-                        window.dispatchEvent(new Event(eventType, {{bubbles: true}}));
-                        document.dispatchEvent(new Event(eventType, {{bubbles: true}}));
-                    }});
-                    await new Promise(resolve => setTimeout(resolve, 500));
-                }}
-                
-                // Strategy 5: Focus on scroll containers
-                if (scrollAttempts % 6 === 0) {{
-                    const containers = [
-                        'ytd-app',
-                        'div#contents',
-                        'div#primary',
-                        '.ytd-section-list-renderer'
-                    ];
-                    
-                    for (const containerSelector of containers) {{
-                        const container = document.querySelector(containerSelector);
-                        if (container) {{
-                            container.scrollTop = container.scrollHeight;
-                            await new Promise(resolve => setTimeout(resolve, 500));
-                        }}
-                    }}
-                }}
-                
-                // Strategy 6: Hover and interact with elements to trigger lazy loading
-                if (scrollAttempts % 7 === 0) {{
-                    const elements = document.querySelectorAll('ytd-video-renderer, [data-lazy]');
-                    for (let i = 0; i < Math.min(5, elements.length); i++) {{
-                        const element = elements[i];
-                        element.dispatchEvent(new MouseEvent('mouseover', {{bubbles: true}}));
-                        element.dispatchEvent(new Event('focus', {{bubbles: true}}));
-                        await new Promise(resolve => setTimeout(resolve, 100));
-                    }}
-                }}
-                
-                // Check for height change
-                await new Promise(resolve => setTimeout(resolve, 1500));
-                previousHeight = currentHeight;
-                currentHeight = document.body.scrollHeight;
-                
-                if (currentHeight === previousHeight) {{
-                    noNewContentCount++;
-                    console.log(`⚠️ No height change detected (${{noNewContentCount}}/${{maxNoNewContent}})`);
-                    
-                    // Try alternative scroll methods when stuck
-                    const alternativeContainers = [
-                        document.querySelector('ytd-app'),
-                        document.querySelector('#primary'),
-                        document.querySelector('#contents'),
-                        document.body
-                    ];
-                    
-                    for (const container of alternativeContainers) {{
-                        if (container) {{
-                            container.scrollTop = container.scrollHeight;
-                            await new Promise(resolve => setTimeout(resolve, 800));
-                        }}
-                    }}
-                    
-                    // Trigger intersection observer manually
-                    const observer = new IntersectionObserver((entries) => {{
-                        entries.forEach(entry => {{
-                            if (entry.isIntersecting) {{
-                                entry.target.dispatchEvent(new Event('intersect'));
-                            }}
-                        }});
-                    }});
-                    
-                    document.querySelectorAll('[data-lazy], ytd-video-renderer').forEach(el => {{
-                        observer.observe(el);
-                    }});
-                    
-                    await new Promise(resolve => setTimeout(resolve, 1000));
-                    observer.disconnect();
-                }} else {{
-                    noNewContentCount = 0;
-                }}
-                
-                scrollAttempts++;
-                
-                // Random delay between attempts to appear more human
-                const delay = 800 + Math.random() * 1200; // 800-2000ms
-                await new Promise(resolve => setTimeout(resolve, delay));
-            }}
-            
-            // Final count
-            let finalVideoCount = 0;
-            const videoSelectors = [
-                'ytd-video-renderer',
-                'ytd-grid-video-renderer', 
-                'ytd-compact-video-renderer'
-            ];
-            
-            for (const selector of videoSelectors) {{
-                const videos = document.querySelectorAll(selector);
-                if (videos.length > finalVideoCount) {{
-                    finalVideoCount = videos.length;
-                }}
-            }}
-            
-            console.log(`✅ Infinite scroll complete: ${{finalVideoCount}} videos found after ${{scrollAttempts}} attempts`);
-            window.__video_count = finalVideoCount;
-            window.__scroll_complete = true;
-        }})();
-        """
+    def get_advanced_infinite_scroll_js(self, target_videos: int = 100) -> List[str]:
+        """Infinite scroll script steps: a one-line parameter shim plus the shared scroll script"""
+        return [f"window.__scrollTarget = {int(target_videos)};", _INFINITE_SCROLL_JS]
 
     async def get_crawler_config(self, target_videos: int = 100) -> CrawlerRunConfig:
         """Create randomized crawler configuration with stealth features."""
         # Random locale/timezone
-        locale_config = random.choice(self.locales)
+        locale_config = self._rng.choice(_LOCALES)
         
         # Random geolocation
-        geolocation = random.choice(self.geolocations)
+        geolocation = self._rng.choice(_GEOLOCATIONS)
         
         return CrawlerRunConfig(
+            **HTML_ONLY_CONFIG,
+            
             # Magic mode for automatic anti-bot handling
             magic=True,
             
@@ -490,7 +514,7 @@ class Crawl4AIYouTubeAgent:
             remove_overlay_elements=True,
             
             # Timing optimized for full page scanning
-            delay_before_return_html=random.uniform(8.0, 12.0),  # More time for content loading
+            delay_before_return_html=self._rng.uniform(8.0, 12.0),  # More time for content loading
             
             # Wait strategies
             wait_until="domcontentloaded",  # More reliable than networkidle
@@ -504,8 +528,8 @@ class Crawl4AIYouTubeAgent:
             # Performance
             wait_for_images=False,
             
-            # Debugging
-            verbose=True,
+            # Debugging (crawl4ai verbose output only at DEBUG)
+            verbose=logger.isEnabledFor(logging.DEBUG),
             
             # Cache settings
             cache_mode=CacheMode.BYPASS
@@ -551,7 +575,7 @@ class Crawl4AIYouTubeAgent:
                 error_message = str(e)
                 
             # Quick delay between strategies (reduced since methods are faster)
-            await asyncio.sleep(random.uniform(1.0, 3.0))
+            await self._jitter_sleep()
         
         return YouTubeSearchResult(
             query=query,
@@ -564,30 +588,24 @@ class Crawl4AIYouTubeAgent:
     async def _search_with_basic_config(self, query: str, max_results: int, upload_date: str) -> YouTubeSearchResult:
         """Search using basic configuration without advanced features."""
         try:
-            browser_config = BrowserConfig(
-                browser_type="chromium",
-                headless=True,
-                viewport_width=1280,
-                viewport_height=720,
-                java_script_enabled=True,
-                ignore_https_errors=True
-            )
+            browser_config = _BASIC_BROWSER_CONFIG
             
             crawler_config = CrawlerRunConfig(
+                **HTML_ONLY_CONFIG,
                 cache_mode=CacheMode.BYPASS,
                 wait_until="domcontentloaded",
                 page_timeout=30000,  # Increased for full page scanning
                 delay_before_return_html=3.0,
                 scan_full_page=True,   # Enable full page scrolling
                 scroll_delay=0.2,      # 200ms between scrolls
-                verbose=True
+                verbose=logger.isEnabledFor(logging.DEBUG)
             )
             
             search_url = self._build_search_url(query, upload_date)
             logger.info(f"🔍 Basic config search URL: {search_url}")
             
             async with AsyncWebCrawler(config=browser_config) as crawler:
-                await asyncio.sleep(random.uniform(0.5, 1.5))  # Faster
+                await self._jitter_sleep()
                 
                 logger.info("🌐 Starting basic config crawl...")
                 result = await crawler.arun(url=search_url, config=crawler_config)
@@ -649,9 +667,7 @@ class Crawl4AIYouTubeAgent:
             logger.info(f"🔍 Magic mode search URL: {search_url}")
             
             async with AsyncWebCrawler(config=browser_config) as crawler:
-                # Add random pre-search delay
-                await asyncio.sleep(random.uniform(0.5, 1.5))  # Faster
-                
+                # No pre-search delay: magic mode already handles anti-bot timing
                 logger.info("🌐 Starting magic mode crawl...")
                 result = await crawler.arun(url=search_url, config=crawler_config)
                 
@@ -697,41 +713,18 @@ class Crawl4AIYouTubeAgent:
             crawler_config.simulate_user = True
             crawler_config.override_navigator = True
             crawler_config.magic = True
+            # Let the built-in full-page scan drive scrolling; a custom JS scroll
+            # on top of it only doubles scroll events and the trailing wait
             crawler_config.scan_full_page = True
-            
-            # Simplified, faster JavaScript for scrolling
-            fast_scroll_js = """
-            (function() {
-                console.log('Starting fast scroll...');
-                
-                let scrollCount = 0;
-                const maxScrolls = 3; // Reduced from 8
-                
-                function fastScroll() {
-                    if (scrollCount < maxScrolls) {
-                        console.log(`Fast scroll ${scrollCount + 1}/${maxScrolls}`);
-                        window.scrollBy(0, 800);
-                        scrollCount++;
-                        setTimeout(fastScroll, 800); // Much faster - 0.8s instead of 1.5-3.5s
-                    } else {
-                        console.log('Fast scrolling complete');
-                    }
-                }
-                
-                // Start immediately
-                fastScroll();
-            })();
-            """
-            
-            crawler_config.js_code = fast_scroll_js
-            crawler_config.delay_before_return_html = 8.0  # Reduced from 25 seconds
+            crawler_config.scroll_delay = 0.3
+            crawler_config.delay_before_return_html = 3.0  # Scanner signals completion itself
             crawler_config.page_timeout = 20000  # 20 second timeout instead of default
             
             search_url = self._build_search_url(query, upload_date)
             logger.info(f"🔍 Extended stealth search URL: {search_url}")
             
             async with AsyncWebCrawler(config=browser_config) as crawler:
-                await asyncio.sleep(random.uniform(1.0, 2.0))  # Reduced delay
+                await self._jitter_sleep()
                 
                 logger.info("🌐 Starting extended stealth crawl...")
                 result = await crawler.arun(url=search_url, config=crawler_config)
@@ -770,32 +763,19 @@ class Crawl4AIYouTubeAgent:
 
     async def _search_with_mobile_emulation(self, query: str, max_results: int, upload_date: str) -> YouTubeSearchResult:
         """Search using mobile emulation to avoid desktop bot detection."""
-        # Mobile-specific browser config
-        browser_config = BrowserConfig(
-            browser_type="chromium",
-            headless=True,
-            viewport_width=375,  # iPhone viewport
-            viewport_height=667,
-            user_agent="Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1",
-            java_script_enabled=True,
-            ignore_https_errors=True,
-            extra_args=[
-                "--no-sandbox",
-                "--disable-blink-features=AutomationControlled",
-                "--user-agent=Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"
-            ]
-        )
+        browser_config = _MOBILE_BROWSER_CONFIG
         
         # Mobile-specific crawler config
         crawler_config = CrawlerRunConfig(
+            **HTML_ONLY_CONFIG,
             magic=True,
             simulate_user=True,
             remove_overlay_elements=True,
-            delay_before_return_html=random.uniform(3.0, 6.0),
+            delay_before_return_html=self._rng.uniform(3.0, 6.0),
             wait_until="networkidle",
             page_timeout=90000,
             cache_mode=CacheMode.BYPASS,
-            verbose=True
+            verbose=logger.isEnabledFor(logging.DEBUG)
         )
         
         # Use mobile YouTube URL
@@ -813,7 +793,7 @@ class Crawl4AIYouTubeAgent:
                 mobile_search_url += f"&sp={date_map[upload_date]}"
         
         async with AsyncWebCrawler(config=browser_config) as crawler:
-            await asyncio.sleep(random.uniform(1.5, 3.5))
+            await self._jitter_sleep(0.5, 1.0)
             
             result = await crawler.arun(url=mobile_search_url, config=crawler_config)
             
@@ -863,7 +843,11 @@ class Crawl4AIYouTubeAgent:
         try:
             # Use enhanced extractor first
             from enhanced_extractors import EnhancedYouTubeExtractor
-            video_data_list = EnhancedYouTubeExtractor.extract_search_videos(html, max_results)
+            # Parsing a fully scrolled results page is CPU-bound; run it in a worker
+            # thread so other crawls and scroll sessions keep making progress
+            video_data_list = await asyncio.to_thread(
+                EnhancedYouTubeExtractor.extract_search_videos, html, max_results
+            )
             
             # Convert to YouTubeVideo objects
             for video_data in video_data_list:
@@ -920,7 +904,7 @@ class Crawl4AIYouTubeAgent:
         
         try:
             from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml', parse_only=RESULTS_STRAINER)
             
             # Different extraction strategies for mobile vs desktop
             if mobile:
@@ -938,7 +922,7 @@ class Crawl4AIYouTubeAgent:
                         if len(videos) >= max_results:
                             break
                 except Exception as e:
-                    logger.warning(f"Failed to extract video from container: {e}")
+                    logger.debug("Failed to extract video from container: %s", e)
                     continue
             
             logger.info(f"Successfully extracted {len(videos)} videos")
@@ -973,7 +957,7 @@ class Crawl4AIYouTubeAgent:
             found = soup.select(selector)
             if found:
                 containers.extend(found)
-                logger.info(f"Found {len(found)} containers with selector: {selector}")
+                logger.debug("Found %d containers with selector: %s", len(found), selector)
         
         # Remove duplicates while preserving order
         seen = set()
@@ -1089,7 +1073,7 @@ class Crawl4AIYouTubeAgent:
                         break
             
             if not url:
-                logger.debug(f"No URL found for title: {title}")
+                logger.debug("No URL found for title: %s", title)
                 return None
             
             # Extract channel name AND channel URL with more fallbacks
@@ -1117,23 +1101,7 @@ class Crawl4AIYouTubeAgent:
                             channel_url = href
                         
                         # Extract channel ID or handle
-                        import re
-                        if '/channel/' in href:
-                            match = re.search(r'/channel/([^/?&]+)', href)
-                            if match:
-                                channel_id = match.group(1)
-                        elif '/@' in href:
-                            match = re.search(r'/@([^/?&]+)', href)
-                            if match:
-                                channel_id = f"@{match.group(1)}"
-                        elif '/c/' in href:
-                            match = re.search(r'/c/([^/?&]+)', href)
-                            if match:
-                                channel_id = match.group(1)
-                        elif '/user/' in href:
-                            match = re.search(r'/user/([^/?&]+)', href)
-                            if match:
-                                channel_id = match.group(1)
+                        channel_id = _parse_channel_id(href)
                         
                         # Get channel name from the link text
                         channel_text = channel_elem.get_text(strip=True)
@@ -1212,11 +1180,12 @@ class Crawl4AIYouTubeAgent:
                 channel_id=channel_id
             )
             
-            logger.debug(f"✅ Extracted video: {title[:50]}... from {channel_name}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("✅ Extracted video: %s... from %s", title[:50], channel_name)
             return video
             
         except Exception as e:
-            logger.warning(f"Error extracting video data: {e}")
+            logger.debug("Error extracting video data: %s", e)
             return None
 
     def _extract_video_id_from_url(self, url: str) -> Optional[str]:
@@ -1224,29 +1193,15 @@ class Crawl4AIYouTubeAgent:
         try:
             if not url:
                 return None
-                
-            import re
-            patterns = [
-                r'watch\?v=([a-zA-Z0-9_-]{11})',  # Standard watch URLs
-                r'youtu\.be/([a-zA-Z0-9_-]{11})', # Short URLs
-                r'embed/([a-zA-Z0-9_-]{11})',     # Embed URLs
-                r'/watch/([a-zA-Z0-9_-]{11})',    # Alternative watch format
-                r'v=([a-zA-Z0-9_-]{11})',         # Simple v= parameter
-                r'([a-zA-Z0-9_-]{11})',           # Last resort - 11 char string
-            ]
             
-            for pattern in patterns:
-                match = re.search(pattern, url)
-                if match:
-                    video_id = match.group(1)
-                    # Validate it's actually 11 characters (YouTube video ID length)
-                    if len(video_id) == 11:
-                        return video_id
+            video_id = _parse_video_id(url)
+            if video_id:
+                return video_id
             
-            logger.debug(f"Could not extract video ID from URL: {url}")
+            logger.debug("Could not extract video ID from URL: %s", url)
             return None
         except Exception as e:
-            logger.debug(f"Error extracting video ID from URL {url}: {e}")
+            logger.debug("Error extracting video ID from URL %s: %s", url, e)
             return None
 
     def get_cost_estimate(self, expected_videos: int) -> float:
@@ -1273,11 +1228,12 @@ class Crawl4AIYouTubeAgent:
             
             # Use Crawl4AI's built-in infinite scroll feature with enhanced settings
             crawler_config = CrawlerRunConfig(
+                **HTML_ONLY_CONFIG,
                 cache_mode=CacheMode.BYPASS,
                 wait_until="domcontentloaded",  # Faster than networkidle
                 page_timeout=300000,  # 5 minute timeout for extensive scrolling
                 delay_before_return_html=10.0,  # More time after scrolling completes
-                verbose=True,
+                verbose=logger.isEnabledFor(logging.DEBUG),
                 simulate_user=True,
                 magic=True,
                 # Enhanced infinite scroll support
@@ -1302,15 +1258,23 @@ class Crawl4AIYouTubeAgent:
                 logger.info(f"📊 Successfully extracted {len(all_videos)} videos")
                 
                 # Remove duplicates using video_id and title
-                unique_videos = []
-                seen_ids = set()
-                seen_titles = set()
+                # One dict keyed by ID (insertion-ordered, so it doubles as the result
+                # list) and one keyed by title hash; a hash collision just drops one
+                # extra video, which is acceptable here
+                by_id = {}
+                by_title = {}
+                # Near-duplicate titles ("(Official Video)", remix tags, emojis) via MinHash-LSH
+                title_lsh = MinHashLSH(threshold=0.85, num_perm=_TITLE_MINHASH_PERM) if MINHASH_AVAILABLE else None
                 videos_without_id = 0
                 duplicate_ids = 0
                 duplicate_titles = 0
                 
-                for video in all_videos:
-                    video_id = getattr(video, 'video_id', None) or self._extract_video_id_from_url(video.url)
+                # Consume candidates as a stream and stop at the target, so the
+                # extraction step can hand over a lazy iterator instead of a list
+                video_stream = iter(all_videos)
+                del all_videos
+                for video in video_stream:
+                    video_id = video.video_id or self._extract_video_id_from_url(video.url)
                     
                     # Skip videos without valid ID
                     if not video_id:
@@ -1318,27 +1282,37 @@ class Crawl4AIYouTubeAgent:
                         continue
                     
                     # Skip duplicate IDs
-                    if video_id in seen_ids:
+                    if video_id in by_id:
                         duplicate_ids += 1
                         continue
                     
                     # Skip very similar titles (fuzzy deduplication)
-                    title_lower = video.title.lower() if video.title else ""
-                    if title_lower in seen_titles:
+                    # Normalize once; kept on the video for downstream title checks
+                    title_lower = video.title.casefold() if video.title else ""
+                    video._norm_title = title_lower
+                    title_hash = hash(title_lower)
+                    if title_hash in by_title:
+                        duplicate_titles += 1
+                        continue
+                    
+                    title_minhash = _title_minhash(title_lower) if title_lsh is not None else None
+                    if title_minhash is not None and title_lsh.query(title_minhash):
                         duplicate_titles += 1
                         continue
                     
-                    # Add video_id as property if missing
-                    if not hasattr(video, 'video_id'):
-                        video.video_id = video_id
+                    # Store the resolved ID (may have come from the URL)
+                    video.video_id = video_id
                     
-                    unique_videos.append(video)
-                    seen_ids.add(video_id)
-                    seen_titles.add(title_lower)
+                    by_id[video_id] = video
+                    by_title[title_hash] = video_id
+                    if title_minhash is not None:
+                        title_lsh.insert(video_id, title_minhash)
                     
-                    if len(unique_videos) >= target_videos:
+                    if len(by_id) >= target_videos:
                         break
                 
+                del video_stream
+                unique_videos = list(by_id.values())
                 logger.info(f"🔍 Deduplication stats: {videos_without_id} without ID, {duplicate_ids} duplicate IDs, {duplicate_titles} duplicate titles")
                 logger.info(f"🏁 Infinite scroll complete: {len(unique_videos)} unique videos found")
                 return YouTubeSearchResult(
@@ -1,29 +1,27 @@
 # backend/app/agents/lyrics_agent.py
-from pydantic_ai import Agent, ModelRetry
+from pydantic_ai import Agent, ModelRetry, UnexpectedModelBehavior
 from pydantic_ai.models.openai import OpenAIModel
-from pydantic_ai.providers.deepseek import DeepSeekProvider
 from typing import List, Dict, Any, Optional
 import logging
 import re
 from collections import Counter
 import json
 import asyncio
+import random
+import threading
+import time
+from collections import deque
 from datetime import datetime
 
+from pydantic import ValidationError
+
 from app.core.config import settings
-from app.core.dependencies import PipelineDependencies
+from app.core.dependencies import PipelineDependencies, get_deepseek_provider
 from app.models.artist import LyricAnalysis, VideoMetadata
 
 logger = logging.getLogger(__name__)
 
-# Factory function for on-demand agent creation
-def create_lyrics_agent():
-    """Create lyrics agent on-demand to avoid import-time blocking"""
-    try:
-        return Agent(
-            model=OpenAIModel('deepseek-chat', provider=DeepSeekProvider()),
-            output_type=LyricAnalysis,  # Structured output for validation
-            system_prompt="""You are a music lyrics analyst specializing in:
+_LYRICS_SYSTEM_PROMPT = """You are a music lyrics analyst specializing in:
             1. Identifying themes and topics in song lyrics
             2. Analyzing emotional content and sentiment
             3. Categorizing lyrical style and techniques
@@ -39,11 +37,60 @@ def create_lyrics_agent():
             Return structured LyricAnalysis with sentiment_score (-1 to 1), themes list, and analysis metadata.
             Provide concise, insightful analysis suitable for music industry professionals.
             """
+
+# Factory function for on-demand agent creation
+def create_lyrics_agent():
+    """Create lyrics agent on-demand to avoid import-time blocking"""
+    try:
+        return Agent(
+            model=OpenAIModel('deepseek-chat', provider=get_deepseek_provider()),
+            output_type=LyricAnalysis,  # Structured output for validation
+            system_prompt=_LYRICS_SYSTEM_PROMPT
         )
     except Exception as e:
         logger.error(f"Failed to create lyrics agent: {e}")
         return None
 
+def create_lyrics_batch_agent():
+    """Create the agent that analyzes several songs' lyrics in one request"""
+    try:
+        return Agent(
+            model=OpenAIModel('deepseek-chat', provider=get_deepseek_provider()),
+            output_type=List[LyricAnalysis],
+            system_prompt=_LYRICS_SYSTEM_PROMPT
+        )
+    except Exception as e:
+        logger.error(f"Failed to create lyrics batch agent: {e}")
+        return None
+
+# Songs packed into one analysis request; past a handful the prompt gets long
+# enough that per-song quality and latency stop improving
+LYRICS_BATCH_SIZE = 4
+
+# Lyrics analysis requests allowed in flight at once per artist
+LYRICS_MAX_CONCURRENT_REQUESTS = 4
+
+# Retry policy: failures inside the window count against the budget; once it is
+# spent, callers stop retrying instead of sleeping against a dead upstream
+RETRY_FAILURE_BUDGET = 10
+RETRY_FAILURE_WINDOW = 60.0
+RETRY_MAX_DELAY = 30.0
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Best-effort detection of provider rate limiting from the error text"""
+    message = str(error).lower()
+    return 'rate_limit' in message or 'rate limit' in message or '429' in message
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before the next attempt, by error class"""
+    if isinstance(error, (UnexpectedModelBehavior, ValidationError)):
+        # Bad model output - waiting doesn't change anything
+        return 0.0
+    if _is_rate_limit_error(error):
+        # Jittered so concurrent callers don't retry in lockstep
+        return min(RETRY_MAX_DELAY, (2 ** attempt) * random.uniform(0.5, 1.5))
+    return min(RETRY_MAX_DELAY, float(2 ** attempt))
+
 def clean_lyrics(lyrics: str) -> str:
     """Clean and normalize lyrics text"""
     # Remove YouTube caption artifacts
@@ -68,17 +115,34 @@ class LyricsAnalysisAgent:
     def __init__(self):
         self._agent = None
         self._agent_creation_attempted = False
+        self._batch_agent = None
+        self._batch_agent_creation_attempted = False
+        self._agent_lock = threading.Lock()
         self._cache = {}  # Simple cache for analysis results
+        self._recent_failures = deque(maxlen=RETRY_FAILURE_BUDGET)  # Failure timestamps for the retry budget
         logger.info("LyricsAnalysisAgent initialized (agent created on-demand)")
     
     @property
     def agent(self):
         """Lazy initialization of agent"""
         if self._agent is None and not self._agent_creation_attempted:
-            self._agent_creation_attempted = True
-            self._agent = create_lyrics_agent()
+            with self._agent_lock:
+                # Re-check: another thread may have built it while we waited
+                if self._agent is None and not self._agent_creation_attempted:
+                    self._agent = create_lyrics_agent()
+                    self._agent_creation_attempted = True
         return self._agent
     
+    @property
+    def batch_agent(self):
+        """Lazy initialization of the multi-song agent"""
+        if self._batch_agent is None and not self._batch_agent_creation_attempted:
+            with self._agent_lock:
+                if self._batch_agent is None and not self._batch_agent_creation_attempted:
+                    self._batch_agent = create_lyrics_batch_agent()
+                    self._batch_agent_creation_attempted = True
+        return self._batch_agent
+    
     async def analyze_artist_lyrics(
         self,
         deps: PipelineDependencies,
@@ -90,6 +154,7 @@ class LyricsAnalysisAgent:
         logger.info(f"🎵 Analyzing lyrics for artist {artist_id} from {len(videos_with_captions)} videos")
         
         analyses = []
+        pending = []  # (video, cache_key) still needing analysis
         
         for video in videos_with_captions:
             if not video.get('captions'):
@@ -100,30 +165,76 @@ class LyricsAnalysisAgent:
                 logger.warning("Video missing ID, skipping")
                 continue
             
-            try:
-                # Check cache first
-                cache_key = f"lyrics:{video_id}"
-                if cache_key in self._cache:
-                    logger.info(f"📦 Using cached lyrics analysis for video {video_id}")
-                    analyses.append(self._cache[cache_key])
-                    continue
-                
-                # Analyze lyrics with retry logic
-                analysis = await self._analyze_video_lyrics_with_retry(
-                    deps, artist_id, video, max_retries=3
+            # Check cache first
+            cache_key = f"lyrics:{video_id}"
+            if cache_key in self._cache:
+                logger.info(f"📦 Using cached lyrics analysis for video {video_id}")
+                analyses.append(self._cache[cache_key])
+                continue
+            
+            pending.append((video, cache_key))
+        
+        # Analyze several songs per request, running independent requests
+        # concurrently up to the provider budget; anything a batch can't cover
+        # goes through the per-video path with retry logic
+        batches = [
+            pending[start:start + LYRICS_BATCH_SIZE]
+            for start in range(0, len(pending), LYRICS_BATCH_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(LYRICS_MAX_CONCURRENT_REQUESTS)
+        
+        async def analyze_video(video: Dict[str, Any], cleaned_lyrics: str) -> Optional[LyricAnalysis]:
+            async with semaphore:
+                return await self._analyze_video_lyrics_with_retry(
+                    deps, artist_id, video, max_retries=3, cleaned_lyrics=cleaned_lyrics
                 )
-                
-                if analysis:
+        
+        async def analyze_batch(batch: List[tuple]) -> List[Any]:
+            # Prepare each video's lyrics once; the batch request and any
+            # per-video fallback both use these
+            prepared = [await self._prepare_lyrics(video) for video, _ in batch]
+            
+            batch_analyses = None
+            if len(batch) > 1:
+                async with semaphore:
+                    batch_analyses = await self._analyze_lyrics_batch(
+                        deps, artist_id, [video for video, _ in batch], prepared
+                    )
+            batch_analyses = batch_analyses or [None] * len(batch)
+            
+            fallbacks = [
+                index for index, analysis in enumerate(batch_analyses)
+                if analysis is None and prepared[index]
+            ]
+            fallback_results = await asyncio.gather(
+                *(analyze_video(batch[index][0], prepared[index]) for index in fallbacks),
+                return_exceptions=True
+            )
+            results = list(batch_analyses)
+            for index, result in zip(fallbacks, fallback_results):
+                results[index] = result
+            return results
+        
+        batch_results = await asyncio.gather(
+            *(analyze_batch(batch) for batch in batches),
+            return_exceptions=True
+        )
+        
+        for batch, results in zip(batches, batch_results):
+            if isinstance(results, Exception):
+                results = [results] * len(batch)
+            
+            for (video, cache_key), analysis in zip(batch, results):
+                video_id = video.get('video_id') or video.get('id')
+                if isinstance(analysis, Exception):
+                    logger.error(f"❌ Failed to analyze lyrics for video {video_id}: {analysis}")
+                elif analysis:
                     analyses.append(analysis)
                     # Cache the result
                     self._cache[cache_key] = analysis
                     logger.info(f"✅ Lyrics analysis completed for video {video_id}")
                 else:
                     logger.warning(f"⚠️ No analysis result for video {video_id}")
-                    
-            except Exception as e:
-                logger.error(f"❌ Failed to analyze lyrics for video {video_id}: {e}")
-                continue
         
         logger.info(f"🎯 Completed lyrics analysis: {len(analyses)} successful analyses")
         return analyses
@@ -133,10 +244,55 @@ class LyricsAnalysisAgent:
         deps: PipelineDependencies,
         artist_id: str,
         video: Dict[str, Any],
-        max_retries: int = 3
+        max_retries: int = 3,
+        cleaned_lyrics: Optional[str] = None
     ) -> Optional[LyricAnalysis]:
         """Analyze video lyrics with retry logic and exponential backoff"""
         
+        video_id = video.get('video_id') or video.get('id')
+        if cleaned_lyrics is None:
+            cleaned_lyrics = await self._prepare_lyrics(video)
+        if not cleaned_lyrics:
+            return None
+        
+        # Attempt AI analysis with retries; its errors drive the backoff policy
+        if self.agent and settings.is_deepseek_configured():
+            for attempt in range(max_retries):
+                try:
+                    logger.info(f"🔄 Lyrics analysis attempt {attempt + 1} for video {video_id}")
+                    analysis = await self._ai_lyrics_analysis(
+                        deps, artist_id, video_id, cleaned_lyrics, video.get('title')
+                    )
+                    if analysis:
+                        return analysis
+                    break
+                    
+                except Exception as e:
+                    now = time.monotonic()
+                    self._recent_failures.append(now)
+                    
+                    if attempt == max_retries - 1:
+                        logger.error(f"❌ AI lyrics analysis failed after {max_retries} attempts for video {video_id}: {e}")
+                    elif (len(self._recent_failures) == RETRY_FAILURE_BUDGET and
+                          now - self._recent_failures[0] < RETRY_FAILURE_WINDOW):
+                        logger.error(f"❌ Retry budget exhausted ({RETRY_FAILURE_BUDGET} failures in {RETRY_FAILURE_WINDOW:.0f}s), giving up on AI analysis for video {video_id}: {e}")
+                        break
+                    else:
+                        wait_time = _retry_delay(e, attempt)
+                        logger.warning(f"⏳ Analysis attempt {attempt + 1} failed, retrying in {wait_time:.1f}s: {e}")
+                        if wait_time:
+                            await asyncio.sleep(wait_time)
+        
+        # Fallback to manual analysis
+        analysis = await self._manual_lyrics_analysis(
+            deps, artist_id, video_id, cleaned_lyrics, video.get('title')
+        )
+        if not analysis:
+            logger.warning(f"⚠️ Manual analysis returned no result for video {video_id}")
+        return analysis
+    
+    async def _prepare_lyrics(self, video: Dict[str, Any]) -> Optional[str]:
+        """Cleaned lyrics ready for analysis, or None if the video should be skipped"""
         video_id = video.get('video_id') or video.get('id')
         lyrics = video.get('captions', '')
         
@@ -157,38 +313,67 @@ class LyricsAnalysisAgent:
             logger.info(f"🌍 Skipping non-English content for video {video_id} (detected: {language})")
             return None
         
-        # Attempt analysis with retries
-        for attempt in range(max_retries):
-            try:
-                logger.info(f"🔄 Lyrics analysis attempt {attempt + 1} for video {video_id}")
-                
-                # Use AI agent if available
-                if self.agent and settings.is_deepseek_configured():
-                    analysis = await self._ai_lyrics_analysis(
-                        deps, artist_id, video_id, cleaned_lyrics, video.get('title')
-                    )
-                    if analysis:
-                        return analysis
-                
-                # Fallback to manual analysis
-                analysis = await self._manual_lyrics_analysis(
-                    deps, artist_id, video_id, cleaned_lyrics, video.get('title')
-                )
-                
-                if analysis:
-                    return analysis
-                else:
-                    logger.warning(f"⚠️ Manual analysis returned no result for video {video_id}")
-                
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    logger.error(f"❌ Lyrics analysis failed after {max_retries} attempts for video {video_id}: {e}")
-                else:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    logger.warning(f"⏳ Analysis attempt {attempt + 1} failed, retrying in {wait_time}s: {e}")
-                    await asyncio.sleep(wait_time)
+        return cleaned_lyrics
+    
+    async def _analyze_lyrics_batch(
+        self,
+        deps: PipelineDependencies,
+        artist_id: str,
+        videos: List[Dict[str, Any]],
+        prepared: List[Optional[str]]
+    ) -> Optional[List[Optional[LyricAnalysis]]]:
+        """
+        Analyze several videos' lyrics (prepared by _prepare_lyrics) in one AI request.
+        
+        Returns analyses aligned with videos (None where a video was skipped),
+        or None if the batch request failed or came back misaligned.
+        """
+        if not (self.batch_agent and settings.is_deepseek_configured()):
+            return None
         
-        return None
+        sections = [
+            (video, lyrics) for video, lyrics in zip(videos, prepared) if lyrics
+        ]
+        if len(sections) < 2:
+            return None
+        
+        song_blocks = []
+        for i, (video, lyrics) in enumerate(sections, 1):
+            title = video.get('title')
+            header = f'--- SONG {i} ---' + (f' ("{title}")' if title else '')
+            song_blocks.append(f"{header}\n{lyrics[:2000]}")
+        songs = "\n\n".join(song_blocks)
+        prompt = f"""Analyze the lyrics of each of these {len(sections)} songs:
+
+{songs}
+
+Return a JSON array with exactly one analysis per song, in the same order, covering themes, emotional content, sentiment, and lyrical style."""
+        
+        try:
+            result = await self.batch_agent.run(prompt, deps=deps)
+            batch_results = result.data if result and hasattr(result, 'data') else None
+        except Exception as e:
+            logger.warning(f"⚠️ Batch lyrics analysis failed, falling back to per-video analysis: {e}")
+            return None
+        
+        if not isinstance(batch_results, list) or len(batch_results) != len(sections):
+            logger.warning("⚠️ Batch lyrics analysis returned a misaligned result, falling back to per-video analysis")
+            return None
+        
+        by_video = {}
+        for (video, lyrics), analysis in zip(sections, batch_results):
+            analysis.artist_id = artist_id
+            analysis.video_id = video.get('video_id') or video.get('id')
+            analysis.language = "en"
+            analysis.analysis_metadata.update({
+                "analysis_method": "ai_powered_batch",
+                "lyrics_length": len(lyrics),
+                "analyzed_at": datetime.now().isoformat()
+            })
+            by_video[id(video)] = analysis
+        
+        logger.info(f"🎵 Batch analyzed lyrics for {len(sections)} videos in one request")
+        return [by_video.get(id(video)) for video in videos]
     
     async def _ai_lyrics_analysis(
         self,
@@ -198,34 +383,34 @@ class LyricsAnalysisAgent:
         lyrics: str,
         song_title: Optional[str] = None
     ) -> Optional[LyricAnalysis]:
-        """Use AI agent for intelligent lyrics analysis"""
-        try:
-            # Create analysis prompt
-            prompt = f"""Analyze these song lyrics{f' from "{song_title}"' if song_title else ''}:
+        """
+        Use AI agent for intelligent lyrics analysis.
+        
+        Provider and output errors propagate so the caller's retry policy sees them.
+        """
+        # Create analysis prompt
+        prompt = f"""Analyze these song lyrics{f' from "{song_title}"' if song_title else ''}:
 
 {lyrics[:2000]}  # Limit to avoid token overflow
 
 Provide detailed analysis of themes, emotional content, sentiment, and lyrical style."""
-            
-            # Let the agent process and structure the analysis
-            result = await self.agent.run(prompt, deps=deps)
-            
-            if result and hasattr(result, 'data'):
-                analysis = result.data
-                if isinstance(analysis, LyricAnalysis):
-                    # Set required fields
-                    analysis.artist_id = artist_id
-                    analysis.video_id = video_id
-                    analysis.language = "en"
-                    analysis.analysis_metadata.update({
-                        "analysis_method": "ai_powered",
-                        "lyrics_length": len(lyrics),
-                        "analyzed_at": datetime.now().isoformat()
-                    })
-                    return analysis
-            
-        except Exception as e:
-            logger.error(f"AI lyrics analysis error: {e}")
+        
+        # Let the agent process and structure the analysis
+        result = await self.agent.run(prompt, deps=deps)
+        
+        if result and hasattr(result, 'data'):
+            analysis = result.data
+            if isinstance(analysis, LyricAnalysis):
+                # Set required fields
+                analysis.artist_id = artist_id
+                analysis.video_id = video_id
+                analysis.language = "en"
+                analysis.analysis_metadata.update({
+                    "analysis_method": "ai_powered",
+                    "lyrics_length": len(lyrics),
+                    "analyzed_at": datetime.now().isoformat()
+                })
+                return analysis
         
         return None
     
@@ -362,8 +547,10 @@ Provide detailed analysis of themes, emotional content, sentiment, and lyrical s
     
     def _analyze_style(self, lyrics: str) -> str:
         """Analyze lyrical style"""
-        word_count = len(lyrics.split())
-        unique_words = len(set(lyrics.lower().split()))
+        # One tokenization serves both counts (lowercasing never changes word boundaries)
+        words = lyrics.lower().split()
+        word_count = len(words)
+        unique_words = len(set(words))
         
         # Calculate complexity metrics
         complexity_ratio = unique_words / word_count if word_count > 0 else 0
@@ -422,10 +609,19 @@ Provide detailed analysis of themes, emotional content, sentiment, and lyrical s
 
 # Global instance for backward compatibility (but now properly initialized)
 _lyrics_agent_instance = None
+_lyrics_agent_lock = threading.Lock()
 
 def get_lyrics_agent() -> LyricsAnalysisAgent:
     """Get global lyrics agent instance"""
     global _lyrics_agent_instance
     if _lyrics_agent_instance is None:
-        _lyrics_agent_instance = LyricsAnalysisAgent()
-    return _lyrics_agent_instance
\ No newline at end of file
+        with _lyrics_agent_lock:
+            if _lyrics_agent_instance is None:
+                _lyrics_agent_instance = LyricsAnalysisAgent()
+    return _lyrics_agent_instance
+
+def reset_lyrics_agent():
+    """Drop the global lyrics agent so its DeepSeek agents are rebuilt on next use"""
+    global _lyrics_agent_instance
+    with _lyrics_agent_lock:
+        _lyrics_agent_instance = None
\ No newline at end of file
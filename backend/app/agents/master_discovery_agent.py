@@ -17,29 +17,356 @@ Clean architecture connecting all existing agents properly.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import re
 import time
+from bisect import bisect_right
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from uuid import uuid4
 import urllib.parse
 
-from app.agents.crawl4ai_youtube_agent import Crawl4AIYouTubeAgent
+from crawl4ai import CrawlerRunConfig, CacheMode
+from crawl4ai.extraction_strategy import JsonCssExtractionStrategy
+
+from app.agents.crawl4ai_youtube_agent import Crawl4AIYouTubeAgent, HTML_ONLY_CONFIG
 from app.agents.crawl4ai_enrichment_agent import Crawl4AIEnrichmentAgent
 from app.core.dependencies import PipelineDependencies
 from app.models.artist import ArtistProfile
 from app.core.config import settings
 
 # AI imports for DeepSeek-powered data cleaning
-from app.agents.ai_data_cleaner import get_ai_cleaner, AIDataCleaner
+from app.agents.ai_data_cleaner import (
+    get_ai_cleaner, fast_clean_artist_name, AIDataCleaner, CleanedSocialLinks, _INVALID_ARTIST_TERMS
+)
+from app.clients.spotify_client import get_spotify_client
 
 # Enhanced logging
 from app.core.logging_config import get_progress_logger
 
 logger = logging.getLogger(__name__)
 
+
+def _stable_id(value: str) -> str:
+    """Deterministic short digest for session IDs (``hash()`` is salted per process)."""
+    return hashlib.blake2b(value.encode(), digest_size=8).hexdigest()
+
+
+# Faster decoding of structured extraction payloads when orjson is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Page extractors live at the backend root and may be absent from the import path
+try:
+    from enhanced_extractors import EnhancedYouTubeExtractor
+except ImportError:
+    EnhancedYouTubeExtractor = None
+
+# Common patterns for music video titles (ordered by specificity)
+_ARTIST_TITLE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    # Official video patterns
+    r'^([^-]+?)\s*-\s*[^-]+?\s*\(Official\s*(?:Music\s*)?Video\)',  # Artist - Song (Official Video)
+    r'^([^-]+?)\s*-\s*[^-]+?\s*\[Official\s*(?:Music\s*)?Video\]',  # Artist - Song [Official Video]
+    r'^([^-]+?)\s*-\s*[^-]+?\s*\|\s*Official\s*(?:Music\s*)?Video',  # Artist - Song | Official Video
+    
+    # Comma separated patterns
+    r'^([^,]+?),\s*([^,]+?)\s*-\s*([^,\(]+)',  # Artist1, Artist2 - Song
+    
+    # Basic separator patterns
+    r'^([^-]+?)\s*-\s*[^-]+$',  # Artist - Song
+    r'^([^|]+?)\s*\|\s*[^|]+$',  # Artist | Song
+    r'^([^:]+?):\s*[^:]+$',     # Artist: Song
+    
+    # Quote patterns
+    r'^(.+?)\s*["\']([^"\']+)["\']',  # Artist "Song"
+    
+    # By patterns
+    r'^(.+?)\s*(?:by|BY)\s+(.+?)(?:\s*\(|$)',  # Song by Artist
+    
+    # Parentheses patterns
+    r'^([^(]+?)\s*\([^)]*(?:official|music|video|mv)[^)]*\)',  # Artist (Official Video)
+    
+    # Last resort - take everything before common keywords
+    r'^([^(]+?)(?:\s*\((?:official|music|video|mv|lyric|audio))',  # Artist (keyword)
+]]
+
+_YEAR_ONLY_RE = re.compile(r'^\d{4}$')
+
+# Suffixes scrubbed from an extracted artist name. Each alternative truncates to the
+# end of the string, so one pass at the leftmost hit matches applying them in turn.
+_ARTIST_SUFFIX_RE = re.compile(
+    r'\s*(?:\((?:Official|Music|Video|HD|4K)\)|ft\.|feat\.|featuring|Official|Music|Video).*$',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _artist_match_key(name: str) -> str:
+    """Cleaned, lowercased artist name for fuzzy duplicate checks (stored names repeat every check)."""
+    return _ARTIST_SUFFIX_RE.sub('', name, count=1).strip().lower()
+
+
+# Featured artists and collaborations trailing the main artist
+_FEATURED_ARTIST_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'\s*(?:feat\.|featuring|ft\.)\s+.+$',  # feat. Artist, featuring Artist, ft. Artist
+    r'\s*(?:with|w/)\s+.+$',               # with Artist, w/ Artist
+    r'\s*(?:vs\.?|versus)\s+.+$',          # vs Artist, versus Artist
+    r'\s*(?:&|\+|and)\s+[A-Z].+$',        # & Artist, + Artist, and Artist (only if next word is capitalized)
+    r'\s*(?:x|X)\s+[A-Z].+$',             # x Artist, X Artist (collaborations)
+    r'\s*,\s*[A-Z].+$',                    # , Artist (comma separated)
+]]
+
+_TRAILING_SEPARATORS_RE = re.compile(r'[,\s]+$')
+
+# YouTube redirect links wrap the real target in the q= parameter
+_REDIRECT_URL_RE = re.compile(r'https://www\.youtube\.com/redirect\?[^"\s<>]*?&q=([^&"\s<>]+)', re.IGNORECASE)
+_DESCRIPTION_URL_RE = re.compile(r'https?://[^\s<>"]+|www\.[^\s<>"]+', re.IGNORECASE)
+
+# Social media platforms referenced in video descriptions
+_DESCRIPTION_PLATFORM_PATTERNS = {
+    platform: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for platform, patterns in {
+        'instagram': [
+            r'(?:https?://)?(?:www\.)?instagram\.com/([a-zA-Z0-9._]+)',
+            r'(?:https?://)?(?:www\.)?ig\.me/([a-zA-Z0-9._]+)',
+            r'@([a-zA-Z0-9._]+)(?:\s|$)'  # Handle @username mentions
+        ],
+        'tiktok': [
+            r'(?:https?://)?(?:www\.)?tiktok\.com/@([a-zA-Z0-9._]+)',
+            r'(?:https?://)?(?:vm\.)?tiktok\.com/([a-zA-Z0-9._]+)',
+            r'(?:https?://)?(?:www\.)?tiktok\.com/t/([a-zA-Z0-9._]+)'
+        ],
+        'spotify': [
+            r'(?:https?://)?(?:open\.)?spotify\.com/artist/([a-zA-Z0-9]+)',
+            r'(?:https?://)?(?:open\.)?spotify\.com/user/([a-zA-Z0-9._]+)',
+            r'(?:https?://)?(?:open\.)?spotify\.com/playlist/([a-zA-Z0-9]+)'
+        ],
+        'twitter': [
+            r'(?:https?://)?(?:www\.)?twitter\.com/([a-zA-Z0-9_]+)',
+            r'(?:https?://)?(?:www\.)?x\.com/([a-zA-Z0-9_]+)'
+        ],
+        'facebook': [
+            r'(?:https?://)?(?:www\.)?facebook\.com/([a-zA-Z0-9.]+)',
+            r'(?:https?://)?(?:www\.)?fb\.com/([a-zA-Z0-9.]+)'
+        ],
+        'youtube': [
+            r'(?:https?://)?(?:www\.)?youtube\.com/channel/([a-zA-Z0-9_-]+)',
+            r'(?:https?://)?(?:www\.)?youtube\.com/c/([a-zA-Z0-9_-]+)',
+            r'(?:https?://)?(?:www\.)?youtube\.com/@([a-zA-Z0-9_.-]+)',
+            r'(?:https?://)?(?:www\.)?youtu\.be/([a-zA-Z0-9_-]+)'
+        ],
+        'website': [
+            r'(?:https?://)?(?:www\.)?([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})(?:/[^\s]*)?'
+        ]
+    }.items()
+}
+
+# Canonical profile URL per platform, formatted with the captured username/ID
+_SOCIAL_URL_FMT = {
+    'instagram': 'https://www.instagram.com/{u}',
+    'tiktok': 'https://www.tiktok.com/@{u}',
+    'spotify': 'https://open.spotify.com/artist/{u}',
+    'twitter': 'https://twitter.com/{u}',
+    'facebook': 'https://www.facebook.com/{u}',
+}
+
+# Title indicators for legitimate music videos (matched against the casefolded title)
+_HIGH_QUALITY_TITLE_TERMS = (
+    "official music video",
+    "official video",
+    "official mv",
+    "official audio",
+    "official lyric video",
+    "official visualizer",
+)
+_SECONDARY_TITLE_TERMS = (
+    "music video",
+    "mv",
+    "video",
+    "lyric video",
+    "lyrics",
+    "visualizer",
+    "performance",
+    "live",
+)
+_NEGATIVE_TITLE_TERMS = (
+    "cover", "remix by", "reaction", "tutorial",
+    "how to", "instrumental", "karaoke", "mashup",
+)
+
+# Artist - Song, Artist | Song and Artist: Song title layouts
+_MUSIC_STRUCTURE_PATTERNS = [re.compile(p) for p in [
+    r'\w+\s*-\s*\w+',
+    r'\w+\s*\|\s*\w+',
+    r'\w+:\s*\w+',
+]]
+
+_SUBSCRIBER_COUNT_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'(\d+(?:\.\d+)?[KMB]?)\s*subscribers?',
+    r'"subscriberCountText":\{"runs":\[\{"text":"([^"]+)"\}',
+    r'"subscriberCount":(\d+)',
+    r'subscribers?["\s]*:\s*["\s]*(\d+(?:\.\d+)?[KMB]?)',
+]]
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+
+# Leading number and optional K/M/B suffix of a view or subscriber count text
+_COUNT_TEXT_RE = re.compile(r'([\d.]+)\s*(?:([KMB])\b)?', re.IGNORECASE)
+_COUNT_MULTIPLIERS = {'': 1.0, 'K': 1e3, 'M': 1e6, 'B': 1e9}
+
+# Spotify artist ID in an open.spotify.com URL
+_SPOTIFY_ARTIST_ID_RE = re.compile(r'/artist/([a-zA-Z0-9]+)')
+
+# Musixmatch page chrome stripped from scraped lyrics, applied in order
+_LYRICS_NOISE_PATTERNS = [
+    re.compile(r'Musixmatch.*?lyrics', re.IGNORECASE),
+    re.compile(r'You might also like.*?\n', re.IGNORECASE),
+    re.compile(r'\[.*?\]'),  # Annotations like [Verse 1]
+    re.compile(r'\(.*?\)'),  # Parenthetical notes
+]
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+# Keyword-frequency lyric theme fallback
+_LYRIC_THEME_KEYWORDS = {
+    'love_relationships': ['love', 'heart', 'baby', 'girl', 'boy', 'kiss', 'romance', 'together'],
+    'success_money': ['money', 'cash', 'rich', 'success', 'win', 'gold', 'diamond', 'fame'],
+    'party_lifestyle': ['party', 'dance', 'club', 'night', 'drink', 'fun', 'celebrate'],
+    'struggle_hardship': ['struggle', 'pain', 'hard', 'fight', 'difficult', 'broke', 'stress'],
+    'introspective': ['think', 'feel', 'mind', 'soul', 'memory', 'dream', 'hope'],
+    'social_issues': ['world', 'people', 'society', 'change', 'justice', 'freedom', 'peace']
+}
+_LYRIC_THEME_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(k) for keywords in _LYRIC_THEME_KEYWORDS.values() for k in keywords) + '))'
+)
+_LYRIC_THEME_DESCRIPTIONS = {
+    'love_relationships': 'Focuses on love, relationships, and romantic connections',
+    'success_money': 'Emphasizes success, wealth, and material achievement',
+    'party_lifestyle': 'Centers around party culture, nightlife, and celebration',
+    'struggle_hardship': 'Explores personal struggles, hardships, and overcoming challenges',
+    'introspective': 'Reflects on personal thoughts, emotions, and inner experiences',
+    'social_issues': 'Addresses social themes, community, and broader world issues'
+}
+
+# Discovery score tiers: (ascending follower thresholds, points), where any
+# positive count below the first threshold earns points[0]
+_YOUTUBE_SUBSCRIBER_TIERS = ((50, 100, 500, 1000, 5000, 10000, 25000, 50000), (1, 3, 5, 8, 12, 15, 18, 22, 25))
+_SPOTIFY_LISTENER_TIERS = ((100, 500, 1000, 5000, 10000, 25000, 50000, 100000), (1, 3, 5, 8, 12, 15, 18, 22, 25))
+_INSTAGRAM_FOLLOWER_TIERS = ((100, 500, 1000, 5000, 10000, 25000, 50000, 100000), (1, 2, 4, 6, 9, 12, 14, 17, 20))
+_TIKTOK_FOLLOWER_TIERS = ((100, 500, 1000, 5000, 10000, 25000, 50000, 100000), (1, 2, 3, 5, 7, 9, 11, 13, 15))
+
+
+def _tiered_score(value, thresholds, points) -> int:
+    """Points for the highest threshold reached, via one bisect instead of an elif ladder."""
+    if value <= 0:
+        return 0
+    return points[bisect_right(thresholds, value)]
+
+
+# Social platform by domain, for links already pulled out of a channel page
+_SOCIAL_DOMAIN_RE = re.compile(
+    r'(?P<instagram>instagram\.com)|(?P<twitter>twitter\.com|x\.com)|(?P<tiktok>tiktok\.com)'
+    r'|(?P<spotify>spotify\.com)|(?P<facebook>facebook\.com)'
+)
+
+# Profile usernames checked by social link validation
+_INSTAGRAM_USERNAME_RE = re.compile(r'instagram\.com/([a-zA-Z0-9._]+)')
+_TIKTOK_USERNAME_RE = re.compile(r'tiktok\.com/@([a-zA-Z0-9._]+)')
+_INVALID_INSTAGRAM_USERNAMES = frozenset(['home', 'explore', 'accounts', 'about', 'privacy', 'terms', 'help'])
+_NON_WEBSITE_DOMAINS = ('youtube.com', 'instagram.com', 'tiktok.com', 'spotify.com')
+
+# Quoted social URLs in channel HTML, one named group per platform so a single
+# finditer pass replaces a findall per platform and pattern
+_SOCIAL_HTML_PLATFORMS = ('instagram', 'twitter', 'tiktok', 'spotify', 'facebook')
+_SOCIAL_HTML_LINK_RE = re.compile(
+    r'(?P<href>href=)?"(?:'
+    r'(?P<instagram>https?://(?:www\.)?instagram\.com/[^"]+)|'
+    r'(?P<twitter>https?://(?:www\.)?(?:twitter|x)\.com/[^"]+)|'
+    r'(?P<tiktok>https?://(?:www\.)?tiktok\.com/[^"]+)|'
+    r'(?P<spotify>https?://open\.spotify\.com/artist/[^"]+)|'
+    r'(?P<facebook>https?://(?:www\.)?facebook\.com/[^"]+)'
+    r')"',
+    re.IGNORECASE
+)
+
+# Social media links embedded in YouTube channel About page HTML
+_CHANNEL_HTML_PATTERNS = {
+    platform: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for platform, patterns in {
+        'instagram': [
+            r'(?:https?://)?(?:www\.)?instagram\.com/([a-zA-Z0-9_.]+)/?',
+            r'"instagram"[^"]*"([^"]*instagram\.com/[a-zA-Z0-9_.]+)"',
+            r'instagram\.com/([a-zA-Z0-9_.]+)',
+        ],
+        'tiktok': [
+            r'(?:https?://)?(?:www\.)?tiktok\.com/@([a-zA-Z0-9_.]+)/?',
+            r'"tiktok"[^"]*"([^"]*tiktok\.com/@[a-zA-Z0-9_.]+)"',
+            r'tiktok\.com/@([a-zA-Z0-9_.]+)',
+        ],
+        'spotify': [
+            r'(?:https?://)?open\.spotify\.com/artist/([a-zA-Z0-9]+)',
+            r'"spotify"[^"]*"([^"]*spotify\.com/artist/[a-zA-Z0-9]+)"',
+            r'spotify\.com/artist/([a-zA-Z0-9]+)',
+        ],
+        'twitter': [
+            r'(?:https?://)?(?:www\.)?(?:twitter\.com|x\.com)/([a-zA-Z0-9_]+)/?',
+            r'"twitter"[^"]*"([^"]*(?:twitter\.com|x\.com)/[a-zA-Z0-9_]+)"',
+            r'(?:twitter\.com|x\.com)/([a-zA-Z0-9_]+)',
+        ],
+        'facebook': [
+            r'(?:https?://)?(?:www\.)?facebook\.com/([a-zA-Z0-9_.]+)/?',
+            r'"facebook"[^"]*"([^"]*facebook\.com/[a-zA-Z0-9_.]+)"',
+            r'facebook\.com/([a-zA-Z0-9_.]+)',
+        ],
+    }.items()
+}
+
+# Profile URL for a handle captured by _CHANNEL_HTML_PATTERNS, or None to keep looking
+_CHANNEL_LINK_BUILDERS = {
+    'instagram': lambda handle: f"https://instagram.com/{handle}" if len(handle) > 1 and '.' not in handle[-3:] else None,
+    'tiktok': lambda handle: f"https://tiktok.com/@{handle}" if len(handle) > 1 else None,
+    'spotify': lambda handle: f"https://open.spotify.com/artist/{handle}" if len(handle) == 22 else None,  # Spotify artist ID length
+    'twitter': lambda handle: f"https://twitter.com/{handle}" if len(handle) > 1 and handle not in ('home', 'login', 'signup', 'explore') else None,
+    'facebook': lambda handle: f"https://facebook.com/{handle}" if len(handle) > 1 and handle not in ('login', 'home', 'pages') else None,
+}
+
+# Enhanced schema for YouTube channel extraction (static, so the strategy is built once)
+_YOUTUBE_CHANNEL_SCHEMA = {
+    "name": "YouTube Channel",
+    "baseSelector": "body",  # Add required baseSelector
+    "fields": [
+        {
+            "name": "subscriber_count_text",
+            "selector": "[data-testid='subscriber-count'], .subscriber-count, #subscriber-count, .yt-subscription-button-subscriber-count-branded-horizontal, .style-scope.ytd-c4-tabbed-header-renderer",
+            "type": "text"
+        },
+        {
+            "name": "channel_description",
+            "selector": "[data-testid='channel-description'], .channel-description, .about-description, .yt-formatted-string",
+            "type": "text"
+        },
+        {
+            "name": "verified_badge",
+            "selector": "[data-testid='verified-badge'], .verified-badge, .yt-icon-badge",
+            "type": "text"
+        },
+        {
+            "name": "social_links",
+            "selector": "a[href*='instagram.com'], a[href*='twitter.com'], a[href*='tiktok.com'], a[href*='spotify.com'], a[href*='facebook.com']",
+            "type": "list",
+            "attribute": "href"
+        }
+    ]
+}
+
+# English letters, numbers, spaces, and common punctuation
+_ENGLISH_TEXT_RE = re.compile(r'^[a-zA-Z0-9\s\-\.\,\!\?\(\)\[\]\&\'\"]+$')
+
 class MasterDiscoveryAgent:
     """
     Master agent that orchestrates the complete music discovery workflow.
@@ -53,6 +380,9 @@ class MasterDiscoveryAgent:
         # Initialize AI data cleaner
         self.ai_cleaner = get_ai_cleaner()
         
+        # Social discovery / channel extraction agent, created on first use
+        self._crawl4ai_agent = None
+        
         # Configuration
         self.exclude_keywords = [
             'ai', 'suno', 'generated', 'udio', 'cover', 'remix', 'remastered',
@@ -71,6 +401,21 @@ class MasterDiscoveryAgent:
         
         self.max_results = 1000
         self.max_view_count = 50000  # 50k view limit
+        self.artist_concurrency = 3  # Each artist opens several browsers, keep this small
+        
+        # Channel crawl config is identical for every channel, so build the
+        # extraction strategy (and its compiled selectors) once
+        self._channel_crawler_config = CrawlerRunConfig(
+            **HTML_ONLY_CONFIG,
+            cache_mode=CacheMode.BYPASS,
+            extraction_strategy=JsonCssExtractionStrategy(_YOUTUBE_CHANNEL_SCHEMA),
+            wait_until="domcontentloaded",
+            page_timeout=30000,  # 30 second timeout
+            delay_before_return_html=3.0,
+            # Header fields and links render without scrolling; a full-page scan
+            # only adds scroll time
+            verbose=logger.isEnabledFor(logging.DEBUG)
+        )
         
         logger.info("✅ Master Discovery Agent initialized")
     
@@ -91,17 +436,17 @@ class MasterDiscoveryAgent:
         Returns:
             Dictionary with discovery results and metadata
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         logger.info(f"🎵 Starting master discovery workflow (max_results: {max_results})")
         
         try:
             # Phase 1: YouTube Video Discovery with Infinite Scroll
             logger.info("📺 Phase 1: YouTube video discovery with infinite scroll")
-            phase1_start = time.time()
+            phase1_start = time.perf_counter()
             
             processed_videos = await self._search_and_filter_videos_with_infinite_scroll(deps, search_query)
             
-            phase1_time = time.time() - phase1_start
+            phase1_time = time.perf_counter() - phase1_start
             logger.info(f"✅ Phase 1 complete in {phase1_time:.1f}s", extra={'operation_time': phase1_time})
             
             if not processed_videos:
@@ -111,41 +456,51 @@ class MasterDiscoveryAgent:
             
             # Phase 2: Artist Processing Pipeline
             logger.info("🎤 Phase 2: Artist processing pipeline")
-            phase2_start = time.time()
-            
-            discovered_artists = []
-            total_processed = 0
+            phase2_start = time.perf_counter()
             
             # Create progress logger for artist processing
             progress_logger = get_progress_logger('app.agents.master_discovery_agent', min(len(processed_videos), max_results))
             
-            for i, video_data in enumerate(processed_videos[:max_results], 1):
-                try:
-                    artist_start = time.time()
+            # Process artists concurrently, bounded so we don't launch too many browsers at once
+            semaphore = asyncio.Semaphore(self.artist_concurrency)
+            
+            async def process_with_limit(i: int, video_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    artist_start = time.perf_counter()
                     progress_logger.step(f"Processing artist {i}: {video_data.get('extracted_artist_name', 'Unknown')}")
                     
                     artist_result = await self._process_single_artist(deps, video_data)
                     
-                    artist_time = time.time() - artist_start
+                    artist_time = time.perf_counter() - artist_start
                     
                     if artist_result and artist_result.get('success'):
-                        discovered_artists.append(artist_result)
                         progress_logger.step(f"✅ Artist {i} processed successfully: {artist_result.get('name')} ⏱️ {artist_time:.1f}s")
                     else:
                         progress_logger.error(f"⚠️ Artist {i} processing failed or filtered out ⏱️ {artist_time:.1f}s")
                     
-                    total_processed += 1
-                    
                     # Rate limiting
                     await asyncio.sleep(0.5)  # Reduced from 1.0s
                     
-                except Exception as e:
-                    progress_logger.error(f"❌ Error processing artist {i}: {e}")
-                    continue
+                    return artist_result
+            
+            results = await asyncio.gather(
+                *(process_with_limit(i, video_data) for i, video_data in enumerate(processed_videos[:max_results], 1)),
+                return_exceptions=True
+            )
+            
+            failures = [(i, r) for i, r in enumerate(results, 1) if isinstance(r, Exception)]
+            for i, error in failures:
+                progress_logger.error(f"❌ Error processing artist {i}: {error}")
+            
+            total_processed = len(results) - len(failures)
+            discovered_artists = [
+                r for r in results
+                if r and not isinstance(r, Exception) and r.get('success')
+            ]
             
             # Phase 3: Final Results
-            phase2_time = time.time() - phase2_start
-            execution_time = time.time() - start_time
+            phase2_time = time.perf_counter() - phase2_start
+            execution_time = time.perf_counter() - start_time
             
             logger.info(f"✅ Phase 2 complete in {phase2_time:.1f}s", extra={'operation_time': phase2_time})
             logger.info(f"🎉 Discovery complete! Found {len(discovered_artists)} artists in {execution_time:.2f}s")
@@ -179,7 +534,7 @@ class MasterDiscoveryAgent:
                     'artists': [],
                     'total_processed': 0,
                     'total_found': 0,
-                    'execution_time': time.time() - start_time,
+                    'execution_time': time.perf_counter() - start_time,
                     'error': str(e)
                 }
             }
@@ -202,17 +557,17 @@ class MasterDiscoveryAgent:
         Returns:
             List of processed videos that passed all filters
         """
-        filter_start_time = time.time()
+        filter_start_time = time.perf_counter()
         logger.info(f"🔄 Starting infinite scroll search - target: {target_filtered_videos} filtered videos")
         
         try:
             # YouTube infinite scroll search
             logger.info(f"🔍 Performing infinite scroll search for: '{search_query}'")
-            scroll_start = time.time()
+            scroll_start = time.perf_counter()
             
             search_result = await self.youtube_agent.search_videos_with_infinite_scroll(search_query)
             
-            scroll_time = time.time() - scroll_start
+            scroll_time = time.perf_counter() - scroll_start
             
             if not search_result.success:
                 logger.error(f"❌ Infinite scroll search failed: {search_result.error_message}")
@@ -245,15 +600,34 @@ class MasterDiscoveryAgent:
             }
             
             logger.info(f"🔍 Processing and filtering {len(videos)} videos...")
-            filter_process_start = time.time()
+            filter_process_start = time.perf_counter()
             
             processed_videos = []
             
+            # Parse every view count up front in one pass
+            parsed_view_counts = self._parse_view_counts_batch(
+                [getattr(video, 'view_count', None) for video in videos]
+            )
+            
+            # Validate titles and clean artist names for the whole page up front, so
+            # AI cleaning is packed into batched requests instead of one per title
+            passes_title_filter = [
+                self._validate_title_contains_search_terms(getattr(video, 'title', 'Unknown'), getattr(video, '_norm_title', None))
+                for video in videos
+            ]
+            title_filtered_indices = [index for index, passed in enumerate(passes_title_filter) if passed]
+            cleaned_artist_names = dict(zip(
+                title_filtered_indices,
+                await self._extract_and_clean_artist_names(
+                    [getattr(videos[index], 'title', 'Unknown') for index in title_filtered_indices]
+                )
+            ))
+            
             # Create progress logger for filtering
             progress_logger = get_progress_logger('app.agents.master_discovery_agent.filtering', len(videos))
             
             for i, video in enumerate(videos, 1):
-                video_start_time = time.time()
+                video_start_time = time.perf_counter()
                 video_title = getattr(video, 'title', 'Unknown')
                 video_id = getattr(video, 'video_id', 'Unknown')
                 
@@ -261,63 +635,63 @@ class MasterDiscoveryAgent:
                     progress_logger.debug(f"🔍 Processing video {i}: '{video_title[:50]}...'")
                     
                     # Step 1: Title validation
-                    step_start = time.time()
-                    if not self._validate_title_contains_search_terms(video_title):
-                        step_time = time.time() - step_start
+                    step_start = time.perf_counter()
+                    if not passes_title_filter[i - 1]:
+                        step_time = time.perf_counter() - step_start
                         progress_logger.debug(f"❌ Video {i} failed title filter ⏱️ {step_time:.3f}s")
                         logger.info(f"DEBUG: Video '{video_title}' failed title validation")
                         continue
                     
                     stats['passed_title_filter'] += 1
-                    step_time = time.time() - step_start
+                    step_time = time.perf_counter() - step_start
                     progress_logger.debug(f"✅ Video {i} passed title filter ⏱️ {step_time:.3f}s")
                     
                     # Step 2: Artist name extraction and cleaning
-                    step_start = time.time()
-                    artist_name = await self._extract_and_clean_artist_name(video_title)
+                    step_start = time.perf_counter()
+                    artist_name = cleaned_artist_names[i - 1]
                     
                     if not artist_name:
-                        step_time = time.time() - step_start
+                        step_time = time.perf_counter() - step_start
                         progress_logger.debug(f"❌ Video {i} failed artist extraction ⏱️ {step_time:.3f}s")
                         continue
                         
                     stats['passed_artist_extraction'] += 1
-                    step_time = time.time() - step_start
+                    step_time = time.perf_counter() - step_start
                     progress_logger.debug(f"✅ Video {i} extracted artist: '{artist_name}' ⏱️ {step_time:.3f}s")
                     
                     # Step 3: Database duplicate checks
-                    step_start = time.time()
+                    step_start = time.perf_counter()
                     if await self._artist_exists_in_database(deps, artist_name):
-                        step_time = time.time() - step_start
+                        step_time = time.perf_counter() - step_start
                         progress_logger.debug(f"⏭️ Video {i} skipped - artist '{artist_name}' already exists ⏱️ {step_time:.3f}s")
                         continue
                     
                     if await self._video_exists_in_database(deps, getattr(video, 'url', '')):
-                        step_time = time.time() - step_start
+                        step_time = time.perf_counter() - step_start
                         progress_logger.debug(f"⏭️ Video {i} skipped - video already processed ⏱️ {step_time:.3f}s")
                         continue
                         
                     stats['passed_database_checks'] += 1
-                    step_time = time.time() - step_start
+                    step_time = time.perf_counter() - step_start
                     progress_logger.debug(f"✅ Video {i} passed database checks ⏱️ {step_time:.3f}s")
                     
                     # Step 4: View count filtering  
-                    step_start = time.time()
-                    view_count = getattr(video, 'view_count', 0)
+                    step_start = time.perf_counter()
+                    view_count = parsed_view_counts[i - 1]
                     if not self._validate_view_count(view_count):
-                        step_time = time.time() - step_start
+                        step_time = time.perf_counter() - step_start
                         progress_logger.debug(f"❌ Video {i} failed view count filter ({view_count:,} views) ⏱️ {step_time:.3f}s")
                         continue
                     
                     # Step 5: English language validation
                     if not self._validate_english_language(artist_name):
-                        step_time = time.time() - step_start
+                        step_time = time.perf_counter() - step_start
                         progress_logger.debug(f"❌ Video {i} failed English validation ⏱️ {step_time:.3f}s")
                         continue
                     
                     # Step 6: Well-known artist check
                     if self._is_well_known_artist(artist_name):
-                        step_time = time.time() - step_start
+                        step_time = time.perf_counter() - step_start
                         progress_logger.debug(f"❌ Video {i} filtered - well-known artist '{artist_name}' ⏱️ {step_time:.3f}s")
                         continue
 
@@ -338,16 +712,16 @@ class MasterDiscoveryAgent:
                             progress_logger.debug(f"⚠️ Video {i} error getting full description: {e}")
                     
                     if not self._validate_content(video_title, description):
-                        step_time = time.time() - step_start
+                        step_time = time.perf_counter() - step_start
                         progress_logger.debug(f"❌ Video {i} failed content validation ⏱️ {step_time:.3f}s")
                         continue
                         
                     stats['passed_content_validation'] += 1
-                    step_time = time.time() - step_start
+                    step_time = time.perf_counter() - step_start
                     progress_logger.debug(f"✅ Video {i} passed all validation checks ⏱️ {step_time:.3f}s")
                     
                     # Step 8: Social media link extraction (NOW WITH FULL DESCRIPTIONS)
-                    step_start = time.time()
+                    step_start = time.perf_counter()
                     progress_logger.debug(f"🔍 Video {i} extracting social links from full description ({len(description)} chars)...")
                     
                     raw_social_links = self._extract_social_links_from_description(description)
@@ -360,7 +734,7 @@ class MasterDiscoveryAgent:
                         has_required_social = any(getattr(social_links, platform, None) for platform in ['spotify', 'instagram', 'tiktok'])
                         if has_required_social:
                             stats['found_social_in_description'] += 1
-                            social_extraction_time = time.time() - step_start
+                            social_extraction_time = time.perf_counter() - step_start
                             progress_logger.debug(f"✅ Video {i} found social links in description: {[p for p in ['spotify', 'instagram', 'tiktok'] if getattr(social_links, p, None)]} ⏱️ {social_extraction_time:.3f}s")
                     
                     if not has_required_social:
@@ -391,12 +765,12 @@ class MasterDiscoveryAgent:
                     
                     # Final check: STRICT social media requirement
                     if not has_required_social:
-                        step_time = time.time() - step_start
+                        step_time = time.perf_counter() - step_start
                         progress_logger.debug(f"❌ Video {i} REJECTED - no required social links (Instagram, TikTok, Spotify) ⏱️ {step_time:.3f}s")
                         stats['failed_social_requirement'] += 1
                         continue  # Skip videos without required social links
                     
-                    step_time = time.time() - step_start
+                    step_time = time.perf_counter() - step_start
                     
                     cleaned_links_dict = {
                         k: v for k, v in {
@@ -410,7 +784,7 @@ class MasterDiscoveryAgent:
                         }.items() if v
                     }
                     
-                    video_total_time = time.time() - video_start_time
+                    video_total_time = time.perf_counter() - video_start_time
                     progress_logger.step(f"✅ Video {i} PASSED ALL FILTERS: '{artist_name}' has social links ({social_source}): {list(cleaned_links_dict.keys())} ⏱️ Total: {video_total_time:.3f}s")
                     
                     # Convert video dataclass to dict and add processed data
@@ -440,13 +814,13 @@ class MasterDiscoveryAgent:
                         break
                     
                 except Exception as e:
-                    video_time = time.time() - video_start_time
+                    video_time = time.perf_counter() - video_start_time
                     progress_logger.error(f"❌ Video {i} processing error: {e} ⏱️ {video_time:.3f}s")
                     continue
             
             # Log comprehensive filtering statistics
-            filter_process_time = time.time() - filter_process_start
-            total_time = time.time() - filter_start_time
+            filter_process_time = time.perf_counter() - filter_process_start
+            total_time = time.perf_counter() - filter_start_time
             
             logger.info(f"📊 FILTERING STATISTICS SUMMARY:")
             logger.info(f"   🎬 Total videos scraped: {stats['total_videos']}")
@@ -486,40 +860,48 @@ class MasterDiscoveryAgent:
             # Step 1: Create basic artist profile
             artist_profile = self._create_artist_profile(video_data)
             
-            # Step 2: Crawl YouTube channel for additional data
-            youtube_data = await self._crawl_youtube_channel(video_data)
-            
-            # Step 3: Multi-platform enrichment using Crawl4AI enrichment agent
-            # Merge any social links found from YouTube channel crawling
-            if youtube_data.get('social_links_from_channel'):
-                for platform, url in youtube_data['social_links_from_channel'].items():
-                    if platform not in artist_profile.social_links:
-                        artist_profile.social_links[platform] = url
-                        logger.info(f"🔗 Added {platform} link from YouTube channel: {url}")
+            # The Spotify API lookup (Step 4) only needs the name, so start it
+            # now and let it overlap the channel crawl and enrichment
+            spotify_api_task = asyncio.create_task(self._get_spotify_api_data(artist_profile.name))
             
-            enriched_data = await self.enrichment_agent.enrich_artist(artist_profile)
-            
-            # Step 3.5: Enhanced social media discovery if initial enrichment failed
-            if (not enriched_data.profile.social_links.get('instagram') and 
-                not enriched_data.profile.social_links.get('tiktok') and
-                video_data.get('url')):
-                logger.info(f"🔍 Initial enrichment found limited social links, trying enhanced discovery for: {artist_name}")
-                try:
-                    from app.agents.crawl4ai_agent import Crawl4AIAgent
-                    enhanced_agent = Crawl4AIAgent()
-                    enhanced_results = await enhanced_agent.discover_artist_social_profiles(artist_name, video_data['url'])
-                    
-                    # Merge enhanced results with existing data
-                    for platform, url in enhanced_results.get('profiles', {}).items():
-                        if url and not enriched_data.profile.social_links.get(platform):
-                            enriched_data.profile.social_links[platform] = url
-                            logger.info(f"✅ Enhanced discovery found {platform}: {url}")
-                            
-                except Exception as e:
-                    logger.warning(f"⚠️ Enhanced social media discovery failed: {e}")
-            
-            # Step 4: Spotify API integration for additional data
-            spotify_api_data = await self._get_spotify_api_data(artist_profile.name)
+            try:
+                # Step 2: Crawl YouTube channel for additional data
+                youtube_data = await self._crawl_youtube_channel(video_data)
+                
+                # Step 3: Multi-platform enrichment using Crawl4AI enrichment agent
+                # Merge any social links found from YouTube channel crawling
+                if youtube_data.get('social_links_from_channel'):
+                    for platform, url in youtube_data['social_links_from_channel'].items():
+                        if platform not in artist_profile.social_links:
+                            artist_profile.social_links[platform] = url
+                            logger.info(f"🔗 Added {platform} link from YouTube channel: {url}")
+                
+                enriched_data = await self.enrichment_agent.enrich_artist(artist_profile)
+                
+                # Step 3.5: Enhanced social media discovery if initial enrichment failed
+                if (not enriched_data.profile.social_links.get('instagram') and 
+                    not enriched_data.profile.social_links.get('tiktok') and
+                    video_data.get('url')):
+                    logger.info(f"🔍 Initial enrichment found limited social links, trying enhanced discovery for: {artist_name}")
+                    try:
+                        enhanced_agent = self._get_crawl4ai_agent()
+                        enhanced_results = await enhanced_agent.discover_artist_social_profiles(artist_name, video_data['url'])
+                        
+                        # Merge enhanced results with existing data
+                        for platform, url in enhanced_results.get('profiles', {}).items():
+                            if url and not enriched_data.profile.social_links.get(platform):
+                                enriched_data.profile.social_links[platform] = url
+                                logger.info(f"✅ Enhanced discovery found {platform}: {url}")
+                                
+                    except Exception as e:
+                        logger.warning(f"⚠️ Enhanced social media discovery failed: {e}")
+                
+                # Step 4: Spotify API integration for additional data
+                spotify_api_data = await spotify_api_task
+            finally:
+                # Don't orphan the lookup if the crawl or enrichment raised
+                spotify_api_task.cancel()
+                await asyncio.gather(spotify_api_task, return_exceptions=True)
             
             # Step 4.5: Merge Spotify API data into enriched_data
             if spotify_api_data:
@@ -535,11 +917,10 @@ class MasterDiscoveryAgent:
                         logger.info(f"✅ Added Spotify genres: {spotify_api_data['genres']}")
                     else:
                         # Merge unique genres from both sources
-                        current_genres = set(enriched_data.profile.genres)
-                        spotify_genres = set(spotify_api_data['genres'])
-                        merged_genres = list(current_genres.union(spotify_genres))
+                        current_genres = enriched_data.profile.genres
+                        merged_genres = list(dict.fromkeys(current_genres + spotify_api_data['genres']))
                         enriched_data.profile.genres = merged_genres
-                        logger.info(f"✅ Merged genres - Total: {len(merged_genres)}, Added from Spotify: {list(spotify_genres - current_genres)}")
+                        logger.info(f"✅ Merged genres - Total: {len(merged_genres)}, Added from Spotify: {merged_genres[len(set(current_genres)):]}")
                 
                 # Store Spotify API data in metadata for database storage
                 if not enriched_data.profile.metadata:
@@ -591,6 +972,13 @@ class MasterDiscoveryAgent:
             logger.error(f"❌ Error processing artist {artist_name}: {e}")
             return None
     
+    def _get_crawl4ai_agent(self):
+        """Return the shared Crawl4AIAgent, building it on first use."""
+        if self._crawl4ai_agent is None:
+            from app.agents.crawl4ai_agent import get_crawl4ai_agent
+            self._crawl4ai_agent = get_crawl4ai_agent()
+        return self._crawl4ai_agent
+    
     def _extract_artist_name(self, title: str) -> Optional[str]:
         """
         Extract artist name from video title using comprehensive patterns.
@@ -602,38 +990,11 @@ class MasterDiscoveryAgent:
         # Log the title being processed for debugging
         logger.debug(f"🎯 Extracting artist from title: '{title}'")
         
-        # Common patterns for music video titles (ordered by specificity)
-        patterns = [
-            # Official video patterns
-            r'^([^-]+?)\s*-\s*[^-]+?\s*\(Official\s*(?:Music\s*)?Video\)',  # Artist - Song (Official Video)
-            r'^([^-]+?)\s*-\s*[^-]+?\s*\[Official\s*(?:Music\s*)?Video\]',  # Artist - Song [Official Video]
-            r'^([^-]+?)\s*-\s*[^-]+?\s*\|\s*Official\s*(?:Music\s*)?Video',  # Artist - Song | Official Video
-            
-            # Comma separated patterns
-            r'^([^,]+?),\s*([^,]+?)\s*-\s*([^,\(]+)',  # Artist1, Artist2 - Song
-            
-            # Basic separator patterns
-            r'^([^-]+?)\s*-\s*[^-]+$',  # Artist - Song
-            r'^([^|]+?)\s*\|\s*[^|]+$',  # Artist | Song
-            r'^([^:]+?):\s*[^:]+$',     # Artist: Song
-            
-            # Quote patterns
-            r'^(.+?)\s*["\']([^"\']+)["\']',  # Artist "Song"
-            
-            # By patterns
-            r'^(.+?)\s*(?:by|BY)\s+(.+?)(?:\s*\(|$)',  # Song by Artist
-            
-            # Parentheses patterns
-            r'^([^(]+?)\s*\([^)]*(?:official|music|video|mv)[^)]*\)',  # Artist (Official Video)
-            
-            # Last resort - take everything before common keywords
-            r'^([^(]+?)(?:\s*\((?:official|music|video|mv|lyric|audio))',  # Artist (keyword)
-        ]
-        
-        for i, pattern in enumerate(patterns):
-            match = re.search(pattern, title.strip(), re.IGNORECASE)
+        stripped_title = title.strip()
+        for i, pattern in enumerate(_ARTIST_TITLE_PATTERNS):
+            match = pattern.search(stripped_title)
             if match:
-                logger.debug(f"🎯 Pattern {i+1} matched: {pattern}")
+                logger.debug(f"🎯 Pattern {i+1} matched: {pattern.pattern}")
                 # Try both groups for patterns with multiple captures
                 for group_idx in [1, 2]:
                     try:
@@ -669,17 +1030,8 @@ class MasterDiscoveryAgent:
         
         name_lower = name.lower().strip()
         
-        # Common non-artist terms
-        invalid_terms = [
-            'official', 'music', 'video', 'audio', 'lyric', 'lyrics',
-            'feat', 'featuring', 'ft', 'remix', 'cover', 'live',
-            'new', 'latest', 'best', 'top', 'album', 'single',
-            'song', 'track', 'ep', 'mixtape', 'full', 'hd', 'hq',
-            'youtube', 'vevo', 'records', 'entertainment'
-        ]
-        
         # Check if the name is just common terms
-        if name_lower in invalid_terms:
+        if name_lower in _INVALID_ARTIST_TERMS:
             return False
         
         # Check for excessive length
@@ -687,7 +1039,7 @@ class MasterDiscoveryAgent:
             return False
         
         # Check for numbers/years that suggest it's not an artist name
-        if re.match(r'^\d{4}$', name.strip()):  # Just a year
+        if _YEAR_ONLY_RE.match(name.strip()):  # Just a year
             return False
         
         return True
@@ -697,11 +1049,7 @@ class MasterDiscoveryAgent:
         Clean and normalize artist name.
         """
         # Remove common prefixes/suffixes
-        name = re.sub(r'\s*\((Official|Music|Video|HD|4K)\).*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*(ft\.|feat\.|featuring).*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*(Official|Music|Video).*$', '', name, flags=re.IGNORECASE)
-        
-        return name.strip()
+        return _ARTIST_SUFFIX_RE.sub('', name, count=1).strip()
     
     def _remove_featured_artists(self, name: str) -> str:
         """
@@ -711,22 +1059,12 @@ class MasterDiscoveryAgent:
         if not name:
             return name
         
-        # Patterns for featured artists and collaborations
-        feature_patterns = [
-            r'\s*(?:feat\.|featuring|ft\.)\s+.+$',  # feat. Artist, featuring Artist, ft. Artist
-            r'\s*(?:with|w/)\s+.+$',               # with Artist, w/ Artist
-            r'\s*(?:vs\.?|versus)\s+.+$',          # vs Artist, versus Artist
-            r'\s*(?:&|\+|and)\s+[A-Z].+$',        # & Artist, + Artist, and Artist (only if next word is capitalized)
-            r'\s*(?:x|X)\s+[A-Z].+$',             # x Artist, X Artist (collaborations)
-            r'\s*,\s*[A-Z].+$',                    # , Artist (comma separated)
-        ]
-        
         cleaned_name = name
-        for pattern in feature_patterns:
-            cleaned_name = re.sub(pattern, '', cleaned_name, flags=re.IGNORECASE)
+        for pattern in _FEATURED_ARTIST_PATTERNS:
+            cleaned_name = pattern.sub('', cleaned_name)
         
         # Clean up any trailing punctuation or whitespace
-        cleaned_name = re.sub(r'[,\s]+$', '', cleaned_name).strip()
+        cleaned_name = _TRAILING_SEPARATORS_RE.sub('', cleaned_name).strip()
         
         # If we removed everything, return the original
         if not cleaned_name or len(cleaned_name) < 2:
@@ -741,18 +1079,17 @@ class MasterDiscoveryAgent:
         """
         try:
             # First try exact match
-            exact_response = deps.supabase.table("artists").select("id").eq("name", artist_name).execute()
+            exact_response = await asyncio.to_thread(deps.supabase.table("artists").select("id").eq("name", artist_name).execute)
             if len(exact_response.data) > 0:
                 logger.debug(f"Found exact match for artist: {artist_name}")
                 return True
             
             # Then try fuzzy match with cleaned names
-            cleaned_name = self._clean_artist_name(artist_name).lower()
-            fuzzy_response = deps.supabase.table("artists").select("id", "name").execute()
+            cleaned_name = _artist_match_key(artist_name)
+            fuzzy_response = await asyncio.to_thread(deps.supabase.table("artists").select("id", "name").execute)
             
             for existing_artist in fuzzy_response.data:
-                existing_cleaned = self._clean_artist_name(existing_artist['name']).lower()
-                if existing_cleaned == cleaned_name:
+                if _artist_match_key(existing_artist['name']) == cleaned_name:
                     logger.debug(f"Found fuzzy match: {artist_name} -> {existing_artist['name']}")
                     return True
             
@@ -771,7 +1108,7 @@ class MasterDiscoveryAgent:
             if not video_id:
                 return False
                 
-            response = deps.supabase.table("artists").select("id").eq("discovery_video_id", video_id).execute()
+            response = await asyncio.to_thread(deps.supabase.table("artists").select("id").eq("discovery_video_id", video_id).execute)
             return len(response.data) > 0
             
         except Exception as e:
@@ -805,8 +1142,7 @@ class MasterDiscoveryAgent:
         social_links = {}
         
         # First, extract URLs from YouTube redirect links
-        redirect_pattern = r'https://www\.youtube\.com/redirect\?[^"\s<>]*?&q=([^&"\s<>]+)'
-        redirect_matches = re.findall(redirect_pattern, description, re.IGNORECASE)
+        redirect_matches = _REDIRECT_URL_RE.findall(description)
         
         # Decode the URLs from redirect parameters
         decoded_urls = []
@@ -820,77 +1156,26 @@ class MasterDiscoveryAgent:
                 continue
         
         # Also look for direct URLs in the description
-        # Common URL pattern
-        url_pattern = r'https?://[^\s<>"]+|www\.[^\s<>"]+'
-        direct_matches = re.findall(url_pattern, description, re.IGNORECASE)
+        direct_matches = _DESCRIPTION_URL_RE.findall(description)
         
         # Combine decoded redirect URLs and direct URLs
         all_urls = decoded_urls + direct_matches
         logger.debug(f"🔍 Found {len(all_urls)} total URLs: {len(decoded_urls)} from redirects, {len(direct_matches)} direct")
         
-        # Enhanced patterns for social media platforms
-        platform_patterns = {
-            'instagram': [
-                r'(?:https?://)?(?:www\.)?instagram\.com/([a-zA-Z0-9._]+)',
-                r'(?:https?://)?(?:www\.)?ig\.me/([a-zA-Z0-9._]+)',
-                r'@([a-zA-Z0-9._]+)(?:\s|$)'  # Handle @username mentions
-            ],
-            'tiktok': [
-                r'(?:https?://)?(?:www\.)?tiktok\.com/@([a-zA-Z0-9._]+)',
-                r'(?:https?://)?(?:vm\.)?tiktok\.com/([a-zA-Z0-9._]+)',
-                r'(?:https?://)?(?:www\.)?tiktok\.com/t/([a-zA-Z0-9._]+)'
-            ],
-            'spotify': [
-                r'(?:https?://)?(?:open\.)?spotify\.com/artist/([a-zA-Z0-9]+)',
-                r'(?:https?://)?(?:open\.)?spotify\.com/user/([a-zA-Z0-9._]+)',
-                r'(?:https?://)?(?:open\.)?spotify\.com/playlist/([a-zA-Z0-9]+)'
-            ],
-            'twitter': [
-                r'(?:https?://)?(?:www\.)?twitter\.com/([a-zA-Z0-9_]+)',
-                r'(?:https?://)?(?:www\.)?x\.com/([a-zA-Z0-9_]+)'
-            ],
-            'facebook': [
-                r'(?:https?://)?(?:www\.)?facebook\.com/([a-zA-Z0-9.]+)',
-                r'(?:https?://)?(?:www\.)?fb\.com/([a-zA-Z0-9.]+)'
-            ],
-            'youtube': [
-                r'(?:https?://)?(?:www\.)?youtube\.com/channel/([a-zA-Z0-9_-]+)',
-                r'(?:https?://)?(?:www\.)?youtube\.com/c/([a-zA-Z0-9_-]+)',
-                r'(?:https?://)?(?:www\.)?youtube\.com/@([a-zA-Z0-9_.-]+)',
-                r'(?:https?://)?(?:www\.)?youtu\.be/([a-zA-Z0-9_-]+)'
-            ],
-            'website': [
-                r'(?:https?://)?(?:www\.)?([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})(?:/[^\s]*)?'
-            ]
-        }
-        
         # Extract links for each platform
-        for platform, patterns in platform_patterns.items():
+        for platform, patterns in _DESCRIPTION_PLATFORM_PATTERNS.items():
             for pattern in patterns:
                 # Check all URLs (both decoded redirects and direct)
                 for url in all_urls:
-                    matches = re.findall(pattern, url, re.IGNORECASE)
+                    matches = pattern.findall(url)
                     if matches:
                         # Take the first match and clean it
                         username_or_id = matches[0]
                         
                         # Construct the full URL
-                        if platform == 'instagram':
-                            if not username_or_id.startswith('@'):
-                                full_url = f"https://www.instagram.com/{username_or_id}"
-                            else:
-                                full_url = f"https://www.instagram.com/{username_or_id[1:]}"
-                        elif platform == 'tiktok':
-                            if not username_or_id.startswith('@'):
-                                full_url = f"https://www.tiktok.com/@{username_or_id}"
-                            else:
-                                full_url = f"https://www.tiktok.com/{username_or_id}"
-                        elif platform == 'spotify':
-                            full_url = f"https://open.spotify.com/artist/{username_or_id}"
-                        elif platform == 'twitter':
-                            full_url = f"https://twitter.com/{username_or_id}"
-                        elif platform == 'facebook':
-                            full_url = f"https://www.facebook.com/{username_or_id}"
+                        url_fmt = _SOCIAL_URL_FMT.get(platform)
+                        if url_fmt:
+                            full_url = url_fmt.format(u=username_or_id.removeprefix('@'))
                         elif platform == 'youtube':
                             if 'channel/' in url:
                                 full_url = f"https://www.youtube.com/channel/{username_or_id}"
@@ -910,7 +1195,7 @@ class MasterDiscoveryAgent:
                             break  # Found a match for this platform, move to next platform
                 
                 # Also search in the raw description text for @mentions and direct patterns
-                description_matches = re.findall(pattern, description, re.IGNORECASE)
+                description_matches = pattern.findall(description)
                 if description_matches and platform not in social_links:
                     username_or_id = description_matches[0]
                     if platform == 'instagram' and not username_or_id.startswith('@'):
@@ -939,16 +1224,15 @@ class MasterDiscoveryAgent:
         # Platform-specific validation
         if platform == 'instagram':
             # Must have a username that's not too generic
-            username_match = re.search(r'instagram\.com/([a-zA-Z0-9._]+)', url)
+            username_match = _INSTAGRAM_USERNAME_RE.search(url)
             if username_match:
                 username = username_match.group(1)
                 # Filter out generic/invalid usernames
-                invalid_usernames = ['home', 'explore', 'accounts', 'about', 'privacy', 'terms', 'help']
-                return username not in invalid_usernames and len(username) >= 2
+                return username not in _INVALID_INSTAGRAM_USERNAMES and len(username) >= 2
         
         elif platform == 'tiktok':
             # Must have a valid username format
-            username_match = re.search(r'tiktok\.com/@([a-zA-Z0-9._]+)', url)
+            username_match = _TIKTOK_USERNAME_RE.search(url)
             if username_match:
                 username = username_match.group(1)
                 return len(username) >= 2
@@ -959,39 +1243,47 @@ class MasterDiscoveryAgent:
         
         elif platform == 'website':
             # Basic domain validation
-            return '.' in url and not any(exclude in url.lower() for exclude in ['youtube.com', 'instagram.com', 'tiktok.com', 'spotify.com'])
+            url_lower = url.lower()
+            return '.' in url and not any(exclude in url_lower for exclude in _NON_WEBSITE_DOMAINS)
         
         return True
     
-    async def _extract_and_clean_artist_name(self, title: str) -> Optional[str]:
+    async def _extract_and_clean_artist_names(self, titles: List[str]) -> List[Optional[str]]:
         """
-        Extract and clean artist name using AI with regex fallback.
+        Extract and clean artist names for a page of titles using AI with regex fallback.
         """
-        if not title:
-            return None
+        regex_results = [self._extract_artist_name(title) if title else None for title in titles]
         
-        # First try AI cleaning
+        # First try AI cleaning; plain "Artist - Song" titles take the cleaner's regex
+        # fast path and the rest are packed several titles per DeepSeek request
         if self.ai_cleaner and self.ai_cleaner.is_available():
             try:
-                # Try AI extraction with original regex as baseline
-                regex_result = self._extract_artist_name(title)
-                cleaned_result = await self.ai_cleaner.clean_artist_name(title, regex_result)
-                
-                if cleaned_result and cleaned_result.confidence_score >= 0.7:
-                    logger.info(f"🤖 AI cleaned artist: '{cleaned_result.artist_name}' (confidence: {cleaned_result.confidence_score:.2f})")
-                    logger.debug(f"AI reasoning: {cleaned_result.reasoning}")
-                    return cleaned_result.artist_name
-                elif cleaned_result:
-                    logger.warning(f"⚠️ Low confidence AI result: {cleaned_result.confidence_score:.2f}")
-                    # Still use it but with warning
-                    return cleaned_result.artist_name
-                    
+                cleaned_results = await self.ai_cleaner.clean_artist_names_batch(titles, regex_results)
             except Exception as e:
                 logger.warning(f"⚠️ AI artist extraction failed: {e}")
+                cleaned_results = [None] * len(titles)
+        else:
+            cleaned_results = [fast_clean_artist_name(title) if title else None for title in titles]
+        
+        artist_names = []
+        fallback_count = 0
+        for title, regex_result, cleaned_result in zip(titles, regex_results, cleaned_results):
+            if cleaned_result is None or not self._is_valid_artist_name(cleaned_result.artist_name):
+                # Fallback to regex method
+                artist_names.append(regex_result)
+                fallback_count += bool(title)
+                continue
+            
+            if cleaned_result.confidence_score >= 0.7:
+                logger.debug(f"🤖 Cleaned artist: '{cleaned_result.artist_name}' (confidence: {cleaned_result.confidence_score:.2f}, {cleaned_result.reasoning})")
+            else:
+                # Still use it but with warning
+                logger.warning(f"⚠️ Low confidence AI result: {cleaned_result.confidence_score:.2f}")
+            artist_names.append(cleaned_result.artist_name)
         
-        # Fallback to regex method
-        logger.info("🔄 Using regex fallback for artist extraction")
-        return self._extract_artist_name(title)
+        if fallback_count:
+            logger.info(f"🔄 Using regex fallback for {fallback_count}/{len(titles)} artist extractions")
+        return artist_names
     
     async def _clean_social_links(self, raw_links: Dict[str, str]) -> Optional[object]:
         """
@@ -1000,12 +1292,12 @@ class MasterDiscoveryAgent:
         if not raw_links:
             return None
         
-        # Try AI cleaning
-        if self.ai_cleaner and self.ai_cleaner.is_available():
+        # Validate locally (no DeepSeek round-trip needed for URL checks)
+        if self.ai_cleaner:
             try:
                 cleaned_links = await self.ai_cleaner.clean_social_links(raw_links)
                 if cleaned_links and cleaned_links.confidence_score >= 0.6:
-                    logger.info(f"🔗 AI cleaned social links (confidence: {cleaned_links.confidence_score:.2f})")
+                    logger.info(f"🔗 Cleaned social links (confidence: {cleaned_links.confidence_score:.2f})")
                     return cleaned_links
                 else:
                     logger.warning(f"⚠️ Low confidence social link cleaning")
@@ -1016,18 +1308,19 @@ class MasterDiscoveryAgent:
         # Fallback: return raw links in expected format
         logger.info("🔄 Using raw social links without AI cleaning")
         
-        # Create a simple object with the raw links
-        class RawSocialLinks:
-            def __init__(self, links):
-                self.instagram = links.get('instagram')
-                self.tiktok = links.get('tiktok')
-                self.spotify = links.get('spotify')
-                self.twitter = links.get('twitter')
-                self.facebook = links.get('facebook')
-                self.youtube = links.get('youtube')
-                self.website = links.get('website')
-        
-        return RawSocialLinks(raw_links)
+        # Same shape as the AI result, built without validation (raw links are
+        # already platform-filtered upstream)
+        return CleanedSocialLinks.model_construct(
+            instagram=raw_links.get('instagram'),
+            tiktok=raw_links.get('tiktok'),
+            spotify=raw_links.get('spotify'),
+            twitter=raw_links.get('twitter'),
+            facebook=raw_links.get('facebook'),
+            youtube=raw_links.get('youtube'),
+            website=raw_links.get('website'),
+            confidence_score=0.0,
+            validation_notes="Raw links, not AI-cleaned"
+        )
     
     async def _clean_channel_data(self, raw_data: Dict[str, Any]) -> Optional[object]:
         """
@@ -1060,7 +1353,7 @@ class MasterDiscoveryAgent:
         spotify_id = None
         spotify_url = social_links.get('spotify')
         if spotify_url:
-            spotify_match = re.search(r'/artist/([a-zA-Z0-9]+)', spotify_url)
+            spotify_match = _SPOTIFY_ARTIST_ID_RE.search(spotify_url)
             if spotify_match:
                 spotify_id = spotify_match.group(1)
         
@@ -1127,8 +1420,7 @@ class MasterDiscoveryAgent:
                 # If channel name is "Unknown", try to extract channel from video URL using crawl4ai_agent
                 if channel_name == "Unknown" and video_data.get('url'):
                     try:
-                        from app.agents.crawl4ai_agent import Crawl4AIAgent
-                        crawl4ai_agent = Crawl4AIAgent()
+                        crawl4ai_agent = self._get_crawl4ai_agent()
                         extracted_channel = await crawl4ai_agent.extract_channel_from_video(video_data['url'])
                         if extracted_channel:
                             logger.info(f"✅ Extracted channel URL from video: {extracted_channel}")
@@ -1161,63 +1453,21 @@ class MasterDiscoveryAgent:
             logger.info(f"🎬 Crawling YouTube channel: {channel_name}")
             
             # Use Crawl4AI to scrape channel data
-            from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
-            from crawl4ai.extraction_strategy import JsonCssExtractionStrategy
+            from crawl4ai import AsyncWebCrawler, BrowserConfig
             
             browser_config = BrowserConfig(
                 headless=True,
                 viewport_width=1920,
                 viewport_height=1080
             )
+            crawler_config = self._channel_crawler_config
             
-            # Enhanced schema for YouTube channel extraction
-            schema = {
-                "name": "YouTube Channel",
-                "baseSelector": "body",  # Add required baseSelector
-                "fields": [
-                    {
-                        "name": "subscriber_count_text",
-                        "selector": "[data-testid='subscriber-count'], .subscriber-count, #subscriber-count, .yt-subscription-button-subscriber-count-branded-horizontal, .style-scope.ytd-c4-tabbed-header-renderer",
-                        "type": "text"
-                    },
-                    {
-                        "name": "channel_description",
-                        "selector": "[data-testid='channel-description'], .channel-description, .about-description, .yt-formatted-string",
-                        "type": "text"
-                    },
-                    {
-                        "name": "verified_badge",
-                        "selector": "[data-testid='verified-badge'], .verified-badge, .yt-icon-badge",
-                        "type": "text"
-                    },
-                    {
-                        "name": "social_links",
-                        "selector": "a[href*='instagram.com'], a[href*='twitter.com'], a[href*='tiktok.com'], a[href*='spotify.com'], a[href*='facebook.com']",
-                        "type": "list",
-                        "attribute": "href"
-                    }
-                ]
-            }
-            
-            extraction_strategy = JsonCssExtractionStrategy(schema)
-            
-            crawler_config = CrawlerRunConfig(
-                cache_mode=CacheMode.BYPASS,
-                extraction_strategy=extraction_strategy,
-                wait_until="domcontentloaded",
-                page_timeout=30000,  # 30 second timeout
-                delay_before_return_html=3.0,
-                scan_full_page=True,  # Use built-in scrolling
-                scroll_delay=0.5,
-                verbose=True
-            )
-            
-            # Try each URL format until one works
-            for channel_url in channel_urls:
-                try:
-                    logger.info(f"Trying channel URL: {channel_url}")
-                    
-                    async with AsyncWebCrawler(config=browser_config) as crawler:
+            # Try each URL format until one works, sharing one browser across candidates
+            async with AsyncWebCrawler(config=browser_config) as crawler:
+                for channel_url in channel_urls:
+                    try:
+                        logger.info(f"Trying channel URL: {channel_url}")
+                        
                         result = await crawler.arun(
                             url=channel_url,
                             config=crawler_config
@@ -1236,8 +1486,7 @@ class MasterDiscoveryAgent:
                             # Parse structured extraction
                             if result.extracted_content:
                                 try:
-                                    import json
-                                    extracted = json.loads(result.extracted_content)
+                                    extracted = _json_loads(result.extracted_content)
                                     
                                     # Handle case where extracted content is a list (take first item)
                                     if isinstance(extracted, list):
@@ -1294,9 +1543,9 @@ class MasterDiscoveryAgent:
                                     logger.info(f"✅ Successfully crawled YouTube channel: {channel_data['subscriber_count']:,} subscribers, {len(channel_data['social_links_from_channel'])} social links")
                                 return channel_data
                             
-                except Exception as e:
-                    logger.debug(f"Failed to crawl {channel_url}: {e}")
-                    continue
+                    except Exception as e:
+                        logger.debug(f"Failed to crawl {channel_url}: {e}")
+                        continue
             
             logger.warning(f"⚠️ Could not crawl any YouTube channel URLs for: {channel_name}")
             return {
@@ -1324,14 +1573,12 @@ class MasterDiscoveryAgent:
         try:
             logger.debug(f"🎬 Crawling full video data: {video_url}")
             
-            from app.agents.crawl4ai_agent import Crawl4AIAgent
-            
-            # Initialize crawl4ai agent
-            crawl_agent = Crawl4AIAgent()
+            crawl_agent = self._get_crawl4ai_agent()
             
             # Extract video data using enhanced extractors
             try:
-                from enhanced_extractors import EnhancedYouTubeExtractor
+                if EnhancedYouTubeExtractor is None:
+                    raise ImportError("enhanced_extractors not available")
                 
                 # Get the HTML content
                 result = await crawl_agent.crawl_url(video_url)
@@ -1363,7 +1610,6 @@ class MasterDiscoveryAgent:
                     html_content = result.get('html', '')
                     if html_content:
                         # Basic regex extraction for description
-                        import re
                         desc_patterns = [
                             r'"description":{"simpleText":"([^"]+)"',
                             r'"description":"([^"]+)"',
@@ -1392,8 +1638,6 @@ class MasterDiscoveryAgent:
             logger.info(f"Getting Spotify API data for: {artist_name}")
             
             # Use the dedicated Spotify client
-            from app.clients.spotify_client import get_spotify_client
-            
             spotify_client = get_spotify_client()
             enriched_data = await spotify_client.get_enriched_artist_data(artist_name)
             
@@ -1472,94 +1716,22 @@ class MasterDiscoveryAgent:
                     spotify_listeners = api_followers
             
             # YouTube scoring (25 points max) - Lower thresholds for undiscovered talent
-            youtube_score = 0
-            if youtube_subscribers >= 50000:
-                youtube_score = 25  # Max score for this range
-            elif youtube_subscribers >= 25000:
-                youtube_score = 22
-            elif youtube_subscribers >= 10000:
-                youtube_score = 18
-            elif youtube_subscribers >= 5000:
-                youtube_score = 15
-            elif youtube_subscribers >= 1000:
-                youtube_score = 12
-            elif youtube_subscribers >= 500:
-                youtube_score = 8
-            elif youtube_subscribers >= 100:
-                youtube_score = 5
-            elif youtube_subscribers >= 50:
-                youtube_score = 3
-            elif youtube_subscribers > 0:
-                youtube_score = 1
+            youtube_score = _tiered_score(youtube_subscribers, *_YOUTUBE_SUBSCRIBER_TIERS)
             
             score += youtube_score
             
             # Spotify scoring (25 points max) - Adjusted for monthly listeners
-            spotify_score = 0
-            if spotify_listeners >= 100000:
-                spotify_score = 25
-            elif spotify_listeners >= 50000:
-                spotify_score = 22
-            elif spotify_listeners >= 25000:
-                spotify_score = 18
-            elif spotify_listeners >= 10000:
-                spotify_score = 15
-            elif spotify_listeners >= 5000:
-                spotify_score = 12
-            elif spotify_listeners >= 1000:
-                spotify_score = 8
-            elif spotify_listeners >= 500:
-                spotify_score = 5
-            elif spotify_listeners >= 100:
-                spotify_score = 3
-            elif spotify_listeners > 0:
-                spotify_score = 1
+            spotify_score = _tiered_score(spotify_listeners, *_SPOTIFY_LISTENER_TIERS)
             
             score += spotify_score
             
             # Instagram scoring (20 points max)
-            instagram_score = 0
-            if instagram_followers >= 100000:
-                instagram_score = 20
-            elif instagram_followers >= 50000:
-                instagram_score = 17
-            elif instagram_followers >= 25000:
-                instagram_score = 14
-            elif instagram_followers >= 10000:
-                instagram_score = 12
-            elif instagram_followers >= 5000:
-                instagram_score = 9
-            elif instagram_followers >= 1000:
-                instagram_score = 6
-            elif instagram_followers >= 500:
-                instagram_score = 4
-            elif instagram_followers >= 100:
-                instagram_score = 2
-            elif instagram_followers > 0:
-                instagram_score = 1
+            instagram_score = _tiered_score(instagram_followers, *_INSTAGRAM_FOLLOWER_TIERS)
             
             score += instagram_score
             
             # TikTok scoring (15 points max) - Includes engagement factor
-            tiktok_score = 0
-            if tiktok_followers >= 100000:
-                tiktok_score = 15
-            elif tiktok_followers >= 50000:
-                tiktok_score = 13
-            elif tiktok_followers >= 25000:
-                tiktok_score = 11
-            elif tiktok_followers >= 10000:
-                tiktok_score = 9
-            elif tiktok_followers >= 5000:
-                tiktok_score = 7
-            elif tiktok_followers >= 1000:
-                tiktok_score = 5
-            elif tiktok_followers >= 500:
-                tiktok_score = 3
-            elif tiktok_followers >= 100:
-                tiktok_score = 2
-            elif tiktok_followers > 0:
-                tiktok_score = 1
+            tiktok_score = _tiered_score(tiktok_followers, *_TIKTOK_FOLLOWER_TIERS)
             
             # TikTok engagement bonus
             if tiktok_followers > 0 and tiktok_likes > 0:
@@ -1740,7 +1912,7 @@ class MasterDiscoveryAgent:
             }
             
             # Insert into database
-            response = deps.supabase.table("artists").insert(artist_data).execute()
+            response = await asyncio.to_thread(deps.supabase.table("artists").insert(artist_data).execute)
             
             if response.data:
                 artist_record = response.data[0]
@@ -1765,7 +1937,7 @@ class MasterDiscoveryAgent:
                 'artists': [],
                 'total_processed': 0,
                 'total_found': 0,
-                'execution_time': time.time() - start_time,
+                'execution_time': time.perf_counter() - start_time,
                 'discovery_metadata': {}
             }
         }
@@ -1779,68 +1951,38 @@ class MasterDiscoveryAgent:
         except:
             return None
     
-    def _validate_title_contains_search_terms(self, title: str) -> bool:
+    def _validate_title_contains_search_terms(self, title: str, title_lower: Optional[str] = None) -> bool:
         """
         Validate if the title appears to be a legitimate music video (less restrictive).
+        Reuses the casefolded title from the search dedup pass when given.
         """
         if not title:
             return False
             
-        title_lower = title.lower()
+        if title_lower is None:
+            title_lower = title.casefold()
         
         # Primary high-quality indicators
-        high_quality_terms = [
-            "official music video",
-            "official video", 
-            "official mv",
-            "official audio",
-            "official lyric video",
-            "official visualizer"
-        ]
-        
-        for term in high_quality_terms:
+        for term in _HIGH_QUALITY_TITLE_TERMS:
             if term in title_lower:
                 return True
         
         # Secondary indicators - look for music video structure
-        import re
-        music_patterns = [
-            r'\w+\s*-\s*\w+',  # Artist - Song format
-            r'\w+\s*\|\s*\w+',  # Artist | Song format  
-            r'\w+:\s*\w+',      # Artist: Song format
-        ]
-        
         has_music_structure = False
-        for pattern in music_patterns:
-            if re.search(pattern, title_lower):
+        for pattern in _MUSIC_STRUCTURE_PATTERNS:
+            if pattern.search(title_lower):
                 has_music_structure = True
                 break
         
         if has_music_structure:
             # More flexible secondary terms
-            secondary_terms = [
-                "music video",
-                "mv",
-                "video",
-                "lyric video", 
-                "lyrics",
-                "visualizer",
-                "performance",
-                "live"
-            ]
-            
-            for term in secondary_terms:
+            for term in _SECONDARY_TITLE_TERMS:
                 if term in title_lower:
                     return True
             
             # Even if no explicit "video" term, accept if it has proper music structure
             # and doesn't contain obvious negative indicators
-            negative_indicators = [
-                "cover", "remix by", "reaction", "tutorial", 
-                "how to", "instrumental", "karaoke", "mashup"
-            ]
-            
-            has_negative = any(neg in title_lower for neg in negative_indicators)
+            has_negative = any(neg in title_lower for neg in _NEGATIVE_TITLE_TERMS)
             if not has_negative:
                 return True
         
@@ -1864,7 +2006,7 @@ class MasterDiscoveryAgent:
                     return int(number * multiplier)
             
             # Try to parse as regular number
-            clean_number = re.sub(r'[^\d.]', '', text)
+            clean_number = _NON_NUMERIC_RE.sub('', text)
             if clean_number:
                 return int(float(clean_number))
             
@@ -1872,21 +2014,35 @@ class MasterDiscoveryAgent:
         except:
             return 0
     
+    def _parse_view_counts_batch(self, view_texts: List[Any]) -> List[Optional[int]]:
+        """
+        Parse YouTube count texts ("1.2K views", "12,345 views", "3.4M subscribers", 678),
+        e.g. a whole result page at once. Unparseable entries come back as None.
+        """
+        if not view_texts:
+            return []
+        
+        counts = []
+        for text in view_texts:
+            match = _COUNT_TEXT_RE.search(str(text).replace(',', ''))
+            try:
+                number = float(match.group(1)) if match else None
+            except ValueError:
+                number = None
+            
+            if number is None:
+                counts.append(None)
+            else:
+                counts.append(int(number * _COUNT_MULTIPLIERS[(match.group(2) or '').upper()]))
+        return counts
+    
     def _extract_subscriber_count_from_html(self, html: str) -> int:
         """Extract subscriber count using regex patterns."""
-        patterns = [
-            r'(\d+(?:\.\d+)?[KMB]?)\s*subscribers?',
-            r'"subscriberCountText":\{"runs":\[\{"text":"([^"]+)"\}',
-            r'"subscriberCount":(\d+)',
-            r'subscribers?["\s]*:\s*["\s]*(\d+(?:\.\d+)?[KMB]?)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, html, re.IGNORECASE)
+        for pattern in _SUBSCRIBER_COUNT_PATTERNS:
+            matches = pattern.findall(html)
             if matches:
-                for match in matches:
-                    parsed = self._parse_subscriber_count(match)
-                    if parsed > 0:
+                for parsed in self._parse_view_counts_batch(matches):
+                    if parsed:
                         return parsed
         return 0
     
@@ -1895,54 +2051,28 @@ class MasterDiscoveryAgent:
         social_links = {}
         
         for link in links:
-            if 'instagram.com' in link:
-                social_links['instagram'] = link
-            elif 'twitter.com' in link or 'x.com' in link:
-                social_links['twitter'] = link
-            elif 'tiktok.com' in link:
-                social_links['tiktok'] = link
-            elif 'spotify.com' in link:
-                social_links['spotify'] = link
-            elif 'facebook.com' in link:
-                social_links['facebook'] = link
+            match = _SOCIAL_DOMAIN_RE.search(link)
+            if match:
+                social_links[match.lastgroup] = link
         
         return social_links
     
     def _extract_social_links_from_html(self, html: str) -> Dict[str, str]:
-        """Extract social media links using regex patterns."""
-        social_links = {}
+        """Extract social media links using a single pass over the HTML."""
+        href_links = {}
+        quoted_links = {}
         
-        # Enhanced patterns for social media links
-        link_patterns = {
-            'instagram': [
-                r'href="(https?://(?:www\.)?instagram\.com/[^"]+)"',
-                r'"(https?://(?:www\.)?instagram\.com/[^"]+)"',
-            ],
-            'twitter': [
-                r'href="(https?://(?:www\.)?(?:twitter|x)\.com/[^"]+)"',
-                r'"(https?://(?:www\.)?(?:twitter|x)\.com/[^"]+)"',
-            ],
-            'tiktok': [
-                r'href="(https?://(?:www\.)?tiktok\.com/[^"]+)"',
-                r'"(https?://(?:www\.)?tiktok\.com/[^"]+)"',
-            ],
-            'spotify': [
-                r'href="(https?://open\.spotify\.com/artist/[^"]+)"',
-                r'"(https?://open\.spotify\.com/artist/[^"]+)"',
-            ],
-            'facebook': [
-                r'href="(https?://(?:www\.)?facebook\.com/[^"]+)"',
-                r'"(https?://(?:www\.)?facebook\.com/[^"]+)"',
-            ]
-        }
+        # href="..." matches take priority over bare quoted URLs (e.g. in JSON blobs)
+        for match in _SOCIAL_HTML_LINK_RE.finditer(html):
+            platform = match.lastgroup
+            target = href_links if match.group('href') else quoted_links
+            target.setdefault(platform, match.group(platform))
         
-        for platform, patterns in link_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, html, re.IGNORECASE)
-                if matches:
-                    # Take the first valid match
-                    social_links[platform] = matches[0]
-                    break
+        social_links = {}
+        for platform in _SOCIAL_HTML_PLATFORMS:
+            url = href_links.get(platform) or quoted_links.get(platform)
+            if url:
+                social_links[platform] = url
         
         return social_links
     
@@ -1987,7 +2117,7 @@ class MasterDiscoveryAgent:
                 result = await crawler.arun(
                     url=about_url,
                     config=config,
-                    session_id=f"channel_social_{hash(channel_url)}"
+                    session_id=f"channel_social_{_stable_id(channel_url)}"
                 )
                 
                 if not result.success:
@@ -2023,116 +2153,17 @@ class MasterDiscoveryAgent:
         
         links = {}
         
-        # Instagram patterns - look for various formats in channel HTML
-        instagram_patterns = [
-            r'(?:https?://)?(?:www\.)?instagram\.com/([a-zA-Z0-9_.]+)/?',
-            r'"instagram"[^"]*"([^"]*instagram\.com/[a-zA-Z0-9_.]+)"',
-            r'instagram\.com/([a-zA-Z0-9_.]+)',
-        ]
-        
-        for pattern in instagram_patterns:
-            matches = re.finditer(pattern, html, re.IGNORECASE)
-            for match in matches:
-                if 'instagram' not in links:
-                    if match.groups():
-                        username = match.group(1)
-                        if len(username) > 1 and '.' not in username[-3:]:  # Basic validation
-                            links['instagram'] = f"https://instagram.com/{username}"
-                            break
-                    else:
-                        # Full URL captured
-                        full_url = match.group(0)
-                        if 'instagram.com/' in full_url:
-                            links['instagram'] = full_url if full_url.startswith('http') else f"https://{full_url}"
-                            break
-        
-        # TikTok patterns
-        tiktok_patterns = [
-            r'(?:https?://)?(?:www\.)?tiktok\.com/@([a-zA-Z0-9_.]+)/?',
-            r'"tiktok"[^"]*"([^"]*tiktok\.com/@[a-zA-Z0-9_.]+)"',
-            r'tiktok\.com/@([a-zA-Z0-9_.]+)',
-        ]
-        
-        for pattern in tiktok_patterns:
-            matches = re.finditer(pattern, html, re.IGNORECASE)
-            for match in matches:
-                if 'tiktok' not in links:
-                    if match.groups():
-                        username = match.group(1)
-                        if len(username) > 1:
-                            links['tiktok'] = f"https://tiktok.com/@{username}"
-                            break
-                    else:
-                        full_url = match.group(0)
-                        if 'tiktok.com/@' in full_url:
-                            links['tiktok'] = full_url if full_url.startswith('http') else f"https://{full_url}"
-                            break
-        
-        # Spotify patterns
-        spotify_patterns = [
-            r'(?:https?://)?open\.spotify\.com/artist/([a-zA-Z0-9]+)',
-            r'"spotify"[^"]*"([^"]*spotify\.com/artist/[a-zA-Z0-9]+)"',
-            r'spotify\.com/artist/([a-zA-Z0-9]+)',
-        ]
-        
-        for pattern in spotify_patterns:
-            matches = re.finditer(pattern, html, re.IGNORECASE)
-            for match in matches:
-                if 'spotify' not in links:
-                    if match.groups():
-                        artist_id = match.group(1)
-                        if len(artist_id) == 22:  # Spotify artist ID length
-                            links['spotify'] = f"https://open.spotify.com/artist/{artist_id}"
-                            break
-                    else:
-                        full_url = match.group(0)
-                        if 'spotify.com/artist/' in full_url:
-                            links['spotify'] = full_url if full_url.startswith('http') else f"https://{full_url}"
-                            break
-        
-        # Twitter/X patterns
-        twitter_patterns = [
-            r'(?:https?://)?(?:www\.)?(?:twitter\.com|x\.com)/([a-zA-Z0-9_]+)/?',
-            r'"twitter"[^"]*"([^"]*(?:twitter\.com|x\.com)/[a-zA-Z0-9_]+)"',
-            r'(?:twitter\.com|x\.com)/([a-zA-Z0-9_]+)',
-        ]
-        
-        for pattern in twitter_patterns:
-            matches = re.finditer(pattern, html, re.IGNORECASE)
-            for match in matches:
-                if 'twitter' not in links:
-                    if match.groups():
-                        username = match.group(1)
-                        if len(username) > 1 and username not in ['home', 'login', 'signup', 'explore']:
-                            links['twitter'] = f"https://twitter.com/{username}"
-                            break
-                    else:
-                        full_url = match.group(0)
-                        if any(domain in full_url for domain in ['twitter.com/', 'x.com/']):
-                            links['twitter'] = full_url if full_url.startswith('http') else f"https://{full_url}"
-                            break
-        
-        # Facebook patterns
-        facebook_patterns = [
-            r'(?:https?://)?(?:www\.)?facebook\.com/([a-zA-Z0-9_.]+)/?',
-            r'"facebook"[^"]*"([^"]*facebook\.com/[a-zA-Z0-9_.]+)"',
-            r'facebook\.com/([a-zA-Z0-9_.]+)',
-        ]
-        
-        for pattern in facebook_patterns:
-            matches = re.finditer(pattern, html, re.IGNORECASE)
-            for match in matches:
-                if 'facebook' not in links:
-                    if match.groups():
-                        page_name = match.group(1)
-                        if len(page_name) > 1 and page_name not in ['login', 'home', 'pages']:
-                            links['facebook'] = f"https://facebook.com/{page_name}"
-                            break
-                    else:
-                        full_url = match.group(0)
-                        if 'facebook.com/' in full_url:
-                            links['facebook'] = full_url if full_url.startswith('http') else f"https://{full_url}"
-                            break
+        # First handle that passes the platform's check wins; once a platform
+        # is found its remaining patterns are not scanned
+        for platform, patterns in _CHANNEL_HTML_PATTERNS.items():
+            build_link = _CHANNEL_LINK_BUILDERS[platform]
+            link = next(
+                (url for pattern in patterns for match in pattern.finditer(html)
+                 if (url := build_link(match.group(1)))),
+                None
+            )
+            if link:
+                links[platform] = link
         
         logger.debug(f"Extracted social links from channel HTML: {links}")
         return links
@@ -2175,13 +2206,8 @@ class MasterDiscoveryAgent:
         if not text:
             return False
         
-        import re
-        
-        # Allow English letters, numbers, spaces, and common punctuation
-        english_pattern = re.compile(r'^[a-zA-Z0-9\s\-\.\,\!\?\(\)\[\]\&\'\"]+$')
-        
         # Check if text matches English pattern
-        is_english = bool(english_pattern.match(text.strip()))
+        is_english = bool(_ENGLISH_TEXT_RE.match(text.strip()))
         
         if not is_english:
             logger.debug(f"Text '{text}' contains non-English characters")
@@ -2212,65 +2238,67 @@ class MasterDiscoveryAgent:
         lyrics_data = {}
         
         try:
-            from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
+            from crawl4ai import CrawlerRunConfig
             
-            browser_config = BrowserConfig(
-                headless=True,
-                viewport_width=1920,
-                viewport_height=1080
+            # Song pages go through the shared browser and its crawl concurrency limit
+            crawl_agent = self._get_crawl4ai_agent()
+            
+            # Every song page uses the same run config
+            config = CrawlerRunConfig(
+                css_selector='.lyrics__content__ok, .mxm-lyrics__content',
+                word_count_threshold=50,
+                extraction_strategy=None,
+                wait_until="domcontentloaded",
+                page_timeout=15000,
+                delay_before_return_html=2.0,
+                screenshot=False,
+                pdf=False,
+                verbose=False
             )
             
-            async with AsyncWebCrawler(config=browser_config) as crawler:
-                for song_item in song_titles[:5]:  # Top 5 songs only
-                    try:
-                        # Extract song title from dictionary or use as string
-                        if isinstance(song_item, dict):
-                            song_title = song_item.get('name', str(song_item))
-                        else:
-                            song_title = str(song_item)
-                        
-                        # Clean song title for URL
-                        clean_artist = artist_name.replace(' ', '-').replace('&', 'and')
-                        clean_song = song_title.replace(' ', '-').replace('&', 'and')
-                        
-                        # Build Musixmatch URL
-                        musixmatch_url = f"https://www.musixmatch.com/lyrics/{clean_artist}/{clean_song}"
-                        
-                        config = CrawlerRunConfig(
-                            css_selector='.lyrics__content__ok, .mxm-lyrics__content',
-                            word_count_threshold=50,
-                            extraction_strategy=None,
-                            wait_until="domcontentloaded",
-                            page_timeout=15000,
-                            delay_before_return_html=2.0,
-                            screenshot=False,
-                            pdf=False,
-                            verbose=False
-                        )
-                        
-                        result = await crawler.arun(
-                            url=musixmatch_url,
-                            config=config,
-                            session_id=f"musixmatch_{hash(artist_name + song_title)}"
-                        )
-                        
-                        if result.success and result.markdown:
-                            # Extract lyrics from markdown
-                            lyrics_text = self._clean_lyrics_text(result.markdown)
-                            if lyrics_text and len(lyrics_text) > 50:
-                                lyrics_data[song_title] = lyrics_text
-                                logger.info(f"✅ Extracted lyrics for '{song_title}' by {artist_name}")
-                            else:
-                                logger.warning(f"⚠️ No valid lyrics found for '{song_title}'")
-                        else:
-                            logger.warning(f"⚠️ Failed to scrape lyrics for '{song_title}': {result.error_message if hasattr(result, 'error_message') else 'Unknown error'}")
+            # Clean artist name for URL
+            clean_artist = artist_name.replace(' ', '-').replace('&', 'and')
+            
+            async def fetch_song_lyrics(index: int, song_item: Any) -> Optional[Tuple[str, str]]:
+                # Extract song title from dictionary or use as string
+                if isinstance(song_item, dict):
+                    song_title = song_item.get('name', str(song_item))
+                else:
+                    song_title = str(song_item)
+                
+                # Rate limiting: stagger page starts one second apart while
+                # letting the page loads themselves overlap
+                await asyncio.sleep(index * 1.0)
+                
+                try:
+                    # Build Musixmatch URL
+                    clean_song = song_title.replace(' ', '-').replace('&', 'and')
+                    musixmatch_url = f"https://www.musixmatch.com/lyrics/{clean_artist}/{clean_song}"
                     
-                    except Exception as e:
-                        logger.error(f"Error extracting lyrics for '{song_title}': {e}")
-                        continue
+                    result = await crawl_agent._arun(musixmatch_url, config)
                     
-                    # Rate limiting
-                    await asyncio.sleep(1.0)
+                    if result.success and result.markdown:
+                        # Extract lyrics from markdown
+                        lyrics_text = self._clean_lyrics_text(result.markdown)
+                        if lyrics_text and len(lyrics_text) > 50:
+                            logger.info(f"✅ Extracted lyrics for '{song_title}' by {artist_name}")
+                            return song_title, lyrics_text
+                        logger.warning(f"⚠️ No valid lyrics found for '{song_title}'")
+                    else:
+                        logger.warning(f"⚠️ Failed to scrape lyrics for '{song_title}': {result.error_message if hasattr(result, 'error_message') else 'Unknown error'}")
+                
+                except Exception as e:
+                    logger.error(f"Error extracting lyrics for '{song_title}': {e}")
+                
+                return None
+            
+            # Top 5 songs only, scraped concurrently
+            results = await asyncio.gather(*[
+                fetch_song_lyrics(index, song_item)
+                for index, song_item in enumerate(song_titles[:5])
+            ])
+            
+            lyrics_data = dict(result for result in results if result)
             
             logger.info(f"📝 Extracted lyrics for {len(lyrics_data)} songs by {artist_name}")
             return lyrics_data
@@ -2286,16 +2314,13 @@ class MasterDiscoveryAgent:
         if not raw_text:
             return ""
         
-        import re
-        
-        # Remove common Musixmatch elements
-        cleaned = re.sub(r'Musixmatch.*?lyrics', '', raw_text, flags=re.IGNORECASE)
-        cleaned = re.sub(r'You might also like.*?\n', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\[.*?\]', '', cleaned)  # Remove annotations like [Verse 1]
-        cleaned = re.sub(r'\(.*?\)', '', cleaned)  # Remove parenthetical notes
+        # Remove common Musixmatch elements, annotations and parenthetical notes
+        cleaned = raw_text
+        for pattern in _LYRICS_NOISE_PATTERNS:
+            cleaned = pattern.sub('', cleaned)
         
         # Clean up whitespace
-        cleaned = re.sub(r'\n\s*\n', '\n', cleaned)
+        cleaned = _BLANK_LINES_RE.sub('\n', cleaned)
         cleaned = cleaned.strip()
         
         return cleaned
@@ -2313,15 +2338,6 @@ class MasterDiscoveryAgent:
             
             # Use existing AI cleaner if available
             if self.ai_cleaner and self.ai_cleaner.is_available():
-                analysis_prompt = f"""
-                Analyze the following lyrics from {artist_name} and provide a one-sentence theme analysis:
-                
-                {all_lyrics}
-                
-                Please identify the main recurring themes, emotions, and overall sentiment in ONE SENTENCE.
-                Focus on: love, relationships, success, struggle, party, introspection, social issues, etc.
-                """
-                
                 try:
                     # This would use the existing AI cleaner infrastructure
                     # For now, return a simple analysis based on keyword frequency
@@ -2343,21 +2359,15 @@ class MasterDiscoveryAgent:
         if not lyrics_text:
             return ""
         
-        lyrics_lower = lyrics_text.lower()
-        
-        # Theme keywords
-        themes = {
-            'love_relationships': ['love', 'heart', 'baby', 'girl', 'boy', 'kiss', 'romance', 'together'],
-            'success_money': ['money', 'cash', 'rich', 'success', 'win', 'gold', 'diamond', 'fame'],
-            'party_lifestyle': ['party', 'dance', 'club', 'night', 'drink', 'fun', 'celebrate'],
-            'struggle_hardship': ['struggle', 'pain', 'hard', 'fight', 'difficult', 'broke', 'stress'],
-            'introspective': ['think', 'feel', 'mind', 'soul', 'memory', 'dream', 'hope'],
-            'social_issues': ['world', 'people', 'society', 'change', 'justice', 'freedom', 'peace']
-        }
+        # One scan counts every theme keyword; the lookahead keeps
+        # str.count semantics for keywords that share characters
+        keyword_counts = Counter(
+            match.group(1) for match in _LYRIC_THEME_KEYWORD_RE.finditer(lyrics_text.lower())
+        )
         
         theme_scores = {}
-        for theme, keywords in themes.items():
-            score = sum(lyrics_lower.count(keyword) for keyword in keywords)
+        for theme, keywords in _LYRIC_THEME_KEYWORDS.items():
+            score = sum(keyword_counts[keyword] for keyword in keywords)
             if score > 0:
                 theme_scores[theme] = score
         
@@ -2367,14 +2377,5 @@ class MasterDiscoveryAgent:
         # Get top theme
         top_theme = max(theme_scores, key=theme_scores.get)
         
-        theme_descriptions = {
-            'love_relationships': 'Focuses on love, relationships, and romantic connections',
-            'success_money': 'Emphasizes success, wealth, and material achievement',
-            'party_lifestyle': 'Centers around party culture, nightlife, and celebration',
-            'struggle_hardship': 'Explores personal struggles, hardships, and overcoming challenges',
-            'introspective': 'Reflects on personal thoughts, emotions, and inner experiences',
-            'social_issues': 'Addresses social themes, community, and broader world issues'
-        }
-        
-        return theme_descriptions.get(top_theme, "Mixed themes and personal expression")
+        return _LYRIC_THEME_DESCRIPTIONS.get(top_theme, "Mixed themes and personal expression")
  
\ No newline at end of file
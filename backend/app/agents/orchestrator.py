@@ -1,18 +1,19 @@
 # backend/app/agents/orchestrator.py
 from pydantic_ai import Agent, ModelRetry
 from pydantic_ai.models.openai import OpenAIModel
-from pydantic_ai.providers.deepseek import DeepSeekProvider
 from typing import Dict, Any, List, Optional, Tuple
 from uuid import uuid4, UUID
 import logging
 import asyncio
+import threading
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from fastapi import BackgroundTasks
 import time
 import re
 
 from app.core.config import settings
-from app.core.dependencies import PipelineDependencies
+from app.core.dependencies import PipelineDependencies, get_deepseek_provider
 from app.core import quota_manager
 from app.models.artist import (
     DiscoveryRequest, ArtistProfile, VideoMetadata, 
@@ -36,7 +37,7 @@ def create_orchestrator_agent():
     """Create orchestrator agent on-demand to avoid import-time blocking"""
     try:
         return Agent(
-            model=OpenAIModel('deepseek-chat', provider=DeepSeekProvider()),
+            model=OpenAIModel('deepseek-chat', provider=get_deepseek_provider()),
             system_prompt="""You are the orchestrator for a music artist discovery system. Your role is to:
             1. Coordinate the discovery process across multiple agents
             2. Ensure efficient use of API quotas and rate limits
@@ -75,6 +76,7 @@ class DiscoveryOrchestrator:
         self.storage_agent = StorageAgent()
         self._orchestrator_agent = None
         self._agent_creation_attempted = False
+        self._agent_lock = threading.Lock()
         
         self.use_master_workflow = use_master_workflow
         self.quota_manager = quota_manager
@@ -102,8 +104,11 @@ class DiscoveryOrchestrator:
     def orchestrator_agent(self):
         """Lazy initialization of orchestrator agent"""
         if self._orchestrator_agent is None and not self._agent_creation_attempted:
-            self._agent_creation_attempted = True
-            self._orchestrator_agent = create_orchestrator_agent()
+            with self._agent_lock:
+                # Re-check: another thread may have built it while we waited
+                if self._orchestrator_agent is None and not self._agent_creation_attempted:
+                    self._orchestrator_agent = create_orchestrator_agent()
+                    self._agent_creation_attempted = True
         return self._orchestrator_agent
     
     async def start_discovery_session(
@@ -285,7 +290,7 @@ class DiscoveryOrchestrator:
         
         try:
             # Set session as active
-            self._active_sessions[str(session_id)] = {"running": True, "paused": False}
+            self._get_session_control(str(session_id))
             
             if self.use_master_workflow and self.master_agent:
                 # Use MasterDiscoveryAgent for complete workflow
@@ -302,35 +307,39 @@ class DiscoveryOrchestrator:
                     discovered_artists = result['data']['artists']
                     total_found = result['data']['total_found']
                     
-                    # Notify progress
-                    for i, artist in enumerate(discovered_artists, 1):
-                        await notify_artist_discovered({
-                            "session_id": str(session_id),
-                            "artist": artist,
-                            "progress": i,
-                            "total": total_found
-                        })
+                    # Notify progress in the background; the sends overlap with the
+                    # session update below and are all awaited when the group exits
+                    async with asyncio.TaskGroup() as notify_group:
+                        for i, artist in enumerate(discovered_artists, 1):
+                            # Yield before checking session control so a pause/stop
+                            # request (and the sends already queued) can run first
+                            await asyncio.sleep(0)
+                            if not self._check_session_control(str(session_id)):
+                                logger.info(f"⏸️ Session {session_id} paused or stopped")
+                                break
+                            
+                            notify_group.create_task(notify_artist_discovered({
+                                "session_id": str(session_id),
+                                "artist": artist,
+                                "progress": i,
+                                "total": total_found
+                            }))
                         
-                        # Check session control
-                        if not self._check_session_control(str(session_id)):
-                            logger.info(f"⏸️ Session {session_id} paused or stopped")
-                            break
-                    
-                    # Update session in database
-                    await self.storage_agent.update_discovery_session(
-                        deps,
-                        str(session_id),
-                        {
-                            "status": "completed",
-                            "completed_at": datetime.now(timezone.utc).isoformat(),
-                            "results": {
-                                "total_found": total_found,
-                                "total_processed": result['data']['total_processed'],
-                                "execution_time": result['data']['execution_time'],
-                                "workflow_engine": "MasterDiscoveryAgent"
+                        # Update session in database
+                        await self.storage_agent.update_discovery_session(
+                            deps,
+                            str(session_id),
+                            {
+                                "status": "completed",
+                                "completed_at": datetime.now(timezone.utc).isoformat(),
+                                "results": {
+                                    "total_found": total_found,
+                                    "total_processed": result['data']['total_processed'],
+                                    "execution_time": result['data']['execution_time'],
+                                    "workflow_engine": "MasterDiscoveryAgent"
+                                }
                             }
-                        }
-                    )
+                        )
                     
                     # Notify completion
                     await notify_discovery_completed(str(session_id), {
@@ -567,6 +576,7 @@ class DiscoveryOrchestrator:
     
     async def pause_session(self, session_id: str, deps: PipelineDependencies) -> Dict[str, Any]:
         """Pause a running discovery session"""
+        is_active = session_id in self._active_sessions
         try:
             control = self._get_session_control(session_id)
             
@@ -603,9 +613,14 @@ class DiscoveryOrchestrator:
                 "message": f"Failed to pause session: {str(e)}",
                 "session_id": session_id
             }
+        finally:
+            # No pipeline is running under this ID, so don't keep the flags for the process lifetime
+            if not is_active:
+                self._active_sessions.pop(session_id, None)
     
     async def resume_session(self, session_id: str, deps: PipelineDependencies) -> Dict[str, Any]:
         """Resume a paused discovery session"""
+        is_active = session_id in self._active_sessions
         try:
             control = self._get_session_control(session_id)
             
@@ -649,9 +664,14 @@ class DiscoveryOrchestrator:
                 "message": f"Failed to resume session: {str(e)}",
                 "session_id": session_id
             }
+        finally:
+            # No pipeline is running under this ID, so don't keep the flags for the process lifetime
+            if not is_active:
+                self._active_sessions.pop(session_id, None)
     
     async def stop_session(self, session_id: str, deps: PipelineDependencies) -> Dict[str, Any]:
         """Stop a running discovery session"""
+        is_active = session_id in self._active_sessions
         try:
             control = self._get_session_control(session_id)
             control['should_stop'] = True
@@ -670,10 +690,6 @@ class DiscoveryOrchestrator:
                 }
             )
             
-            # Clean up session from active sessions
-            if session_id in self._active_sessions:
-                del self._active_sessions[session_id]
-            
             return {
                 "status": "success",
                 "message": "Session stopped",
@@ -687,6 +703,10 @@ class DiscoveryOrchestrator:
                 "message": f"Failed to stop session: {str(e)}",
                 "session_id": session_id
             }
+        finally:
+            # A running pipeline must still see should_stop and clears the flags itself on exit
+            if not is_active:
+                self._active_sessions.pop(session_id, None)
     
     async def get_session_status(self, session_id: str) -> Dict[str, Any]:
         """Get current status of a session"""
@@ -895,4 +915,26 @@ class DiscoveryOrchestrator:
             
         except (ValueError, AttributeError) as e:
             logger.debug(f"Error parsing video data for undiscovered filter: {e}")
-            return False
\ No newline at end of file
+            return False
+
+
+def get_orchestrator(use_master_workflow: bool = True) -> DiscoveryOrchestrator:
+    """
+    Get the shared orchestrator for this workflow mode.
+    
+    Session control state lives on the instance, so pause/resume/stop/status
+    requests must reach the same orchestrator that started the session.
+    """
+    # lru_cache keys get_orchestrator() and get_orchestrator(use_master_workflow=True)
+    # differently, so cache on the normalized positional flag instead
+    return _shared_orchestrator(bool(use_master_workflow))
+
+
+@lru_cache(maxsize=None)
+def _shared_orchestrator(use_master_workflow: bool) -> DiscoveryOrchestrator:
+    return DiscoveryOrchestrator(use_master_workflow=use_master_workflow)
+
+
+def reset_orchestrators():
+    """Drop the shared orchestrators along with the agents they hold."""
+    _shared_orchestrator.cache_clear()
@@ -1,5 +1,6 @@
 # backend/app/agents/storage_agent.py
 from typing import Dict, Any, Optional, List
+import asyncio
 import logging
 from datetime import datetime
 from uuid import UUID
@@ -19,7 +20,7 @@ class StorageAgent:
     ) -> bool:
         """Create a new discovery session"""
         try:
-            result = deps.supabase.table("discovery_sessions").insert(session_data).execute()
+            result = await asyncio.to_thread(deps.supabase.table("discovery_sessions").insert(session_data).execute)
             return result.data is not None
         except Exception as e:
             logger.error(f"Error creating discovery session: {e}")
@@ -33,9 +34,9 @@ class StorageAgent:
     ) -> bool:
         """Update discovery session"""
         try:
-            result = deps.supabase.table("discovery_sessions").update(
+            result = await asyncio.to_thread(deps.supabase.table("discovery_sessions").update(
                 update_data
-            ).eq("id", session_id).execute()
+            ).eq("id", session_id).execute)
             return result.data is not None
         except Exception as e:
             logger.error(f"Error updating discovery session: {e}")
@@ -48,9 +49,9 @@ class StorageAgent:
     ) -> Optional[EnrichedArtistData]:
         """Get artist by YouTube channel ID for deduplication"""
         try:
-            result = deps.supabase.table("artists").select("*").eq(
+            result = await asyncio.to_thread(deps.supabase.table("artists").select("*").eq(
                 "youtube_channel_id", channel_id
-            ).execute()
+            ).execute)
             
             if result.data and len(result.data) > 0:
                 artist_data = result.data[0]
@@ -70,9 +71,9 @@ class StorageAgent:
     ) -> Optional[EnrichedArtistData]:
         """Get artist by Spotify ID for deduplication"""
         try:
-            result = deps.supabase.table("artists").select("*").eq(
+            result = await asyncio.to_thread(deps.supabase.table("artists").select("*").eq(
                 "spotify_id", spotify_id
-            ).execute()
+            ).execute)
             
             if result.data and len(result.data) > 0:
                 artist_data = result.data[0]
@@ -93,9 +94,9 @@ class StorageAgent:
         """Find similar artists by name for fuzzy deduplication"""
         try:
             # Use case-insensitive search with similarity
-            result = deps.supabase.table("artists").select("*").ilike(
+            result = await asyncio.to_thread(deps.supabase.table("artists").select("*").ilike(
                 "name", f"%{artist_name}%"
-            ).execute()
+            ).execute)
             
             if result.data:
                 # Filter by similarity threshold
@@ -200,9 +201,9 @@ class StorageAgent:
         """Store video metadata with deduplication"""
         try:
             # Check if video already exists
-            existing = deps.supabase.table("videos").select("*").eq(
+            existing = await asyncio.to_thread(deps.supabase.table("videos").select("*").eq(
                 "youtube_video_id", video.youtube_video_id
-            ).execute()
+            ).execute)
             
             if existing.data:
                 logger.info(f"Video already exists: {video.youtube_video_id}")
@@ -223,7 +224,7 @@ class StorageAgent:
                 "metadata": video.metadata
             }
             
-            result = deps.supabase.table("videos").insert(video_data).execute()
+            result = await asyncio.to_thread(deps.supabase.table("videos").insert(video_data).execute)
             
             if result.data:
                 return result.data[0]
@@ -242,9 +243,9 @@ class StorageAgent:
         """Store lyric analysis with deduplication"""
         try:
             # Check if analysis already exists for this video
-            existing = deps.supabase.table("lyric_analyses").select("*").eq(
+            existing = await asyncio.to_thread(deps.supabase.table("lyric_analyses").select("*").eq(
                 "video_id", str(analysis.video_id)
-            ).execute()
+            ).execute)
             
             if existing.data:
                 logger.info(f"Lyric analysis already exists for video: {analysis.video_id}")
@@ -262,7 +263,7 @@ class StorageAgent:
                 "analysis_metadata": analysis.analysis_metadata
             }
             
-            result = deps.supabase.table("lyric_analyses").insert(analysis_data).execute()
+            result = await asyncio.to_thread(deps.supabase.table("lyric_analyses").insert(analysis_data).execute)
             
             if result.data:
                 return result.data[0]
@@ -280,7 +281,7 @@ class StorageAgent:
     ) -> Optional[Dict[str, Any]]:
         """Get artist by ID"""
         try:
-            result = deps.supabase.table("artists").select("*").eq("id", artist_id).single().execute()
+            result = await asyncio.to_thread(deps.supabase.table("artists").select("*").eq("id", artist_id).single().execute)
             return result.data
         except Exception as e:
             logger.error(f"Error fetching artist: {e}")
@@ -295,9 +296,9 @@ class StorageAgent:
     ) -> List[Dict[str, Any]]:
         """Get artists by status"""
         try:
-            result = deps.supabase.table("artists").select("*").eq(
+            result = await asyncio.to_thread(deps.supabase.table("artists").select("*").eq(
                 "status", status
-            ).range(offset, offset + limit - 1).execute()
+            ).range(offset, offset + limit - 1).execute)
             return result.data or []
         except Exception as e:
             logger.error(f"Error fetching artists by status: {e}")
@@ -311,9 +312,9 @@ class StorageAgent:
     ) -> List[Dict[str, Any]]:
         """Get high-value artists based on enrichment score"""
         try:
-            result = deps.supabase.table("artists").select("*").gte(
+            result = await asyncio.to_thread(deps.supabase.table("artists").select("*").gte(
                 "enrichment_score", min_score
-            ).order("enrichment_score", desc=True).limit(limit).execute()
+            ).order("enrichment_score", desc=True).limit(limit).execute)
             return result.data or []
         except Exception as e:
             logger.error(f"Error fetching high-value artists: {e}")
@@ -327,9 +328,9 @@ class StorageAgent:
     ) -> List[Dict[str, Any]]:
         """Search artists by name"""
         try:
-            result = deps.supabase.table("artists").select("*").ilike(
+            result = await asyncio.to_thread(deps.supabase.table("artists").select("*").ilike(
                 "name", f"%{query}%"
-            ).limit(limit).execute()
+            ).limit(limit).execute)
             return result.data or []
         except Exception as e:
             logger.error(f"Error searching artists: {e}")
@@ -374,6 +375,7 @@ class StorageAgent:
             sanitized_metadata = self._sanitize_metadata(artist.metadata)
             sanitized_follower_counts = self._sanitize_json_data(artist.follower_counts)
             sanitized_social_links = self._sanitize_json_data(artist.social_links)
+            now_iso = datetime.now().isoformat()
             
             artist_data = {
                 "name": artist.name,
@@ -393,8 +395,8 @@ class StorageAgent:
                 "metadata": sanitized_metadata,
                 "enrichment_score": artist.enrichment_score,
                 "status": artist.status,
-                "discovery_date": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
+                "discovery_date": now_iso,
+                "last_updated": now_iso,
                 
                 # Additional database columns
                 "youtube_channel_url": artist.metadata.get('youtube_channel_url'),
@@ -417,7 +419,7 @@ class StorageAgent:
                 "music_theme_analysis": artist.metadata.get('music_theme_analysis', artist.lyrical_themes)
             }
             
-            result = deps.supabase.table("artists").insert(artist_data).execute()
+            result = await asyncio.to_thread(deps.supabase.table("artists").insert(artist_data).execute)
             
             if result.data:
                 logger.info(f"✅ Created new artist: {artist.name}")
@@ -466,7 +468,7 @@ class StorageAgent:
             
             # Update genres (merge)
             if new_data.genres:
-                merged_genres = list(set(existing.profile.genres + new_data.genres))
+                merged_genres = list(dict.fromkeys(existing.profile.genres + new_data.genres))
                 if len(merged_genres) > len(existing.profile.genres):
                     should_update = True
                     update_data["genres"] = merged_genres
@@ -493,9 +495,9 @@ class StorageAgent:
             if should_update:
                 update_data["last_updated"] = datetime.now().isoformat()
                 
-                result = deps.supabase.table("artists").update(
+                result = await asyncio.to_thread(deps.supabase.table("artists").update(
                     update_data
-                ).eq("id", db_id).execute()
+                ).eq("id", db_id).execute)
                 
                 if result.data:
                     logger.info(f"✅ Updated existing artist: {existing.profile.name}")
@@ -523,9 +525,9 @@ class StorageAgent:
         """Update artist profile"""
         try:
             update_data["last_updated"] = datetime.now().isoformat()
-            result = deps.supabase.table("artists").update(
+            result = await asyncio.to_thread(deps.supabase.table("artists").update(
                 update_data
-            ).eq("id", artist_id).execute()
+            ).eq("id", artist_id).execute)
             return result.data is not None
         except Exception as e:
             logger.error(f"Error updating artist profile: {e}")
@@ -7,7 +7,7 @@ from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
 from typing import List, Dict, Any, Optional
 import logging
 import asyncio
-from datetime import datetime
+import time
 
 from ..agents.comprehensive_music_discovery_agent import ComprehensiveMusicDiscoveryAgent, ArtistDiscoveryResult
 from pydantic import BaseModel
@@ -51,7 +51,7 @@ async def start_comprehensive_discovery(
     6. Stores results in database
     """
     
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     try:
         logger.info(f"🎵 Starting comprehensive discovery with limit: {request.limit}")
@@ -72,7 +72,7 @@ async def start_comprehensive_discovery(
             ]
         
         # Format response
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         
         artists_data = []
         errors = []
@@ -108,7 +108,7 @@ async def start_comprehensive_discovery(
         
     except Exception as e:
         logger.error(f"Error in comprehensive discovery: {str(e)}")
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         
         return DiscoveryResponse(
             success=False,
@@ -135,7 +135,7 @@ async def discover_undiscovered_talent(
     - High potential indicators
     """
     
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     try:
         logger.info(f"🎯 Discovering undiscovered talent with limit: {limit}, max_views: {max_views}")
@@ -158,7 +158,7 @@ async def discover_undiscovered_talent(
                     result.discovery_score >= min_quality_score * 100):
                     undiscovered_artists.append(result)
         
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         
         return DiscoveryResponse(
             success=True,
@@ -190,7 +190,7 @@ async def discover_undiscovered_talent(
         
     except Exception as e:
         logger.error(f"Error discovering undiscovered talent: {str(e)}")
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         
         return DiscoveryResponse(
             success=False,
@@ -6,10 +6,10 @@ import logging
 
 from app.models.artist import (
     ArtistProfile, DiscoveryRequest, DiscoveryResponse,
-    EnrichedArtistData, VideoMetadata, LyricAnalysis
+    EnrichedArtistData
 )
 from app.core.dependencies import get_pipeline_deps, PipelineDependencies
-from app.agents.orchestrator import DiscoveryOrchestrator
+from app.agents.orchestrator import get_orchestrator
 from app.api.master_discovery import router as master_discovery_router
 
 logger = logging.getLogger(__name__)
@@ -34,10 +34,10 @@ async def start_discovery(
     logger.info(f"🔍 Background tasks: {background_tasks}")
     
     try:
-        logger.info("⚡ About to create DiscoveryOrchestrator instance...")
+        logger.info("⚡ About to get DiscoveryOrchestrator instance...")
         # Use MasterDiscoveryAgent as primary workflow
-        orchestrator = DiscoveryOrchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
-        logger.info(f"✅ DiscoveryOrchestrator created successfully (Master workflow: {USE_MASTER_WORKFLOW})")
+        orchestrator = get_orchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
+        logger.info(f"✅ DiscoveryOrchestrator ready (Master workflow: {USE_MASTER_WORKFLOW})")
         
         logger.info("⚡ About to start discovery session...")
         session_id = await orchestrator.start_discovery_session(
@@ -71,7 +71,7 @@ async def discover_undiscovered_talent(
     logger.info(f"🎯 Undiscovered talent discovery request: max_results={max_results}")
     
     try:
-        orchestrator = DiscoveryOrchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
+        orchestrator = get_orchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
         result = await orchestrator.discover_undiscovered_talent(
             deps=deps,
             max_results=max_results
@@ -104,7 +104,9 @@ async def get_artists(
         query = query.range(skip, skip + limit - 1)
         result = query.execute()
         
-        return [ArtistProfile(**artist) for artist in result.data]
+        # Rows are validated once against the response_model; building
+        # ArtistProfile here would be dumped and validated a second time
+        return result.data
     except Exception as e:
         logger.error(f"Error fetching artists: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -127,12 +129,13 @@ async def get_artist_details(
         # Fetch lyric analyses
         analyses_result = deps.supabase.table("lyric_analyses").select("*").eq("artist_id", str(artist_id)).execute()
         
-        return EnrichedArtistData(
-            profile=ArtistProfile(**artist_result.data),
-            videos=[VideoMetadata(**v) for v in videos_result.data],
-            lyric_analyses=[LyricAnalysis(**a) for a in analyses_result.data],
-            enrichment_score=artist_result.data.get("enrichment_score", 0)
-        )
+        # Plain dict, validated once by the response_model
+        return {
+            "profile": artist_result.data,
+            "videos": videos_result.data,
+            "lyric_analyses": analyses_result.data,
+            "enrichment_score": artist_result.data.get("enrichment_score", 0)
+        }
     except HTTPException:
         raise
     except Exception as e:
@@ -228,8 +231,7 @@ async def pause_discovery_session(
 ):
     """Pause a running discovery session"""
     try:
-        from app.agents.orchestrator import DiscoveryOrchestrator
-        orchestrator = DiscoveryOrchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
+        orchestrator = get_orchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
         result = await orchestrator.pause_session(str(session_id), deps)
         return result
     except Exception as e:
@@ -243,8 +245,7 @@ async def resume_discovery_session(
 ):
     """Resume a paused discovery session"""
     try:
-        from app.agents.orchestrator import DiscoveryOrchestrator
-        orchestrator = DiscoveryOrchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
+        orchestrator = get_orchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
         result = await orchestrator.resume_session(str(session_id), deps)
         return result
     except Exception as e:
@@ -258,8 +259,7 @@ async def stop_discovery_session(
 ):
     """Stop a running discovery session"""
     try:
-        from app.agents.orchestrator import DiscoveryOrchestrator
-        orchestrator = DiscoveryOrchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
+        orchestrator = get_orchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
         result = await orchestrator.stop_session(str(session_id), deps)
         return result
     except Exception as e:
@@ -272,8 +272,7 @@ async def get_session_status(
 ):
     """Get current status of a discovery session"""
     try:
-        from app.agents.orchestrator import DiscoveryOrchestrator
-        orchestrator = DiscoveryOrchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
+        orchestrator = get_orchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
         result = await orchestrator.get_session_status(str(session_id))
         return result
     except Exception as e:
@@ -341,7 +340,7 @@ async def test_discovery(
         
         # Test 1: Basic orchestrator creation
         try:
-            orchestrator = DiscoveryOrchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
+            orchestrator = get_orchestrator(use_master_workflow=USE_MASTER_WORKFLOW)
             results["orchestrator_creation"] = f"success (Master workflow: {USE_MASTER_WORKFLOW})"
         except Exception as e:
             results["orchestrator_creation"] = f"failed: {e}"
@@ -12,8 +12,9 @@ router = APIRouter()
 
 # Connection manager for WebSocket clients
 class ConnectionManager:
-    def __init__(self):
+    def __init__(self, max_concurrent_sends: int = 32):
         self.active_connections: Dict[str, Set[WebSocket]] = {}
+        self._send_semaphore = asyncio.Semaphore(max_concurrent_sends)
         
     async def connect(self, websocket: WebSocket, client_id: str):
         """Accept and register a new WebSocket connection"""
@@ -41,15 +42,25 @@ class ConnectionManager:
                     # Connection might be closed
                     pass
                     
+    async def _send_bounded(self, connection: WebSocket, message: str):
+        """Send to one connection, capping in-flight sends so slow clients can't pile up"""
+        async with self._send_semaphore:
+            try:
+                await connection.send_text(message)
+            except:
+                # Connection might be closed
+                pass
+    
     async def broadcast(self, message: str):
         """Broadcast a message to all connected clients"""
-        for client_id, connections in self.active_connections.items():
-            for connection in connections:
-                try:
-                    await connection.send_text(message)
-                except:
-                    # Connection might be closed
-                    pass
+        # Snapshot connections and send concurrently rather than one client at a time
+        connections = [
+            connection
+            for client_connections in self.active_connections.values()
+            for connection in client_connections
+        ]
+        if connections:
+            await asyncio.gather(*(self._send_bounded(connection, message) for connection in connections))
 
 # Global connection manager
 manager = ConnectionManager()
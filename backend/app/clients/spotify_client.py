@@ -11,9 +11,13 @@ from typing import Dict, List, Optional, Any
 import aiohttp
 
 from app.core.config import settings
+from app.core.quota_manager import response_cache
 
 logger = logging.getLogger(__name__)
 
+# Artist lookups repeat across enrichment steps and discovery runs
+ENRICHED_ARTIST_CACHE_TTL = 3600
+
 class SpotifyAPIClient:
     """Spotify Web API client with token management"""
     
@@ -22,11 +26,34 @@ class SpotifyAPIClient:
         self.client_secret = settings.SPOTIFY_CLIENT_SECRET
         self.access_token = None
         self.token_expires_at = 0
+        # Serializes token refresh so concurrent artists share one token request
+        self._token_lock = asyncio.Lock()
         self.base_url = "https://api.spotify.com/v1"
         
+        # In-flight enriched lookups by normalized name, so concurrent callers
+        # for the same artist share one set of API requests
+        self._enriched_inflight: Dict[str, asyncio.Task] = {}
+        
+        # Pooled keep-alive session for token and API requests, created on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        
         if not self.client_id or not self.client_secret:
             logger.warning("⚠️ Spotify API credentials not configured")
             
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+    
     async def _get_access_token(self) -> Optional[str]:
         """Get access token using client credentials flow"""
         if not self.client_id or not self.client_secret:
@@ -34,9 +61,17 @@ class SpotifyAPIClient:
             return None
             
         # Check if current token is still valid
-        if self.access_token and time.time() < self.token_expires_at:
+        if self.access_token and time.monotonic() < self.token_expires_at:
             return self.access_token
-            
+        
+        async with self._token_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if self.access_token and time.monotonic() < self.token_expires_at:
+                return self.access_token
+            return await self._refresh_access_token()
+    
+    async def _refresh_access_token(self) -> Optional[str]:
+        """Request a new client credentials token"""
         try:
             # Prepare credentials
             credentials = f"{self.client_id}:{self.client_secret}"
@@ -49,23 +84,23 @@ class SpotifyAPIClient:
             
             data = {"grant_type": "client_credentials"}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://accounts.spotify.com/api/token",
-                    headers=headers,
-                    data=data
-                ) as response:
-                    if response.status == 200:
-                        token_data = await response.json()
-                        self.access_token = token_data["access_token"]
-                        # Set expiration with 5 minute buffer
-                        self.token_expires_at = time.time() + token_data["expires_in"] - 300
-                        logger.info("✅ Spotify access token refreshed")
-                        return self.access_token
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"❌ Spotify token request failed: {response.status} - {error_text}")
-                        return None
+            session = self._get_session()
+            async with session.post(
+                "https://accounts.spotify.com/api/token",
+                headers=headers,
+                data=data
+            ) as response:
+                if response.status == 200:
+                    token_data = await response.json()
+                    self.access_token = token_data["access_token"]
+                    # Set expiration with 5 minute buffer
+                    self.token_expires_at = time.monotonic() + token_data["expires_in"] - 300
+                    logger.info("✅ Spotify access token refreshed")
+                    return self.access_token
+                else:
+                    error_text = await response.text()
+                    logger.error(f"❌ Spotify token request failed: {response.status} - {error_text}")
+                    return None
                         
         except Exception as e:
             logger.error(f"❌ Spotify token request exception: {e}")
@@ -85,20 +120,20 @@ class SpotifyAPIClient:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    elif response.status == 429:
-                        # Rate limited
-                        retry_after = int(response.headers.get('Retry-After', 1))
-                        logger.warning(f"⚠️ Spotify rate limited, waiting {retry_after}s")
-                        await asyncio.sleep(retry_after)
-                        return await self._make_api_request(endpoint, params)
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"❌ Spotify API error: {response.status} - {error_text}")
-                        return None
+            session = self._get_session()
+            async with session.get(url, headers=headers, params=params) as response:
+                if response.status == 200:
+                    return await response.json()
+                elif response.status == 429:
+                    # Rate limited
+                    retry_after = int(response.headers.get('Retry-After', 1))
+                    logger.warning(f"⚠️ Spotify rate limited, waiting {retry_after}s")
+                    await asyncio.sleep(retry_after)
+                    return await self._make_api_request(endpoint, params)
+                else:
+                    error_text = await response.text()
+                    logger.error(f"❌ Spotify API error: {response.status} - {error_text}")
+                    return None
                         
         except Exception as e:
             logger.error(f"❌ Spotify API request exception: {e}")
@@ -175,7 +210,29 @@ class SpotifyAPIClient:
         return []
     
     async def get_enriched_artist_data(self, artist_name: str) -> Optional[Dict[str, Any]]:
-        """Get comprehensive artist data including avatar and genres"""
+        """Get comprehensive artist data including avatar and genres (cached per artist)"""
+        cache_params = {"name": artist_name.strip().lower()}
+        cached = await response_cache.get("spotify", "enriched_artist", cache_params)
+        if cached is not None:
+            return cached
+        
+        key = cache_params["name"]
+        task = self._enriched_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_enriched_artist_data(artist_name))
+            self._enriched_inflight[key] = task
+            task.add_done_callback(lambda _: self._enriched_inflight.pop(key, None))
+        
+        enriched_data = await asyncio.shield(task)
+        if enriched_data:
+            await response_cache.set(
+                "spotify", "enriched_artist", cache_params, enriched_data,
+                ttl=ENRICHED_ARTIST_CACHE_TTL
+            )
+        return enriched_data
+    
+    async def _fetch_enriched_artist_data(self, artist_name: str) -> Optional[Dict[str, Any]]:
+        """Fetch artist details and top tracks from the Spotify API"""
         try:
             # Search for artist
             artist = await self.search_artist(artist_name)
@@ -236,4 +293,10 @@ def get_spotify_client() -> SpotifyAPIClient:
     global _spotify_client
     if _spotify_client is None:
         _spotify_client = SpotifyAPIClient()
-    return _spotify_client
\ No newline at end of file
+    return _spotify_client
+
+
+async def close_spotify_client():
+    """Close the global client's HTTP session on shutdown"""
+    if _spotify_client is not None:
+        await _spotify_client.aclose()
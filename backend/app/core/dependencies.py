@@ -1,11 +1,14 @@
 # backend/app/core/dependencies.py
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
 from supabase import create_client, Client
 import redis.asyncio as redis
 import httpx
 import logging
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from pydantic_ai.providers.deepseek import DeepSeekProvider
+
 logger = logging.getLogger(__name__)
 
 class PipelineDependencies(NamedTuple):
@@ -23,6 +26,7 @@ class PipelineDependencies(NamedTuple):
 _supabase: Client = None
 _redis: redis.Redis = None
 _http_client: httpx.AsyncClient = None
+_deepseek_provider: "DeepSeekProvider" = None
 
 def get_supabase() -> Client:
     """Get Supabase client instance"""
@@ -84,6 +88,19 @@ def get_http_client() -> httpx.AsyncClient:
         logger.info("Initialized HTTP client")
     return _http_client
 
+def get_deepseek_provider() -> "DeepSeekProvider":
+    """Get the DeepSeek provider shared by all agents, backed by the pooled HTTP client"""
+    global _deepseek_provider
+    if _deepseek_provider is None:
+        from pydantic_ai.providers.deepseek import DeepSeekProvider
+
+        _deepseek_provider = DeepSeekProvider(
+            api_key=settings.DEEPSEEK_API_KEY,
+            http_client=get_http_client()
+        )
+        logger.info("Initialized DeepSeek provider")
+    return _deepseek_provider
+
 async def get_pipeline_deps() -> PipelineDependencies:
     """Get pipeline dependencies"""
     return PipelineDependencies(
@@ -104,7 +121,7 @@ async def get_pipeline_dependencies() -> PipelineDependencies:
 
 async def cleanup_dependencies():
     """Cleanup global dependencies on shutdown"""
-    global _redis, _http_client
+    global _redis, _http_client, _deepseek_provider
     
     if _redis:
         await _redis.close()
@@ -112,4 +129,16 @@ async def cleanup_dependencies():
     
     if _http_client:
         await _http_client.aclose()
-        logger.info("Closed HTTP client") 
\ No newline at end of file
+        _http_client = None
+        _deepseek_provider = None
+        logger.info("Closed HTTP client")
+    
+    # Agents built on the provider keep the closed client; drop them so the next
+    # startup builds fresh ones (imported here, as those modules import this one)
+    from app.agents.ai_data_cleaner import reset_ai_cleaner
+    from app.agents.lyrics_agent import reset_lyrics_agent
+    from app.agents.orchestrator import reset_orchestrators
+    
+    reset_ai_cleaner()
+    reset_lyrics_agent()
+    reset_orchestrators()
@@ -2,6 +2,7 @@
 Advanced quota management system with caching and rate limiting
 """
 import asyncio
+import hashlib
 import time
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta, timezone
@@ -308,7 +309,7 @@ class DeduplicationManager:
         
         # Create fingerprint
         fingerprint = "|".join(sorted(identifiers))
-        return fingerprint if fingerprint else f"unknown:{hash(str(artist_data))}"
+        return fingerprint if fingerprint else f"unknown:{hashlib.blake2b(str(artist_data).encode(), digest_size=8).hexdigest()}"
     
     def is_duplicate(self, artist_data: Dict[str, Any]) -> bool:
         """Check if artist is a duplicate"""
@@ -16,7 +16,10 @@ except ImportError:
 from app.core.config import settings
 from app.core.dependencies import get_pipeline_deps, cleanup_dependencies
 from app.api import routes, websocket
-from app.agents.orchestrator import DiscoveryOrchestrator
+from app.agents.orchestrator import get_orchestrator
+from app.agents.crawl4ai_agent import close_crawl4ai_agent, warmup_crawl4ai_agent
+from app.agents.crawl4ai_enrichment_agent import Crawl4AIEnrichmentAgent
+from app.clients.spotify_client import close_spotify_client
 from app.core.logging_config import setup_enhanced_logging
 
 # Enhanced logging configuration
@@ -50,11 +53,14 @@ async def lifespan(app: FastAPI):
     logger.info("   ✅ Agentic workflow debugging enhanced")
     
     # Initialize discovery orchestrator
-    app.state.orchestrator = DiscoveryOrchestrator()
+    app.state.orchestrator = get_orchestrator()
     
     # Start background task processor
     app.state.task_processor = asyncio.create_task(process_background_tasks(app))
     
+    # Start the shared crawler browser in the background so startup isn't blocked
+    app.state.crawler_warmup = asyncio.create_task(warmup_crawl4ai_agent())
+    
     yield
     
     # Shutdown
@@ -68,6 +74,15 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
     
+    # Close the shared crawler browsers
+    if not app.state.crawler_warmup.done():
+        app.state.crawler_warmup.cancel()
+    await close_crawl4ai_agent()
+    await Crawl4AIEnrichmentAgent.aclose()
+    
+    # Close pooled HTTP sessions
+    await close_spotify_client()
+    
     # Cleanup dependencies
     await cleanup_dependencies()
 
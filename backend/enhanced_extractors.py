@@ -9,6 +9,14 @@ import logging
 from typing import Dict, Any, List, Optional, Tuple
 from bs4 import BeautifulSoup
 
+# Faster decoding of embedded page JSON (ytInitialData runs to megabytes)
+# when orjson is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 class EnhancedYouTubeExtractor:
@@ -92,8 +100,9 @@ class EnhancedYouTubeExtractor:
             match = re.search(pattern, html, re.DOTALL)
             if match:
                 try:
-                    data = json.loads(match.group(1))
-                    logger.info(f"✅ Successfully parsed ytInitialData ({len(str(data)):,} chars)")
+                    payload = match.group(1)
+                    data = _json_loads(payload)
+                    logger.info(f"✅ Successfully parsed ytInitialData ({len(payload):,} chars)")
                     return data
                 except json.JSONDecodeError as e:
                     logger.warning(f"Failed to parse ytInitialData: {e}")
@@ -274,22 +283,26 @@ class EnhancedYouTubeExtractor:
         
         try:
             soup = BeautifulSoup(html, 'html.parser')
+            title_tag = soup.find('meta', property='og:title')
+            desc_tag = soup.find('meta', property='og:description')
+            title = title_tag.get('content', '') if title_tag else None
+            description = desc_tag.get('content', '') if desc_tag else None
+            scripts = [script.string for script in soup.find_all('script', type='application/ld+json')]
             
             # Title from meta tags
-            title_tag = soup.find('meta', property='og:title')
-            if title_tag:
-                data["title"] = title_tag.get('content', '').replace(' - YouTube', '')
+            if title is not None:
+                data["title"] = title.replace(' - YouTube', '')
             
             # Description from meta tags
-            desc_tag = soup.find('meta', property='og:description')
-            if desc_tag:
-                data["description"] = desc_tag.get('content', '')
+            if description is not None:
+                data["description"] = description
             
             # Try to extract from JSON-LD structured data
-            scripts = soup.find_all('script', type='application/ld+json')
             for script in scripts:
+                if not script:
+                    continue
                 try:
-                    json_data = json.loads(script.string)
+                    json_data = _json_loads(script)
                     if isinstance(json_data, list):
                         json_data = json_data[0]
                     
@@ -316,16 +329,17 @@ class EnhancedYouTubeExtractor:
         videos = []
         
         try:
+            # Look for video links as (href, title) pairs
             soup = BeautifulSoup(html, 'html.parser')
+            video_links = [
+                (link.get('href'), link.get('title') or link.get_text(strip=True))
+                for link in soup.find_all('a', href=re.compile(r'/watch\?v='))[:max_results]
+            ]
             
-            # Look for video links
-            video_links = soup.find_all('a', href=re.compile(r'/watch\?v='))
-            
-            for link in video_links[:max_results]:
+            for href, title in video_links:
                 video_data = {}
                 
                 # URL and video ID
-                href = link.get('href')
                 if href:
                     if href.startswith('/'):
                         video_data["url"] = f"https://www.youtube.com{href}"
@@ -335,7 +349,6 @@ class EnhancedYouTubeExtractor:
                     video_data["video_id"] = EnhancedYouTubeExtractor._extract_video_id(video_data["url"])
                 
                 # Title
-                title = link.get('title') or link.get_text(strip=True)
                 if title:
                     video_data["title"] = title
                 